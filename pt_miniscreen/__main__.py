@@ -4,6 +4,7 @@ import click
 import click_logging
 
 from .app import App
+from .timeline import timeline
 
 logger = logging.getLogger()
 click_logging.basic_config(logger)
@@ -23,6 +24,7 @@ logging.getLogger("pitop.common").setLevel(logging.INFO)
 @click_logging.simple_verbosity_option(logger)
 @click.version_option()
 def main() -> None:
+    timeline.mark("modules imported")
     app = App()
     app.start()
     app.wait_for_stop()
@@ -6,8 +6,12 @@ from pt_miniscreen.utils import ButtonEvents
 
 from pitop.system.pitop import Pitop
 
+from .bootsplash import get_first_frame, should_show_bootsplash
 from .core import App as BaseApp
-from .root import RootComponent
+from .core.backends import create_backend
+from .core.profiler import setup_profiler
+from .core.utils import preload_fonts
+from .timeline import timeline
 
 logger = logging.getLogger(__name__)
 
@@ -15,29 +19,69 @@ logger = logging.getLogger(__name__)
 class App(BaseApp):
     DIMMING_TIMEOUT = 20
     SCREENSAVER_TIMEOUT = 20
+    MAX_FPS = 30
 
-    def __init__(self):
+    def __init__(self, display_backend=None):
         logger.debug("Setting ENV VAR to use miniscreen as system...")
         environ["PT_MINISCREEN_SYSTEM"] = "1"
 
+        logger.debug("Setting up render profiler...")
+        setup_profiler()
+
         logger.debug("Initializing miniscreen...")
         self.miniscreen = Pitop().miniscreen
+        timeline.mark("miniscreen initialised")
 
-        logger.debug("Initialising app...")
-
-        # display should be `miniscreen.display_image` but that method attempts to
-        # import opencv when it's called. We can catch the raised error but cannot
-        # prevent the module search. This produces overhead when display is called
+        # the device backend uses `miniscreen.device.display` rather than
+        # `miniscreen.display_image` since that method attempts to import opencv
+        # when it's called. We can catch the raised error but cannot prevent the
+        # module search. This produces overhead when display is called
         # frequently, which is expected. It's worth noting the import is not cached
         # since the module was not found so the search happens every import attempt
+        if display_backend is None:
+            display_backend = create_backend(
+                environ.get("PT_MINISCREEN_DISPLAY", "device"), self.miniscreen.device
+            )
+
+        self.display_backend = display_backend
+        self.interactive = False
+
+        # display the first bootsplash frame from the bootsplash cache as soon as
+        # possible, the bootsplash keeps animating once the root is created
+        first_frame = None
+        if should_show_bootsplash() and not self.user_has_control:
+            logger.debug("Displaying bootsplash...")
+            first_frame = get_first_frame(self.miniscreen.size)
+            display_backend(first_frame)
+
+            # the bootsplash frame is the first frame pushed to the display
+            timeline.mark("first frame")
+
+        logger.debug("Preloading fonts...")
+        preload_fonts(on_finish=lambda: timeline.mark("fonts loaded"))
+
+        logger.debug("Initialising app...")
+
+        # importing the root imports the components and pages it contains
+        from .root import RootComponent
+
         super().__init__(
-            display=self.miniscreen.device.display,
+            display=display_backend,
             size=self.miniscreen.size,
             Root=RootComponent,
+            partial_display=True,
+            max_fps=self.MAX_FPS,
         )
+        timeline.mark("app created")
+
+        # the backend keeps the bootsplash frame so the first frame rendered by
+        # the app only pushes what changed
+        if first_frame is not None:
+            self.set_displayed_frame(first_frame)
 
     def start(self):
         super().start()
+        timeline.mark("app started")
 
         def set_is_user_controlled(user_has_control) -> None:
             if user_has_control:
@@ -123,14 +167,30 @@ class App(BaseApp):
 
         self.brighten()
         self.restart_dimming_timer()
-        self.display()
 
-    def display(self):
+        # miniscreen was reset so the whole frame needs to be displayed again
+        self.display(force=True)
+
+    def _update_display(self, force=False):
         if self.user_has_control:
             return
 
         try:
-            super().display()
+            pushed_frames = self.pushed_frames
+            super()._update_display(force)
+
+            # log how long startup took once the bootsplash has finished, only
+            # counting frames that were pushed to the display. The root is None
+            # when the app has stopped.
+            root = self.root
+            if self.interactive or root is None or self.pushed_frames == pushed_frames:
+                return
+
+            timeline.mark("first frame")
+            if not root.state["show_bootsplash"]:
+                self.interactive = True
+                timeline.mark("first interactive frame")
+                timeline.log()
 
         # When performing actions sometimes the spi addresses can change; this
         # causes a BrokenPipeError because the miniscreen instance tries to send
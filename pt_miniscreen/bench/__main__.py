@@ -0,0 +1,129 @@
+import logging
+from pathlib import Path
+
+import click
+
+from .utils import print_results
+
+logging.getLogger("PIL").setLevel(logging.INFO)
+
+
+@click.group()
+def main() -> None:
+    """Miniscreen rendering benchmarks. Run on the target device for
+    representative numbers."""
+
+
+@main.command()
+@click.option("--frames", default=200, help="Number of frames to render")
+@click.option("--json", "as_json", is_flag=True, help="Output results as JSON")
+def compare(frames, as_json):
+    """Per-frame CPU time of the RootComponent tree comparing legacy list based
+    image comparison with bytes based comparison."""
+    from pt_miniscreen.root import RootComponent
+
+    from .compare import run
+
+    print_results(run(RootComponent, frames=frames), as_json)
+
+
+@main.command()
+@click.option("--frames", default=100, help="Number of frames to render")
+@click.option("--json", "as_json", is_flag=True, help="Output results as JSON")
+def allocations(frames, as_json):
+    """Images allocated by render caches per frame of the RootComponent tree
+    with immutable frames and with copied frames."""
+    from pt_miniscreen.root import RootComponent
+
+    from .allocations import run
+
+    print_results(run(RootComponent, frames=frames), as_json)
+
+
+@main.command()
+@click.option("--runs", default=10, help="Number of times to open each component")
+@click.option("--json", "as_json", is_flag=True, help="Output results as JSON")
+def fonts(runs, as_json):
+    """Wall clock time to start the RootComponent and open a page with fonts
+    loaded on demand and with fonts preloaded."""
+    from pt_miniscreen.pages.system.cpu import CPUPage
+    from pt_miniscreen.root import RootComponent
+
+    from .fonts import run
+
+    print_results(run(RootComponent, CPUPage, runs=runs), as_json)
+
+
+@main.command()
+@click.option("--json", "as_json", is_flag=True, help="Output results as JSON")
+def animations(as_json):
+    """Frames, duration and memory used by the decoded frames of every animated
+    image shipped with the app."""
+    from pt_miniscreen.utils import get_project_root
+
+    from .animations import run
+
+    paths = sorted((get_project_root() / "images").glob("**/*.gif"))
+    print_results(run(paths), as_json)
+
+
+@main.command()
+@click.option("--steps", default=30, help="Number of steps in each transition")
+@click.option("--json", "as_json", is_flag=True, help="Output results as JSON")
+def transitions(steps, as_json):
+    """Per-step CPU time of pushing a page onto the root page list and popping
+    it with live transitions and with snapshots of the stacked components."""
+    from pt_miniscreen.pages.system.cpu import CPUPage
+    from pt_miniscreen.root import RootPageList
+
+    from .transitions import run
+
+    print_results(run(RootPageList, CPUPage, steps=steps), as_json)
+
+
+@main.command()
+@click.option(
+    "--scenario",
+    "scenarios",
+    multiple=True,
+    type=click.Choice(["menus", "projects", "logs", "screensaver"]),
+    help="Scenario to run, can be passed more than once. Runs all by default",
+)
+@click.option("--step-time", default=0.5, help="Seconds to wait after each step")
+@click.option("--json", "as_json", is_flag=True, help="Output results as JSON")
+def app(scenarios, step_time, as_json):
+    """Frames rendered and pushed, frame times, thread count and peak RSS of
+    the whole app running against a fake miniscreen while replaying scripted
+    button presses."""
+    from .app import run
+
+    print_results(run(scenarios or None, step_time=step_time), as_json)
+
+
+@main.command()
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--gif", type=click.Path(dir_okay=False), help="Export frames to a GIF")
+@click.option("--png", type=click.Path(file_okay=False), help="Export frames to PNGs")
+@click.option("--step", is_flag=True, help="Step through frames in the terminal")
+@click.option("--jank-ms", default=50, help="Intervals longer than this are long")
+@click.option("--json", "as_json", is_flag=True, help="Output results as JSON")
+def replay(path, gif, png, step, jank_ms, as_json):
+    """Frame intervals of a recording made with SAVE_CACHE=1, optionally
+    exporting or stepping through its frames."""
+    from pt_miniscreen.core.recorder import Recording
+
+    from .replay import export_gif, export_pngs, step_through, summarise
+
+    recording = Recording(path)
+    if step:
+        step_through(recording)
+    if gif:
+        export_gif(recording, gif)
+    if png:
+        export_pngs(recording, png)
+
+    print_results({Path(path).name: summarise(recording, jank_ms)}, as_json)
+
+
+if __name__ == "__main__":
+    main(prog_name="pt-miniscreen-bench")  # pragma: no cover
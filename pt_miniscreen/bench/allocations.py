@@ -0,0 +1,51 @@
+from unittest.mock import patch
+
+from PIL import Image
+
+from pt_miniscreen.core.component import RenderCache
+from pt_miniscreen.core.utils import checkered
+
+from .utils import blank_frame, create_root
+
+
+def count_allocations(render_frame, frames):
+    RenderCache.allocations = 0
+    for _ in range(frames):
+        render_frame()
+
+    return round(RenderCache.allocations / frames, 2)
+
+
+def run(Root, frames=100):
+    root = create_root(Root)
+    if "show_bootsplash" in root.state:
+        root.state.update({"show_bootsplash": False})
+    root.render(blank_frame())
+
+    # alternating the root input changes the input of every child so the whole
+    # tree renders, reusing the same input means every child is a cache hit
+    inputs = [blank_frame(), checkered(blank_frame())]
+    frame_index = [0]
+
+    def render_changed_frame():
+        frame_index[0] += 1
+        root._internal_render(inputs[frame_index[0] % 2].copy())
+
+    def render_unchanged_frame():
+        root._internal_render(Image.new("1", root.size))
+
+    results = {}
+    for immutable_frames in (True, False):
+        with patch.object(RenderCache, "immutable_frames", immutable_frames):
+            name = "immutable" if immutable_frames else "copy"
+            results[name] = {
+                "changed_frame_allocations": count_allocations(
+                    render_changed_frame, frames
+                ),
+                "unchanged_frame_allocations": count_allocations(
+                    render_unchanged_frame, frames
+                ),
+            }
+
+    root._cleanup()
+    return results
@@ -0,0 +1,14 @@
+from pt_miniscreen.core.components.image import ImageFile
+
+
+def run(paths):
+    results = {}
+    for path in paths:
+        image_file = ImageFile(str(path))
+        results[path.name] = {
+            "frames": image_file.n_frames,
+            "duration_s": round(image_file.duration, 3),
+            "memory_bytes": image_file.memory,
+        }
+
+    return results
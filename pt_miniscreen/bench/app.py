@@ -0,0 +1,196 @@
+import resource
+import threading
+from functools import partial
+from os import unlink
+from statistics import mean
+from tempfile import NamedTemporaryFile
+from time import perf_counter, sleep
+from unittest.mock import patch
+
+from .utils import percentile
+
+
+class Button:
+    when_pressed = None
+    when_released = None
+
+    # handlers are called on the benchmark thread so steps run in order
+    def press(self):
+        if callable(self.when_pressed):
+            self.when_pressed()
+
+    def release(self):
+        if callable(self.when_released):
+            self.when_released()
+
+
+class Miniscreen:
+    size = (128, 64)
+    is_active = False
+
+    def __init__(self):
+        self.select_button = Button()
+        self.cancel_button = Button()
+        self.up_button = Button()
+        self.down_button = Button()
+
+    def contrast(self, value):
+        pass
+
+    def reset(self):
+        pass
+
+
+class Pitop:
+    def __init__(self):
+        self.miniscreen = Miniscreen()
+
+
+# Steps are a button and the action to perform on it, a function that is called
+# with the app, or None to wait for another step without doing anything. Every
+# step is followed by a wait of step_time so transitions can finish.
+def walk_menus():
+    steps = []
+
+    # enter each menu after the overview, walk its pages and go back
+    for _ in range(4):
+        steps.append(("down", "release"))
+        steps.append(("select", "release"))
+        steps += [("down", "release")] * 6
+        steps.append(("cancel", "release"))
+
+    return steps
+
+
+def enter_projects():
+    return [
+        *[("down", "release")] * 3,
+        ("select", "release"),
+        ("select", "release"),
+        ("down", "release"),
+        ("up", "release"),
+        ("cancel", "release"),
+        ("cancel", "release"),
+    ]
+
+
+def scroll_logs(log_path):
+    from pt_miniscreen.components.scrollable_text_file import ScrollableTextFile
+
+    def open_logs(app):
+        app.root.stack.push(partial(ScrollableTextFile, path=log_path))
+
+    return [
+        open_logs,
+        ("down", "press"),
+        *[None] * 6,
+        ("down", "release"),
+        ("up", "press"),
+        *[None] * 3,
+        ("up", "release"),
+        ("cancel", "release"),
+    ]
+
+
+def run_screensaver():
+    return [
+        lambda app: app.root.start_screensaver(),
+        *[None] * 6,
+        ("select", "release"),
+    ]
+
+
+def create_log_file(lines=500):
+    with NamedTemporaryFile("w", suffix=".log", delete=False) as file:
+        for line in range(lines):
+            file.write(f"{line:04} benchmark log line with enough text to wrap\n")
+
+    return file.name
+
+
+def get_scenarios(log_path):
+    return {
+        "menus": walk_menus(),
+        "projects": enter_projects(),
+        "logs": scroll_logs(log_path),
+        "screensaver": run_screensaver(),
+    }
+
+
+def get_peak_rss_kb():
+    # peak resident set size of the process so far, reported in KB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def run_step(app, step):
+    if step is None:
+        return
+
+    if callable(step):
+        step(app)
+        return
+
+    button, action = step
+    getattr(getattr(app.miniscreen, f"{button}_button"), action)()
+
+
+def run_scenario(steps, step_time):
+    from pt_miniscreen.app import App
+    from pt_miniscreen.core.backends import MemoryBackend
+
+    display_backend = MemoryBackend()
+    with patch("pt_miniscreen.app.Pitop", Pitop):
+        app = App(display_backend=display_backend)
+
+    app.start()
+    if app.root.state.get("show_bootsplash"):
+        app.root.state.update({"show_bootsplash": False})
+    sleep(step_time)
+
+    frame_times = []
+    max_threads = threading.active_count()
+    update_display = app._update_display
+
+    # time every frame rendered by the app, including frames that were dropped
+    # because they were unchanged
+    def timed_update_display(force=False):
+        nonlocal max_threads
+        start_time = perf_counter()
+        update_display(force)
+        frame_times.append(perf_counter() - start_time)
+        max_threads = max(max_threads, threading.active_count())
+
+    app._update_display = timed_update_display
+    pushed_frames = display_backend.pushes
+    start_time = perf_counter()
+
+    for step in steps:
+        run_step(app, step)
+        sleep(step_time)
+        max_threads = max(max_threads, threading.active_count())
+
+    duration = perf_counter() - start_time
+    pushed_frames = display_backend.pushes - pushed_frames
+    app.stop()
+
+    return {
+        "frames_rendered": len(frame_times),
+        "frames_pushed": pushed_frames,
+        "mean_ms": round(mean(frame_times) * 1000, 4) if frame_times else 0,
+        "p99_ms": round(percentile(frame_times, 99) * 1000, 4) if frame_times else 0,
+        "display_mean_ms": display_backend.stats["mean_ms"],
+        "max_threads": max_threads,
+        "peak_rss_kb": get_peak_rss_kb(),
+        "duration_s": round(duration, 4),
+    }
+
+
+def run(scenarios=None, step_time=0.5):
+    log_path = create_log_file()
+    try:
+        all_scenarios = get_scenarios(log_path)
+        names = all_scenarios.keys() if scenarios is None else scenarios
+
+        return {name: run_scenario(all_scenarios[name], step_time) for name in names}
+    finally:
+        unlink(log_path)
@@ -0,0 +1,55 @@
+from unittest.mock import patch
+
+from PIL import Image
+
+from .utils import blank_frame, create_root, summarise, time_frames
+
+
+def legacy_is_same_image(image_one, image_two) -> bool:
+    try:
+        return list(image_one.getdata()) == list(image_two.getdata())
+    except Exception:
+        return False
+
+
+# the cache only stores the key of its input, which is turned back into an image
+# to be compared the way it used to be
+def legacy_is_same_input(render_cache, image):
+    if render_cache._input_key is None:
+        return False
+
+    return legacy_is_same_image(image, Image.frombytes(*render_cache._input_key))
+
+
+def legacy_is_same_output(render_cache, image):
+    return legacy_is_same_image(image, render_cache._output)
+
+
+def rerender_tree(root):
+    # rendering the root bypasses its own cache but every child is called with
+    # an unchanged input, which is the path taken by every rerender in the app
+    return lambda: root._internal_render(blank_frame(root.size))
+
+
+def run(Root, frames=200):
+    root = create_root(Root)
+    if "show_bootsplash" in root.state:
+        root.state.update({"show_bootsplash": False})
+    root.render(blank_frame())
+
+    # cached layers are pasted without comparing their input, so layer reuse is
+    # turned off to compare the input of every child
+    with patch("pt_miniscreen.core.utils.get_layer_cache", lambda: None):
+        results = {"bytes": summarise(time_frames(rerender_tree(root), frames))}
+
+        with patch(
+            "pt_miniscreen.core.component.RenderCache.is_same_input",
+            legacy_is_same_input,
+        ), patch(
+            "pt_miniscreen.core.component.RenderCache.is_same_output",
+            legacy_is_same_output,
+        ):
+            results["legacy"] = summarise(time_frames(rerender_tree(root), frames))
+
+    root._cleanup()
+    return results
@@ -0,0 +1,58 @@
+from time import perf_counter
+
+from pt_miniscreen.core.components.text import (
+    text_length_cache,
+    text_raster_cache,
+    text_size_cache,
+    wrapped_text_cache,
+)
+from pt_miniscreen.core.utils import load_font, preload_fonts
+from pt_miniscreen.utils import text_image_cache
+
+from .utils import blank_frame, create_root, summarise
+
+# text is rasterized and measured using the loaded fonts, so these caches are
+# cleared with the fonts to time opening a component that has no cached text
+TEXT_CACHES = (
+    text_raster_cache,
+    text_size_cache,
+    text_length_cache,
+    wrapped_text_cache,
+    text_image_cache,
+)
+
+
+def clear_fonts():
+    load_font.cache_clear()
+    for cache in TEXT_CACHES:
+        cache.clear()
+
+
+def time_open(Component, runs, uncached):
+    open_times = []
+    for _ in range(runs):
+        if uncached:
+            clear_fonts()
+
+        # fonts are read from disk so wall clock time is measured
+        start_time = perf_counter()
+        component = create_root(Component)
+        component.render(blank_frame())
+        open_times.append(perf_counter() - start_time)
+
+        component._cleanup()
+
+    return summarise(open_times)
+
+
+def run(Root, Page, runs=10):
+    results = {}
+    for name, Component in (("startup", Root), ("page_open", Page)):
+        results[f"{name}_uncached"] = time_open(Component, runs, uncached=True)
+
+        # wait for preloading to finish as the app would after startup
+        clear_fonts()
+        preload_fonts().join()
+        results[f"{name}_cached"] = time_open(Component, runs, uncached=False)
+
+    return results
@@ -0,0 +1,80 @@
+from pathlib import Path
+from statistics import mean, median
+
+from .utils import percentile
+
+# characters used to show two rows of pixels per line of text
+HALF_BLOCKS = {(0, 0): " ", (1, 0): "▀", (0, 1): "▄", (1, 1): "█"}
+
+
+def summarise(recording, jank_ms=50):
+    intervals = recording.intervals
+    if not intervals:
+        return {"frames": len(recording), "duration_s": 0}
+
+    return {
+        "frames": len(recording),
+        "duration_s": round(recording.timestamps[-1] - recording.timestamps[0], 4),
+        "mean_interval_ms": round(mean(intervals) * 1000, 4),
+        "median_interval_ms": round(median(intervals) * 1000, 4),
+        "p99_interval_ms": round(percentile(intervals, 99) * 1000, 4),
+        "max_interval_ms": round(max(intervals) * 1000, 4),
+        "long_intervals": sum(1 for interval in intervals if interval * 1000 > jank_ms),
+    }
+
+
+def export_pngs(recording, directory):
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for index, (_, image) in enumerate(recording):
+        image.save(directory / f"{str(index).zfill(4)}.png")
+
+
+def export_gif(recording, path):
+    frames = [image.convert("L") for _, image in recording]
+    if not frames:
+        return
+
+    # gif durations are in milliseconds, the last frame is shown for a second
+    durations = [max(round(interval * 1000), 20) for interval in recording.intervals]
+    frames[0].save(
+        path,
+        save_all=True,
+        append_images=frames[1:],
+        duration=durations + [1000],
+        loop=0,
+    )
+
+
+def format_frame(image):
+    width, height = image.size
+    pixels = image.load()
+    lines = []
+    for y in range(0, height, 2):
+        lines.append(
+            "".join(
+                HALF_BLOCKS[
+                    (
+                        int(pixels[x, y] != 0),
+                        int(y + 1 < height and pixels[x, y + 1] != 0),
+                    )
+                ]
+                for x in range(width)
+            )
+        )
+
+    return "\n".join(lines)
+
+
+def step_through(recording, wait=input):
+    previous_timestamp = None
+    for index, (timestamp, image) in enumerate(recording):
+        interval = 0 if previous_timestamp is None else timestamp - previous_timestamp
+        previous_timestamp = timestamp
+
+        print(format_frame(image))
+        print(f"frame {index + 1}/{len(recording)} at {timestamp:.3f}s", end="")
+        print(f", {interval * 1000:.1f}ms after previous frame")
+
+        if wait("Press enter for the next frame or q to quit ") == "q":
+            return
@@ -0,0 +1,58 @@
+from unittest.mock import patch
+
+from pt_miniscreen.core.components import Stack
+
+from .utils import blank_frame, create_root, summarise, time_frames
+
+# stack attributes set for each way of rendering transitions
+MODES = {
+    "live": {"live_transitions": True},
+    "snapshot": {},
+    "snapshot_foreground": {"snapshot_foreground": True},
+}
+
+
+def time_transition(stack, start_transition, positions):
+    # the stack's animation is replaced by stepping x_position by hand so every
+    # mode renders the same steps
+    transitions = []
+    with patch.object(stack, "create_transition", transitions.append):
+        start_transition()
+
+    remaining_positions = iter(positions)
+
+    def render_step():
+        stack.state.update({"x_position": next(remaining_positions)})
+        stack.render(blank_frame(stack.size))
+
+    frame_times = time_frames(render_step, len(positions))
+
+    # finish the transition, which has no duration, in a single step
+    for _ in transitions[0]:
+        pass
+
+    return frame_times
+
+
+def run(Background, Foreground, steps=30):
+    results = {}
+    for name, attributes in MODES.items():
+        stack = create_root(Stack, initial_stack=[Background])
+        stack.transition_duration = 0
+        for attribute, value in attributes.items():
+            setattr(stack, attribute, value)
+
+        stack.render(blank_frame())
+        width = stack.width
+        positions = [round(width * step / steps) for step in range(steps)]
+
+        results[f"push_{name}"] = summarise(
+            time_transition(
+                stack, lambda: stack.push(Foreground), list(reversed(positions))
+            )
+        )
+        results[f"pop_{name}"] = summarise(time_transition(stack, stack.pop, positions))
+
+        stack._cleanup()
+
+    return results
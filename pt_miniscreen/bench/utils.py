@@ -0,0 +1,60 @@
+import json
+from statistics import mean
+from time import process_time
+
+from PIL import Image
+
+
+class Parent:
+    def on_rerender(self):
+        pass
+
+
+def create_root(Root, **kwargs):
+    parent = Parent()
+    root = Root(on_rerender=parent.on_rerender, **kwargs)
+    root._set_active(True)
+
+    # components only keep a weak reference to on_rerender so the parent must
+    # be kept alive for as long as the root
+    root._bench_parent = parent
+    return root
+
+
+def time_frames(render_frame, frames):
+    frame_times = []
+    for _ in range(frames):
+        start_time = process_time()
+        render_frame()
+        frame_times.append(process_time() - start_time)
+
+    return frame_times
+
+
+def percentile(values, percent):
+    ordered = sorted(values)
+    index = min(int(len(ordered) * percent / 100), len(ordered) - 1)
+    return ordered[index]
+
+
+def summarise(frame_times):
+    return {
+        "frames": len(frame_times),
+        "mean_ms": round(mean(frame_times) * 1000, 4),
+        "p99_ms": round(percentile(frame_times, 99) * 1000, 4),
+        "total_s": round(sum(frame_times), 4),
+    }
+
+
+def blank_frame(size=(128, 64)):
+    return Image.new("1", size)
+
+
+def print_results(results, as_json=False):
+    if as_json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for name, result in results.items():
+        stats = ", ".join(f"{key}={value}" for key, value in result.items())
+        print(f"{name}: {stats}")
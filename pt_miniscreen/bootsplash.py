@@ -0,0 +1,132 @@
+import logging
+import struct
+from configparser import ConfigParser
+from os import path, replace, stat
+from pathlib import Path
+
+from PIL import Image
+
+from pt_miniscreen.core.components.image import ImageFile, image_file_cache
+from pt_miniscreen.utils import get_image_file_path
+
+logger = logging.getLogger(__name__)
+
+BREADCRUMB_PATH = "/tmp/.com.pi-top.pt_miniscreen.boot-played"
+CACHE_PATH = "/var/cache/pt-miniscreen/bootsplash.cache"
+
+MAGIC = b"PTMSBOOT"
+
+# magic, frame width, frame height, number of frames, modification time and size
+# of the source image and the length of its path, which follows the header
+HEADER = struct.Struct("<8sHHHqqH")
+
+
+def get_bootsplash_image_path():
+    try:
+        config = ConfigParser()
+        config.read("/etc/pt-miniscreen/settings.ini")
+        return config.get("Bootsplash", "Path")
+    except Exception:
+        pass
+
+    return get_image_file_path("startup/pi-top_startup.gif")
+
+
+def should_show_bootsplash():
+    return not path.exists(BREADCRUMB_PATH)
+
+
+# creates the breadcrumb so the bootsplash is not shown the next time the app
+# starts
+def write_breadcrumb():
+    Path(BREADCRUMB_PATH).touch()
+
+
+def _get_source_key(image_path):
+    source = stat(image_path)
+    return (str(image_path), source.st_mtime_ns, source.st_size)
+
+
+def write_cache(image_file, cache_path=None):
+    image_path, mtime, size = _get_source_key(image_file.path)
+    encoded_path = image_path.encode()
+
+    cache_path = Path(CACHE_PATH if cache_path is None else cache_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # write to a temporary file first so the cache is never partially written
+    temporary_path = cache_path.with_suffix(".tmp")
+    with open(temporary_path, "wb") as file:
+        size_and_frames = (*image_file.size, image_file.n_frames)
+        file.write(HEADER.pack(MAGIC, *size_and_frames, mtime, size, len(encoded_path)))
+        file.write(encoded_path)
+        file.write(struct.pack(f"<{image_file.n_frames}d", *image_file.durations))
+        for frame in image_file.frames:
+            file.write(frame)
+
+    replace(temporary_path, cache_path)
+
+
+# Returns the frames stored in the cache as an ImageFile, or None when the cache
+# does not exist or was created from a different version of the image
+def read_cache(image_path, cache_path=None):
+    try:
+        with open(CACHE_PATH if cache_path is None else cache_path, "rb") as file:
+            data = file.read()
+
+        magic, width, height, n_frames, mtime, size, path_length = HEADER.unpack_from(
+            data
+        )
+        offset = HEADER.size
+        cached_path = data[offset : offset + path_length].decode()
+        offset += path_length
+
+        if magic != MAGIC or (cached_path, mtime, size) != _get_source_key(image_path):
+            return None
+
+        durations = list(struct.unpack_from(f"<{n_frames}d", data, offset))
+        offset += n_frames * 8
+
+        frame_length = (width + 7) // 8 * height
+        frames = [
+            data[offset + index * frame_length : offset + (index + 1) * frame_length]
+            for index in range(n_frames)
+        ]
+        if len(frames[-1]) != frame_length:
+            return None
+
+        return ImageFile.from_frames(image_path, (width, height), frames, durations)
+
+    except (OSError, ValueError, IndexError, struct.error):
+        return None
+
+
+# Loads the bootsplash frames from the cache, decoding the image and caching its
+# frames when the cache is out of date. The frames are shared with Image
+# components so the bootsplash is never decoded again while the app starts.
+def load_bootsplash(image_path=None, cache_path=None):
+    image_path = get_bootsplash_image_path() if image_path is None else image_path
+
+    # frames that were already loaded by this process are reused
+    image_file = image_file_cache.get(image_path)
+    if image_file is not None:
+        return image_file
+
+    image_file = read_cache(image_path, cache_path)
+    if image_file is None:
+        image_file = ImageFile(image_path)
+        try:
+            write_cache(image_file, cache_path)
+        except OSError as e:
+            logger.debug(f"Unable to cache bootsplash frames: {e}")
+
+    image_file_cache.set(image_path, image_file)
+    return image_file
+
+
+# Returns the first bootsplash frame as it is displayed by the app, before any
+# components have been created
+def get_first_frame(size, image_path=None, cache_path=None):
+    image = Image.new("1", size)
+    image.paste(load_bootsplash(image_path, cache_path).get_frame(0), (0, 0))
+    return image
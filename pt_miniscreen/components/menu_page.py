@@ -19,11 +19,16 @@ class MenuPage(Component, Enterable):
         font_size=14,
         image_size=(25, 25),
         virtual_page_list=True,
+        lazy_page_list_window=None,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
         self.PageList = partial(
-            EnterablePageList, Pages=Pages, virtual=virtual_page_list
+            EnterablePageList,
+            Pages=Pages,
+            virtual=virtual_page_list,
+            lazy_window=lazy_page_list_window,
+            prefetch=virtual_page_list,
         )
         self.cover_image_size = image_size
         self.cover_image = self.create_child(Image, image_path=image_path)
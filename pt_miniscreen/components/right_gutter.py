@@ -41,17 +41,18 @@ class RightGutter(Component):
         left_border_layer = layer(rectangle, size=(border_width, image.height))
         layers = [left_border_layer]
 
-        if self.upper_icon.image:
+        upper_icon_size = self.upper_icon.image_size
+        if upper_icon_size:
             layers.append(
                 layer(
                     self.upper_icon.render,
-                    size=self.upper_icon.image.size,
+                    size=upper_icon_size,
                     pos=self.state["upper_icon_padding"],
                 )
             )
 
-        if self.lower_icon.image:
-            icon_size = self.lower_icon.image.size
+        icon_size = self.lower_icon.image_size
+        if icon_size:
             icon_padding = self.state["lower_icon_padding"]
             icon_pos = (icon_padding[0], image.height - icon_size[1] - icon_padding[1])
 
@@ -0,0 +1,67 @@
+from math import floor
+from time import monotonic
+
+# seconds between frames of an animation. A frame that takes longer than this to
+# render is followed by the next frame straight away, so the number of frames
+# shown adapts to how fast frames render while animations still finish on time.
+FRAME_TIME = 1 / 30
+
+
+def linear(progress):
+    return progress
+
+
+# returns an easing that jumps to the next of count equal steps at the end of
+# each step
+def steps(count):
+    def easing(progress):
+        return floor(progress * count) / count
+
+    return easing
+
+
+# Moves a value from start to end over duration seconds. The value is sampled
+# from a monotonic clock, so it only depends on when it is sampled and not on how
+# often it is sampled.
+class Animation:
+    def __init__(self, start, end, duration, easing=linear, start_time=None):
+        self.start = start
+        self.end = end
+        self.duration = duration
+        self.easing = easing
+        self.start_time = monotonic() if start_time is None else start_time
+
+    def get_progress(self, time=None):
+        if self.duration <= 0:
+            return 1
+
+        time = monotonic() if time is None else time
+        return min(max((time - self.start_time) / self.duration, 0), 1)
+
+    def sample(self, time=None):
+        progress = self.get_progress(time)
+        if progress == 1:
+            return self.end
+
+        return self.start + (self.end - self.start) * self.easing(progress)
+
+    def is_finished(self, time=None):
+        return self.get_progress(time) == 1
+
+
+# Generator that calls on_frame with the value of the animation once per frame
+# until the animation finishes. It is passed to Component.create_transition, or to
+# create_task when the animation should pause with its component. The scheduler
+# measures frame_time from when a frame started, so the next frame is not delayed
+# by the time taken to render the last one.
+def animate(animation, on_frame, frame_time=None):
+    frame_time = FRAME_TIME if frame_time is None else frame_time
+
+    while True:
+        time = monotonic()
+        on_frame(animation.sample(time))
+
+        if animation.is_finished(time):
+            return
+
+        yield frame_time
@@ -2,25 +2,59 @@ import datetime
 import logging
 from os import environ
 from pathlib import Path
-from threading import Event
+from threading import Event, Lock, Thread
+from time import monotonic, sleep
 
 from PIL import Image
 
+from .backends import DisplayBackend
+from .recorder import FrameRecorder
+from .utils import get_damage
+
 logger = logging.getLogger(__name__)
 
 
 class App:
-    def __init__(self, display=None, Root=None, size=(128, 64), image_mode="1"):
+    def __init__(
+        self,
+        display=None,
+        Root=None,
+        size=(128, 64),
+        image_mode="1",
+        partial_display=False,
+        max_fps=None,
+    ):
         assert display is not None
         assert Root is not None
         self._display = display
         self.Root = Root
 
+        # when partial_display is True display is also passed the bounding box of
+        # the region that changed since the last frame was displayed
+        self._partial_display = partial_display
+        self._previous_frame = None
+        self.damage = None
+
+        # when max_fps is set rerenders are handled by a display worker that
+        # coalesces rerenders that happen between frames into a single frame
+        self.max_fps = max_fps
+        self._display_lock = Lock()
+        self._display_requested = Event()
+        self._stop_worker_event = Event()
+        self._last_frame_time = 0
+
+        # frame counters: rendered frames that were pushed to the display,
+        # rendered frames dropped since they were unchanged and rerenders that
+        # were coalesced into an already requested frame
+        self.pushed_frames = 0
+        self.dropped_frames = 0
+        self.coalesced_frames = 0
+
         self.image_mode = image_mode
         self.size = size
 
         self._stop_event = Event()
-        self.saved_cache_frame_no = 0
+        self.recorder = None
         self.timestamp = (
             str(datetime.datetime.now())
             .split(".")[0]
@@ -29,37 +63,128 @@ class App:
         )
 
     def start(self):
+        # debug: record displayed frames to /tmp/pt-miniscreen
+        if environ.get("SAVE_CACHE", "0") == "1" and self.recorder is None:
+            path = Path(f"/tmp/pt-miniscreen/{self.timestamp}.rec")
+            logger.info(f"Recording displayed frames to {path}")
+            self.recorder = FrameRecorder(path)
+
         self.root = self.Root(on_rerender=self.display)
         self.root._set_active(True)
-        self.display()
+
+        # the whole frame is only pushed when what the display shows is unknown
+        self._update_display(force=self._previous_frame is None)
+
+        if self.max_fps:
+            self._stop_worker_event = Event()
+            Thread(
+                target=self._display_worker,
+                args=[self._stop_worker_event],
+                daemon=True,
+            ).start()
 
     def stop(self, error=None):
+        self._stop_worker_event.set()
+        self._display_requested.set()  # wake worker so it can stop
+
         self.root._cleanup()
         self.root = None
+        self._previous_frame = None
         self._stop_error = error
+
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+        if isinstance(self._display, DisplayBackend):
+            self._display.close()
+
         self._stop_event.set()
 
+    # tells the app the display is showing image, such as a frame pushed before
+    # the app was started, so the first frame only pushes what changed
+    def set_displayed_frame(self, image):
+        with self._display_lock:
+            self._previous_frame = image
+
     def wait_for_stop(self) -> None:
         self._stop_event.wait()
         error = getattr(self, "_stop_error", None)
         if isinstance(error, Exception):
             raise error
 
-    def display(self):
-        image = self.root.render(Image.new(self.image_mode, self.size))
+    def display(self, force=False):
+        # update immediately when forced or when frame rate is not limited
+        if force or not self.max_fps:
+            self._update_display(force)
+            return
+
+        if self._display_requested.is_set():
+            self.coalesced_frames += 1
+
+        self._display_requested.set()
+
+    def _display_worker(self, stop_event):
+        frame_time = 1 / self.max_fps
+
+        while True:
+            self._display_requested.wait()
+
+            # wait until the next frame is due, rerenders requested meanwhile
+            # are handled by this frame
+            sleep(max(self._last_frame_time + frame_time - monotonic(), 0))
+
+            if stop_event.is_set():
+                return
+
+            # clear before rendering so rerenders during the render are shown
+            self._display_requested.clear()
+
+            # keep displaying frames when one fails to render or display, rather
+            # than the worker stopping and the display freezing
+            try:
+                self._update_display()
+            except Exception:
+                logger.exception("Error updating display")
+
+    def _update_display(self, force=False):
+        with self._display_lock:
+            # do nothing if app has been stopped
+            if self.root is None:
+                return
+
+            self._last_frame_time = monotonic()
+            image = self.root.render(Image.new(self.image_mode, self.size))
+
+            # backends that only write changes must write the whole frame
+            if force and isinstance(self._display, DisplayBackend):
+                self._display.invalidate()
+
+            # skip the update if nothing changed since the last frame was displayed
+            damage = get_damage(None if force else self._previous_frame, image)
+            if damage is None:
+                logger.debug("Display unchanged, skipping update")
+                self.dropped_frames += 1
+                return
+
+            self.damage = damage
+            self._previous_frame = image
+
+            # debug: print displayed image in terminal
+            if environ.get("IMGCAT", "0") == "1":
+                from imgcat import imgcat
 
-        # debug: print displayed image in terminal
-        if environ.get("IMGCAT", "0") == "1":
-            from imgcat import imgcat
+                imgcat(image)
 
-            imgcat(image)
+            # debug: record frame, written to file by the recorder's thread
+            recorder = self.recorder
+            if recorder is not None:
+                recorder.record(image)
 
-        # debug: store images in /tmp/pt-miniscreen
-        if environ.get("SAVE_CACHE", "0") == "1":
-            path = Path(f"/tmp/pt-miniscreen/{self.timestamp}")
-            path.mkdir(parents=True, exist_ok=True)
-            image.save(path / f"{str(self.saved_cache_frame_no).zfill(4)}.png")
-            self.saved_cache_frame_no += 1
+            logger.debug(f"Update display region {damage}")
+            if self._partial_display:
+                self._display(image, damage)
+            else:
+                self._display(image)
 
-        logger.debug("Update display")
-        self._display(image)
+            self.pushed_frames += 1
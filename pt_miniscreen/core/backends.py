@@ -0,0 +1,194 @@
+from collections import deque
+from pathlib import Path
+from threading import Lock
+from time import perf_counter
+
+from .recorder import FrameRecorder
+from .ssd1306 import (
+    ADDRESS_COMMAND_BYTES,
+    COLUMNADDR,
+    PAGEADDR,
+    encode_pages,
+    get_changed_runs,
+)
+
+
+# Display backends are called with each frame and the bounding box of the
+# region that changed since the last frame, so they can be passed to App as the
+# display function. Each backend records how long pushing frames takes.
+class DisplayBackend:
+    # number of recent push times used to calculate latency percentiles
+    latency_samples = 1000
+
+    def __init__(self):
+        self._lock = Lock()
+        self._latencies = deque(maxlen=self.latency_samples)
+        self._first_push_time = None
+        self._last_push_time = None
+        self.pushes = 0
+        self.total_time = 0
+        self.max_time = 0
+
+    def __call__(self, image, damage=None):
+        start_time = perf_counter()
+        self.push(image, damage)
+        end_time = perf_counter()
+
+        with self._lock:
+            push_time = end_time - start_time
+            self._latencies.append(push_time)
+            self.pushes += 1
+            self.total_time += push_time
+            self.max_time = max(self.max_time, push_time)
+
+            if self._first_push_time is None:
+                self._first_push_time = start_time
+            self._last_push_time = end_time
+
+    def push(self, image, damage=None):
+        raise NotImplementedError("Display backends must implement the push method")
+
+    def invalidate(self):
+        # called when the display may not be showing the last pushed frame
+        pass
+
+    def close(self):
+        pass
+
+    @property
+    def stats(self):
+        with self._lock:
+            latencies = sorted(self._latencies)
+            elapsed = self._last_push_time - self._first_push_time if self.pushes else 0
+
+        if not latencies:
+            return {"pushes": 0, "mean_ms": 0, "p99_ms": 0, "max_ms": 0, "fps": 0}
+
+        p99 = latencies[min(int(len(latencies) * 0.99), len(latencies) - 1)]
+        return {
+            "pushes": self.pushes,
+            "mean_ms": round(self.total_time / self.pushes * 1000, 4),
+            "p99_ms": round(p99 * 1000, 4),
+            "max_ms": round(self.max_time * 1000, 4),
+            "fps": round(self.pushes / elapsed, 2) if elapsed else 0,
+        }
+
+
+# The miniscreen's SSD1306 OLED. When the device is a luma device that can be
+# sent commands and data, frames are encoded in the SSD1306 page layout and only
+# the columns of each page that changed since the last frame are written.
+class SSD1306Backend(DisplayBackend):
+    def __init__(self, device):
+        super().__init__()
+        self.device = device
+        self.bytes_sent = 0
+        self._pages = None
+        self._direct = callable(getattr(device, "command", None)) and callable(
+            getattr(device, "data", None)
+        )
+
+    def invalidate(self):
+        self._pages = None
+
+    def push(self, image, damage=None):
+        if not self._direct:
+            self.device.display(image)
+            self.bytes_sent += image.width * image.height // 8
+            return
+
+        preprocess = getattr(self.device, "preprocess", None)
+        pages = encode_pages(preprocess(image) if callable(preprocess) else image)
+        column_start = getattr(self.device, "_colstart", 0)
+
+        if self._pages is None:
+            # write every page in one go
+            self._write(column_start, pages.shape[1], 0, pages.shape[0] - 1, pages)
+        else:
+            # the damaged region is in image coordinates, so it can only be used
+            # to limit the comparison when the device does not rotate frames
+            region = damage if getattr(self.device, "rotate", 0) == 0 else None
+            runs = get_changed_runs(self._pages, pages, region=region)
+            for page, start, end in runs:
+                data = pages[page, start:end]
+                self._write(column_start + start, end - start, page, page, data)
+
+        self._pages = pages
+
+    def _write(self, column, width, start_page, end_page, data):
+        self.device.command(
+            COLUMNADDR, column, column + width - 1, PAGEADDR, start_page, end_page
+        )
+        self.device.data(data.ravel().tolist())
+        self.bytes_sent += ADDRESS_COMMAND_BYTES + data.size
+
+    @property
+    def stats(self):
+        stats = super().stats
+        stats["bytes_per_push"] = (
+            round(self.bytes_sent / self.pushes, 2) if self.pushes else 0
+        )
+        return stats
+
+
+# keeps the last frame in memory, used to run the app as fast as possible
+class MemoryBackend(DisplayBackend):
+    def __init__(self):
+        super().__init__()
+        self.frame = None
+
+    def push(self, image, damage=None):
+        self.frame = image
+
+
+class PNGBackend(DisplayBackend):
+    def __init__(self, directory):
+        super().__init__()
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def push(self, image, damage=None):
+        image.save(self.directory / f"{str(self.pushes).zfill(4)}.png")
+
+
+class RecordingBackend(DisplayBackend):
+    def __init__(self, path):
+        super().__init__()
+        self.recorder = FrameRecorder(path)
+
+    def push(self, image, damage=None):
+        self.recorder.record(image)
+
+    def close(self):
+        self.recorder.close()
+
+
+# shows frames in a window using luma.emulator, which must be installed
+class EmulatorBackend(DisplayBackend):
+    def __init__(self, size=(128, 64), scale=4):
+        super().__init__()
+
+        from luma.emulator.device import pygame
+
+        self.device = pygame(width=size[0], height=size[1], mode="1", scale=scale)
+
+    def push(self, image, damage=None):
+        self.device.display(image)
+
+
+def create_backend(name, device=None):
+    if name == "device":
+        return SSD1306Backend(device)
+
+    if name == "memory":
+        return MemoryBackend()
+
+    if name == "png":
+        return PNGBackend("/tmp/pt-miniscreen/frames")
+
+    if name == "recording":
+        return RecordingBackend("/tmp/pt-miniscreen/display.rec")
+
+    if name == "emulator":
+        return EmulatorBackend()
+
+    raise ValueError(f"Unknown display backend '{name}'")
@@ -0,0 +1,85 @@
+from collections import OrderedDict
+from threading import Lock
+
+_missing = object()
+
+
+# Thread-safe least recently used cache bounded by the total size of its
+# values. The size of a value is found using get_size, which counts every value
+# as 1 by default so max_size is the maximum number of entries.
+class LRUCache:
+    def __init__(self, max_size, get_size=None):
+        self.max_size = max_size
+        self._get_size = get_size if callable(get_size) else lambda _: 1
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+    def set(self, key, value):
+        size = self._get_size(value)
+
+        with self._lock:
+            if key in self._entries:
+                self.size -= self._entries.pop(key)[1]
+
+            # values larger than the cache are not stored
+            if size > self.max_size:
+                return
+
+            self._entries[key] = (value, size)
+            self.size += size
+
+            while self.size > self.max_size:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size -= evicted_size
+                self.evictions += 1
+
+    def get_or_create(self, key, create):
+        # create is called without holding the lock so concurrent misses for the
+        # same key may both create the value, the last one created is stored
+        value = self.get(key, _missing)
+        if value is _missing:
+            value = create()
+            self.set(key, value)
+
+        return value
+
+    def items(self):
+        with self._lock:
+            return [(key, value) for key, (value, _) in self._entries.items()]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    @property
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "size": self.size,
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -1,12 +1,16 @@
 import logging
 import threading
-from time import sleep, time
+from collections.abc import Mapping
+from contextlib import contextmanager
 from typing import Any, Dict
-from weakref import WeakMethod, ref
+from time import perf_counter
+from weakref import WeakMethod
 
 from PIL import Image
 
-from .utils import is_same_image
+from .profiler import profiler
+from .scheduler import Interval, Task, get_animation_scheduler
+from .utils import LayerCache, get_image_key
 
 logger = logging.getLogger(__name__)
 
@@ -23,54 +27,44 @@ class StateAccessException(Exception):
     pass
 
 
-# Inherit from Timer so that Interval shares the same API
-class Interval(threading.Timer):
-    def __init__(
-        self,
-        *args,
-        active_event=None,
-        **kwargs,
-    ):
-        super().__init__(*args, **kwargs)
-        self.get_active_event = ref(active_event)
-        self.daemon = True  # Intervals shouldn't keep the process alive
+_missing = object()
+
+
+# Read-only view of state before an update. Only the previous values of keys
+# that changed are stored, other keys are read from the current state.
+class PreviousState(Mapping):
+    def __init__(self, state, changes):
+        self._state = state
+        self._changes = changes
 
     @property
-    def function(self):
-        return self._get_function()
+    def changed_keys(self):
+        return set(self._changes.keys())
 
-    @function.setter
-    def function(self, next_value):
-        # Use a WeakMethod to store the function so that the Interval does not
-        # produce a circular reference with the Component that created it which
-        # would result in memory leaks.
-        self._get_function = WeakMethod(next_value)
+    def _record(self, key, value):
+        # called when state changes while the view is in use so it stays valid
+        self._changes.setdefault(key, value)
 
-    # override run to execute function every `interval` seconds
-    def run(self):
-        execution_time = 0
+    def __getitem__(self, key):
+        value = self._changes.get(key, _missing)
+        if value is _missing:
+            if key in self._changes:
+                raise KeyError(key)
 
-        while True:
-            # wait for active event to be set before continuing
-            active_event = self.get_active_event()
-            if isinstance(active_event, threading.Event):
-                active_event.wait()
+            return dict.__getitem__(self._state, key)
 
-            # take execution time into account when waiting to produce a more
-            # accurate interval time
-            wait_time = self.interval - execution_time
-            if wait_time < 0:
-                logger.warning(f"Interval lagging by {-wait_time}s")
+        return value
 
-            sleep(max(wait_time, 0))
+    def __iter__(self):
+        keys = [key for key in self._state if key not in self._changes]
+        keys += [key for key, value in self._changes.items() if value is not _missing]
+        return iter(keys)
 
-            # stop interval if cancel called or if parent has been cleaned up
-            if self.finished.is_set() or self.function is None:
-                return
+    def __len__(self):
+        return sum(1 for _ in self)
 
-            start_time = time()
-            self.function(*self.args, **self.kwargs)
-            execution_time = start_time - time()
+    def __repr__(self) -> str:
+        return repr(dict(self))
 
 
 class State(dict):
@@ -85,37 +79,157 @@ class State(dict):
         # produce a circular reference with the Component that created it which
         # would result in memory leaks.
         self._get_on_state_update = WeakMethod(on_state_update)
+        self._batch_depth = 0
+        self._batch_changes = {}
+        self._previous_states = []
         super().__init__(initial_state)
 
-    def update(self, *args, **kwargs):
-        previous_state = self.copy()
-        super().update(*args, **kwargs)
+    @property
+    def batching(self):
+        return self._batch_depth > 0
+
+    def _apply(self, updates):
+        # only compare the keys being updated, values that are the same object
+        # are not compared since comparing large values can be slow
+        changes = {}
+        for key, value in updates.items():
+            previous_value = dict.get(self, key, _missing)
+            if previous_value is not value and previous_value != value:
+                changes[key] = previous_value
+
+        dict.update(self, updates)
+
+        for previous_state in self._previous_states:
+            for key, value in changes.items():
+                previous_state._record(key, value)
+
+        return changes
+
+    def _notify(self, changes):
         on_state_update = self._get_on_state_update()
-        if callable(on_state_update):
+        if not callable(on_state_update):
+            return
+
+        previous_state = PreviousState(self, changes)
+        self._previous_states.append(previous_state)
+        try:
             on_state_update(previous_state)
+        finally:
+            self._previous_states.remove(previous_state)
 
+    def update(self, *args, **kwargs):
+        changes = self._apply(dict(*args, **kwargs))
 
-# Always create and return copies to prevent accidentally mutating the cache
+        if self.batching:
+            for key, value in changes.items():
+                self._batch_changes.setdefault(key, value)
+            return
+
+        if changes:
+            self._notify(changes)
+
+    @contextmanager
+    def batch(self):
+        # updates made inside the batch are applied immediately but the
+        # component is only notified once, when the outermost batch exits
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                # forget keys that were changed back to their original value
+                changes = {
+                    key: value
+                    for key, value in self._batch_changes.items()
+                    if value is _missing or dict.get(self, key, _missing) != value
+                }
+                self._batch_changes = {}
+                self._notify(changes)
+
+
+# Cached frames are immutable: only the key of the input is stored and the
+# output is returned without being copied, so outputs returned from render must
+# not be mutated. When immutable_frames is False copies of the cached images
+# are created and returned instead, this is slower but useful for comparison.
 class RenderCache:
+    immutable_frames = True
+
+    # number of images allocated by render caches, used to measure the cost of
+    # caching renders
+    allocations = 0
+
     def __init__(self):
-        self._input = {"copy": lambda: None}
-        self._output = {"copy": lambda: None}
+        self._input = None
+        self._output = None
+
+        # keys used to compare images against the cache are stored so each
+        # cached image is only serialised once
+        self._input_key = None
+        self._output_key = None
+
+        # incremented whenever the output changes so parents can tell if the
+        # output has changed since they last used it without comparing images
+        self.version = 0
+
+    @classmethod
+    def _copy(cls, image):
+        cls.allocations += 1
+        return image.copy()
+
+    @classmethod
+    def _from_key(cls, key):
+        cls.allocations += 1
+        mode, size, data = key
+        return Image.frombytes(mode, size, data)
 
     @property
     def input(self):
-        return self._input.copy()
+        if self._input_key is None:
+            return None
+
+        # recreate input from its key since render is allowed to mutate it
+        if self.immutable_frames:
+            return self._from_key(self._input_key)
+
+        return self._copy(self._input)
 
     @input.setter
     def input(self, next_input):
-        self._input = next_input.copy()
+        self._input_key = get_image_key(next_input)
+        if not self.immutable_frames:
+            self._input = self._copy(next_input)
 
     @property
     def output(self):
-        return self._output.copy()
+        if self._output is None or self.immutable_frames:
+            return self._output
+
+        return self._copy(self._output)
 
     @output.setter
     def output(self, next_output):
-        self._output = next_output.copy()
+        self._output_key = None
+        self.version += 1
+        if self.immutable_frames:
+            self._output = next_output
+        else:
+            self._output = self._copy(next_output)
+
+    def is_same_input(self, image):
+        if self._input_key is None:
+            return False
+
+        return get_image_key(image) == self._input_key
+
+    def is_same_output(self, image):
+        if self._output is None:
+            return False
+
+        if self._output_key is None:
+            self._output_key = get_image_key(self._output)
+
+        return get_image_key(image) == self._output_key
 
 
 class Component:
@@ -133,7 +247,10 @@ class Component:
 
         self._children = []
         self._intervals = []
+        self._tasks = []
         self._render_cache = RenderCache()
+        self._layer_cache = LayerCache()
+        self._state_changed = True
         self._get_on_rerender = WeakMethod(on_rerender)
         self._state = State(
             initial_state={**self.default_state, **initial_state},
@@ -141,6 +258,7 @@ class Component:
         )
         self._reconciliation_lock = threading.Lock()
         self._reconciliation_queued = False
+        self._reconciliation_pending = False
 
         self.active_event = threading.Event()
         self.mounted = False
@@ -166,6 +284,12 @@ class Component:
 
             self._intervals = []
 
+        if hasattr(self, "_tasks"):
+            for task in self._tasks:
+                task.cancel()
+
+            self._tasks = []
+
         if hasattr(self, "_children"):
             for child in self._children:
                 child._cleanup()
@@ -179,9 +303,16 @@ class Component:
     def _set_active(self, active):
         if active:
             self.active_event.set()
+
+            # schedule intervals and tasks that were parked while paused
+            for job in self._intervals + self._tasks:
+                job.resume()
         else:
             self.active_event.clear()
 
+            for job in self._intervals + self._tasks:
+                job.pause()
+
         # also set children to have the correct active state
         for child in self._children:
             child._set_active(active and child.rendered)
@@ -192,7 +323,19 @@ class Component:
         for child in self._children:
             child.rendered = False
 
-        output = self._original_render(image)
+        # cached layers are only reused when state is unchanged since the last
+        # render, otherwise render may apply different layers
+        reuse_layers = not self._state_changed
+        self._state_changed = False
+
+        start_time = profiler.start_render() if profiler.enabled else None
+
+        try:
+            with self._layer_cache.rendering(reuse=reuse_layers):
+                output = self._original_render(image)
+        finally:
+            if start_time is not None:
+                profiler.end_render(self, start_time)
 
         # set children that were rendered to active, otherwise pause them
         # if self is not rendered all children should be paused
@@ -216,7 +359,11 @@ class Component:
         self.rendered = True
 
         # return cached output if input is the same
-        if is_same_image(image, self._render_cache.input):
+        is_same_input = self._render_cache.is_same_input(image)
+        if profiler.enabled:
+            profiler.record_cache_lookup(self, hit=is_same_input)
+
+        if is_same_input:
             return self._render_cache.output
 
         logger.debug(f"{self} rendering")
@@ -241,13 +388,25 @@ class Component:
         return output
 
     def _on_state_update(self, previous_state):
-        if self.state != previous_state:
+        # rerenders requested during a batch are handled after the batch
+        reconciliation_pending = self._reconciliation_pending
+        self._reconciliation_pending = False
+
+        if previous_state.changed_keys:
+            self._state_changed = True
             self.on_state_change(previous_state)
+        elif not reconciliation_pending:
+            return
 
-            if self.mounted:
-                self._reconcile()
+        if self.mounted:
+            self._reconcile()
 
     def _reconcile(self):
+        if self._state.batching:
+            # reconcile once when the batch is finished
+            self._reconciliation_pending = True
+            return
+
         if self._reconciliation_queued:
             # since state is always up-to-date we can let the queued reconcile
             # handle the rerender and ignore this one. This prevents the queue
@@ -256,8 +415,12 @@ class Component:
 
         try:
             self._reconciliation_queued = self._reconciliation_lock.locked()
+            wait_start_time = perf_counter()
             self._reconciliation_lock.acquire()
 
+            if profiler.enabled:
+                profiler.record_reconcile(self, perf_counter() - wait_start_time)
+
             # do nothing if parent no longer exists
             on_rerender = self._get_on_rerender()
             if not callable(on_rerender):
@@ -270,7 +433,7 @@ class Component:
             render_output = self._internal_render(self._render_cache.input)
 
             # do nothing if render output is unchanged
-            if is_same_image(render_output, self._render_cache.output):
+            if self._render_cache.is_same_output(render_output):
                 return
 
             # cache the new output and notify parent about the rerender
@@ -306,10 +469,26 @@ class Component:
 
     def create_interval(self, callback, timeout=1):
         interval = Interval(timeout, callback, active_event=self.active_event)
-        interval.start()
         self._intervals.append(interval)
+        interval.start()
         return interval
 
+    def _start_task(self, task):
+        # forget tasks that have already finished
+        self._tasks = [task for task in self._tasks if not task.finished.is_set()]
+
+        self._tasks.append(task)
+        task.start()
+        return task
+
+    def create_task(self, generator):
+        return self._start_task(Task(generator, active_event=self.active_event))
+
+    def create_transition(self, generator):
+        # transitions are not paused with the component so they always finish,
+        # and run on the animation scheduler so intervals cannot delay them
+        return self._start_task(Task(generator, scheduler=get_animation_scheduler()))
+
     def remove_child(self, child):
         if child not in self._children:
             logger.warning(f"{self} tried to remove unknown child: {child}")
@@ -1,15 +1,114 @@
 import logging
-from threading import Event, Thread
-from time import sleep
+from threading import Event
+from time import monotonic
 
-from PIL.Image import open as open_image, BICUBIC
+from PIL.Image import frombytes, open as open_image, BICUBIC
 
+from ..cache import LRUCache
 from ..component import Component
 from ..utils import offset_to_center
 
 logger = logging.getLogger(__name__)
 
 
+# An image file decoded once and shared by every Image component that uses it.
+# Every frame is decoded up front and stored as packed 1-bit data along with how
+# long it should be shown, so animations never decode frames while playing.
+class ImageFile:
+    def __init__(self, path):
+        self.path = path
+        self._frames = []
+        self.durations = []
+
+        with open_image(path) as image:
+            self.size = image.size
+            self.is_animated = getattr(image, "is_animated", False)
+            self.n_frames = getattr(image, "n_frames", 1)
+
+            for index in range(self.n_frames):
+                image.seek(index)
+                self._frames.append(image.convert("1").tobytes())
+                self.durations.append(image.info.get("duration", 0) / 1000)
+
+        logger.debug(
+            f"Decoded {self.n_frames} frames from {path} using {self.memory} bytes"
+        )
+
+    # creates an image file from frames that were already decoded, such as
+    # frames stored in a cache, without opening the image
+    @classmethod
+    def from_frames(cls, path, size, frames, durations):
+        image_file = cls.__new__(cls)
+        image_file.path = path
+        image_file.size = size
+        image_file.is_animated = len(frames) > 1
+        image_file.n_frames = len(frames)
+        image_file._frames = list(frames)
+        image_file.durations = list(durations)
+        return image_file
+
+    @property
+    def frames(self):
+        # packed 1-bit data of each frame
+        return self._frames
+
+    @property
+    def memory(self):
+        return sum(len(frame) for frame in self._frames)
+
+    @property
+    def duration(self):
+        return sum(self.durations)
+
+    def _load_frame(self, index):
+        return frombytes("1", self.size, self._frames[index])
+
+    def _load_resized_frame(self, index, size, resampling):
+        # frames are resized before being converted to 1-bit so they match
+        # resized images pasted onto the 1-bit images passed to render. Resizing
+        # is rare so the original frame is decoded from the file again
+        with open_image(self.path) as image:
+            image.seek(index)
+            return image.resize(size, resampling).convert("1")
+
+    def get_frame(self, index=0, size=None, resampling=BICUBIC):
+        if index >= self.n_frames:
+            raise EOFError("no more images in file")
+
+        if size:
+            return frame_cache.get_or_create(
+                (self.path, index, size, resampling),
+                lambda: self._load_resized_frame(index, size, resampling),
+            )
+
+        return frame_cache.get_or_create(
+            (self.path, index, None, None), lambda: self._load_frame(index)
+        )
+
+
+image_file_cache = LRUCache(max_size=64)
+
+# Unpacked 1-bit frames that have been rendered recently, bounded by the memory
+# they use. PIL stores a byte per pixel for 1-bit images.
+frame_cache = LRUCache(
+    max_size=1024 * 1024,
+    get_size=lambda frame: frame.width * frame.height,
+)
+
+
+def get_image_file(path):
+    return image_file_cache.get_or_create(path, lambda: ImageFile(path))
+
+
+def get_animation_memory():
+    # bytes used by the decoded frames of each animated image file
+    return {
+        path: image_file.memory
+        for path, image_file in image_file_cache.items()
+        if image_file.is_animated
+    }
+
+
 class Image(Component):
     def __init__(
         self,
@@ -22,7 +121,8 @@ class Image(Component):
         initial_state={},
         **kwargs,
     ):
-        self._image = open_image(image_path) if image_path else None
+        self._image = get_image_file(image_path) if image_path else None
+        self._animation = None
         self.stop_animating_event = Event()
 
         super().__init__(
@@ -45,14 +145,26 @@ class Image(Component):
             self._start_animating()
 
     @property
-    def image(self):
+    def frame(self):
+        # shared frame that is rendered, it must not be modified
         if not self._image:
             return None
 
-        if self.state["resize"] and self.size:
-            return self._image.resize(self.size, self.state["resize_resampling"])
+        return self._image.get_frame(
+            self.state["frame"],
+            self.size if self.state["resize"] and self.size else None,
+            self.state["resize_resampling"],
+        )
 
-        return self._image.copy()
+    @property
+    def image(self):
+        frame = self.frame
+        return frame.copy() if frame else None
+
+    @property
+    def image_size(self):
+        frame = self.frame
+        return frame.size if frame else None
 
     @image.setter
     def image(self, _):
@@ -61,43 +173,56 @@ class Image(Component):
         )
 
     def cleanup(self):
+        self._stop_animating()
+
+    def _stop_animating(self):
         self.stop_animating_event.set()
+        if self._animation:
+            self._animation.cancel()
+            self._animation = None
 
     def _start_animating(self):
         # stop previous animation if it exists
-        self.stop_animating_event.set()
+        self._stop_animating()
 
-        # create stop event for new thread
+        # create stop event for new animation
         self.stop_animating_event = Event()
-        Thread(
-            target=self._animate, args=[self.stop_animating_event], daemon=True
-        ).start()
+        self._animation = self.create_task(self._animate(self.stop_animating_event))
 
     def _animate(self, stop_event):
         if not self._image.is_animated:
             logger.debug("image is not animated, unable to start animating")
             return
 
-        while True:
-            sleep(self._image.info["duration"] / 1000)
+        # frames are scheduled against a monotonic clock so delays in showing a
+        # frame do not accumulate over the animation
+        frame_time = monotonic()
 
-            self.active_event.wait()
+        while True:
+            duration = self._image.durations[self.state["frame"]]
+            frame_time += duration
+            yield max(frame_time - monotonic(), 0)
 
             if stop_event.is_set():
                 return
 
+            # restart the clock instead of catching up when the animation is
+            # resumed after being paused or has fallen behind by over a frame
+            current_time = monotonic()
+            if current_time - frame_time > duration:
+                frame_time = current_time
+
             next_frame = self.state["frame"] + 1
             if self.state["loop"] and next_frame >= self._image.n_frames:
                 next_frame = 0
 
-            try:
-                self._image.seek(next_frame)
-                self.state.update({"frame": next_frame})
-            except EOFError:
-                # bail if image has no more frames
+            # bail if image has no more frames
+            if next_frame >= self._image.n_frames:
                 stop_event.set()
                 return
 
+            self.state.update({"frame": next_frame})
+
     def on_state_change(self, previous_state):
         # on loop change
         loop = self.state["loop"]
@@ -105,14 +230,13 @@ class Image(Component):
             if loop and self._image.is_animated:
                 self._start_animating()
 
-            if not loop and self.stop_animating_event:
-                self.stop_animating_event.set()
+            if not loop:
+                self._stop_animating()
 
         # on image_path change
         image_path = self.state["image_path"]
         if image_path != previous_state["image_path"]:
-            if self.stop_animating_event:
-                self.stop_animating_event.set()
+            self._stop_animating()
 
             # bail if image_path is now None
             if image_path is None:
@@ -120,7 +244,7 @@ class Image(Component):
                 return
 
             # update self.image
-            self._image = open_image(image_path)
+            self._image = get_image_file(image_path)
 
             # reset frame state if needed
             if self.state["frame"] != 0:
@@ -130,30 +254,34 @@ class Image(Component):
             if self._image.is_animated:
                 self._start_animating()
 
-    def _get_x_pos(self, container_width):
+    def _get_x_pos(self, container_width, frame):
         if self.state["align"] == "center":
-            return offset_to_center(container_width, self.image.width)
+            return offset_to_center(container_width, frame.width)
 
         if self.state["align"] == "right":
-            return container_width - self.image.width
+            return container_width - frame.width
 
         return 0
 
-    def _get_y_pos(self, container_height):
+    def _get_y_pos(self, container_height, frame):
         if self.state["vertical_align"] == "center":
-            return offset_to_center(container_height, self.image.height)
+            return offset_to_center(container_height, frame.height)
 
         if self.state["vertical_align"] == "bottom":
-            return container_height - self.image.height
+            return container_height - frame.height
 
         return 0
 
-    def _get_pos(self, container_size):
-        return (self._get_x_pos(container_size[0]), self._get_y_pos(container_size[1]))
+    def _get_pos(self, container_size, frame):
+        return (
+            self._get_x_pos(container_size[0], frame),
+            self._get_y_pos(container_size[1], frame),
+        )
 
     def render(self, image):
         if not self._image:
             return image
 
-        image.paste(self.image, self._get_pos(image.size))
+        frame = self.frame
+        image.paste(frame, self._get_pos(image.size, frame))
         return image
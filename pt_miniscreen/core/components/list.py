@@ -1,20 +1,61 @@
 import logging
 import threading
+from collections.abc import Sequence
 from math import ceil
+from time import perf_counter
 
 from PIL import Image, ImageDraw
 
+from ..animation import Animation, animate, linear
 from ..component import Component
-from ..utils import apply_layers, layer, rectangle, transition
+from ..utils import apply_layers, layer, rectangle
 
 logger = logging.getLogger(__name__)
 
 
-class List(Component):
-    def cleanup(self):
-        if hasattr(self, "_cleanup_transition"):
-            self._cleanup_transition.set()
+# Rows of a non-virtual list that are created when they are first accessed.
+# Rows are kept once they have been created so they keep their state when they
+# are no longer visible.
+class LazyRows(Sequence):
+    def __init__(self, Rows, create_row):
+        self._Rows = Rows
+        self._rows = [None] * len(Rows)
+        self._create_row = create_row
+        self._lock = threading.Lock()
+        self.construction_times = {}
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        with self._lock:
+            row = self._rows[index]
+            if row is None:
+                start_time = perf_counter()
+                row = self._rows[index] = self._create_row(self._Rows[index])
+                self.construction_times[index] = perf_counter() - start_time
+                logger.debug(
+                    f"Created row {index} in {self.construction_times[index]:.4f}s"
+                )
+
+        return row
+
+    @property
+    def created_rows(self):
+        return [row for row in self._rows if row is not None]
+
+    def create_range(self, start, end):
+        for index in range(max(start, 0), min(end, len(self))):
+            self[index]
 
+
+class List(Component):
     def __init__(
         self,
         Rows,
@@ -26,12 +67,16 @@ class List(Component):
         scrollbar_horizontal_padding=3,
         use_snapshot_when_scrolling=True,
         transition_duration=0.25,
+        transition_easing=linear,
         initial_top_row_index=0,
         visible_scrollbar=True,
         virtual=False,
+        lazy_window=None,
         initial_state={},
         **kwargs,
     ):
+        # use_snapshot_when_scrolling is accepted for backwards compatibility,
+        # rows are always composited from their cached output when scrolling
         super().__init__(
             **kwargs,
             initial_state={
@@ -48,7 +93,6 @@ class List(Component):
                 "active_transition": None,
                 "transition_progress": 0,
                 "transition_duration": transition_duration,
-                "use_snapshot_when_scrolling": use_snapshot_when_scrolling,
                 "visible_scrollbar": visible_scrollbar,
                 "transition_distance": 0,
                 **initial_state,
@@ -56,8 +100,21 @@ class List(Component):
         )
 
         self._virtual = virtual
-        self._rows_snapshot = None
-        self._cleanup_transition = threading.Event()
+        self.row_size = None
+        self._lazy_window = None if virtual else lazy_window
+
+        # number of times rows were rendered and were composited from the
+        # output cached by their last render
+        self.row_renders = 0
+        self.cached_row_renders = 0
+        self.transition_easing = transition_easing
+
+        # when lazy only the rows within lazy_window rows of the visible rows
+        # are created, other rows are created when they are needed
+        if self._lazy_window is not None:
+            self.rows = LazyRows(Rows, self.create_child)
+            self._create_rows_in_window(self.state["top_row_index"])
+            return
 
         # setup initial rows
         num_rows = self.state["num_visible_rows"] if virtual else len(Rows)
@@ -65,6 +122,17 @@ class List(Component):
         end_index = start_index + num_rows
         self.rows = [self.create_child(Row) for Row in Rows[start_index:end_index]]
 
+    @property
+    def row_construction_times(self):
+        # seconds taken to create each row of a lazy list by row index
+        return getattr(self.rows, "construction_times", {})
+
+    def _create_rows_in_window(self, top_row_index):
+        self.rows.create_range(
+            top_row_index - self._lazy_window,
+            top_row_index + self.state["num_visible_rows"] + self._lazy_window,
+        )
+
     @property
     def visible_scrollbar(self):
         return self.state["visible_scrollbar"]
@@ -108,7 +176,11 @@ class List(Component):
 
     @property
     def invisible_rows(self):
-        return list(filter(lambda row: row not in self.visible_rows, self.rows))
+        # only rows that have been created are checked so lazy rows are not
+        # created just to find out they are not visible
+        rows = self.rows.created_rows if isinstance(self.rows, LazyRows) else self.rows
+        visible_rows = self.visible_rows
+        return [row for row in rows if row not in visible_rows]
 
     def update_rows(self, rows):
         self.rows = [
@@ -116,30 +188,58 @@ class List(Component):
         ]
         self.state.update({"Rows": rows, "top_row_index": 0})
 
+    def _create_row(self, index):
+        return self.create_child(self.state["Rows"][index])
+
+    # rows are passed as (index, row) pairs with the top row index after the
+    # scroll that removed them
+    def _remove_rows(self, rows, top_row_index):
+        for _, row in rows:
+            self.remove_child(row)
+
     def _remove_invisible_rows(self):
-        for row in self.invisible_rows:
+        # rows of virtual lists are consecutive, when scrolling down the rows
+        # scrolled away from are before the top row
+        top_row_index = self.state["top_row_index"]
+        first_row_index = top_row_index
+        if self.state["active_transition"] == "DOWN":
+            first_row_index -= self.state["transition_distance"]
+
+        visible_rows = self.visible_rows
+        removed_rows = [
+            (index, row)
+            for index, row in enumerate(self.rows, start=first_row_index)
+            if row not in visible_rows
+        ]
+
+        for _, row in removed_rows:
             self.rows.remove(row)
-            self.remove_child(row)
+
+        self._remove_rows(removed_rows, top_row_index)
 
     def _scroll_transition(self, distance):
         # only animate transition if list has been rendered before
         if self.height:
             scroll_distance = self._get_rows_height(num_rows=distance)
-            for step in transition(
-                distance=scroll_distance,
+            animation = Animation(
+                start=0,
+                end=scroll_distance,
                 duration=self.state["transition_duration"],
-            ):
-                if self._cleanup_transition.is_set():
-                    return
-
-                progress = self.state["transition_progress"]
-                progress_step = step / scroll_distance
-                self.state.update({"transition_progress": progress + progress_step})
+                easing=self.transition_easing,
+            )
+
+            # progress is rounded to whole pixels so frames are only rendered
+            # when the rows move
+            yield from animate(
+                animation,
+                lambda offset: self.state.update(
+                    {"transition_progress": int(offset) / scroll_distance}
+                ),
+            )
 
         if self._virtual:
             self._remove_invisible_rows()
 
-        self._rows_snapshot = None
         self.state.update(
             {
                 "active_transition": None,
@@ -168,8 +268,7 @@ class List(Component):
             if self._virtual:
                 for i in range(distance):
                     row_index = self.state["top_row_index"] - (i + 1)
-                    Row = self.state["Rows"][row_index]
-                    self.rows.insert(0, self.create_child(Row))
+                    self.rows.insert(0, self._create_row(row_index))
 
         elif direction == "DOWN":
             if not self.can_scroll_down(distance):
@@ -183,21 +282,31 @@ class List(Component):
             if self._virtual:
                 for i in range(distance):
                     row_index = self.state["top_row_index"] + (i + 1)
-                    Row = self.state["Rows"][
-                        row_index + self.state["num_visible_rows"] - 1
-                    ]
-                    self.rows.append(self.create_child(Row))
+                    self.rows.append(
+                        self._create_row(row_index + self.state["num_visible_rows"] - 1)
+                    )
+
+        if self._lazy_window is not None:
+            self._create_rows_in_window(next_top_row_index)
 
         if not animate:
             # remove rows that are no longer visible if virtual
             if self._virtual:
+                num_visible_rows = self.state["num_visible_rows"]
                 if direction == "UP":
-                    self.rows = self.rows[: self.state["num_visible_rows"]]
+                    first_removed_index = next_top_row_index + num_visible_rows
+                    removed_rows = self.rows[num_visible_rows:]
+                    self.rows = self.rows[:num_visible_rows]
 
                 if direction == "DOWN":
+                    first_removed_index = self.state["top_row_index"]
+                    removed_rows = self.rows[:distance]
                     self.rows = self.rows[distance:]
 
-                self._remove_invisible_rows()
+                self._remove_rows(
+                    list(enumerate(removed_rows, start=first_removed_index)),
+                    next_top_row_index,
+                )
 
             self.state.update({"top_row_index": next_top_row_index})
             return
@@ -209,9 +318,7 @@ class List(Component):
                 "transition_distance": distance,
             }
         )
-        threading.Thread(
-            target=self._scroll_transition, args=[distance], daemon=True
-        ).start()
+        self.create_transition(self._scroll_transition(distance))
 
     def scroll_up(self, distance=1, animate=True):
         self.scroll_to(direction="UP", distance=distance, animate=animate)
@@ -296,28 +403,20 @@ class List(Component):
 
         return self.rows[start_index:end_index]
 
-    def _render_rows(self, image):
-        # bail if there are no rows to render
-        num_rows = len(self.rows)
-        if num_rows == 0:
-            return image
-
-        row_gap = self.state["row_gap"]
-        row_height = self._get_row_height()
-        rows_height = self._get_rows_height(num_rows)
-        rows = self._get_rows_needed_for_render()
-
-        return apply_layers(
-            Image.new("1", size=(image.width, rows_height)),
-            [
-                layer(
-                    row.render,
-                    size=(image.width, row_height),
-                    pos=(0, (row_height + row_gap) * row_index),
-                )
-                for (row_index, row) in enumerate(rows)
-            ],
-        )
+    def _get_row_strip(self, row, row_size):
+        # rows are always rendered onto a blank image, so the output cached by a
+        # row's last render can be used until the row is resized. Rows update
+        # their cached output when they reconcile so animated rows keep moving.
+        # Rows with a wrapped render method, such as the selected row of a
+        # SelectableList, are always rendered.
+        unwrapped = getattr(row.render, "__name__", None) == "_render"
+        if unwrapped and row.mounted and row.size == row_size:
+            row.rendered = True
+            self.cached_row_renders += 1
+            return row._render_cache.output
+
+        self.row_renders += 1
+        return row.render(Image.new("1", size=row_size))
 
     def _render_rows_window(self, image):
         transition = self.state["active_transition"]
@@ -334,19 +433,25 @@ class List(Component):
             scroll_offset = int(progress_correction * scroll_height)
             window_top += scroll_offset if transition == "UP" else -scroll_offset
 
-        window_height = self._get_rows_height(num_rows=self.state["num_visible_rows"])
-        window_bottom = window_top + window_height
-
-        # initialise snapshot if needed
-        use_snap = transition and self.state["use_snapshot_when_scrolling"]
-        if transition and use_snap and not self._rows_snapshot:
-            self._rows_snapshot = self._render_rows(image)
-
-        # either use snapshot if it exists or render the rows
-        rows_image = self._rows_snapshot or self._render_rows(image)
+        # bail if there are no rows to render
+        if len(self.rows) == 0:
+            return image
 
-        # return rows cropped to be the size as the input image
-        return rows_image.crop((0, window_top, image.width, window_bottom))
+        row_gap = self.state["row_gap"]
+        row_height = self._get_row_height()
+        window_height = self._get_rows_height(num_rows=self.state["num_visible_rows"])
+        self.row_size = (image.width, row_height)
+
+        # paste each row at its offset from the top of the window, rows outside
+        # the window are clipped
+        rows_image = Image.new("1", size=(image.width, window_height))
+        for row_index, row in enumerate(self._get_rows_needed_for_render()):
+            rows_image.paste(
+                self._get_row_strip(row, self.row_size),
+                (0, (row_height + row_gap) * row_index - window_top),
+            )
+
+        return rows_image
 
     def render(self, image):
         scrollbar_width = self.state["scrollbar_width"] if self.visible_scrollbar else 0
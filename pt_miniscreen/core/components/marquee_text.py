@@ -1,9 +1,7 @@
 import logging
-from threading import Event, Thread
-from time import sleep
 
 from ..utils import carousel
-from .text import Text
+from .text import Text, get_text_size
 
 logger = logging.getLogger(__name__)
 
@@ -12,8 +10,8 @@ DEFAULT_OFFSET_VALUE = 0
 
 class MarqueeText(Text):
     def cleanup(self):
-        if self._stop_scroll_event:
-            self._stop_scroll_event.set()
+        if self._scroll_task:
+            self._scroll_task.cancel()
 
     def __init__(
         self,
@@ -36,50 +34,43 @@ class MarqueeText(Text):
             },
         )
 
-        self._stop_scroll_event = None
+        self._scroll_task = None
 
     @property
     def needs_scrolling(self) -> bool:
-        text_size = self.get_text_size(self.state["text"], self.state["font"])
+        text_size = get_text_size(self.state["text"], self.state["font"])
         return self.width is not None and self.width < text_size[0]
 
     @property
     def scrolling(self) -> bool:
-        return self._stop_scroll_event and not self._stop_scroll_event.is_set()
+        return self._scroll_task and not self._scroll_task.finished.is_set()
 
     def _start_scrolling(self):
         if not self.scrolling:
-            self._stop_scroll_event = Event()
-            Thread(
-                target=self._scroll, args=[self._stop_scroll_event], daemon=True
-            ).start()
+            self._scroll_task = self.create_task(self._scroll())
 
     def _restart_scrolling(self):
-        if self._stop_scroll_event:
-            self._stop_scroll_event.set()
-            self._stop_scroll_event = None
+        if self._scroll_task:
+            self._scroll_task.cancel()
+            self._scroll_task = None
 
         self.state.update({"offset": DEFAULT_OFFSET_VALUE})
         self._start_scrolling()
 
-    def _scroll(self, stop_event):
-        text_size = self.get_text_size(self.state["text"], self.state["font"])
+    def _scroll(self):
+        text_size = get_text_size(self.state["text"], self.state["font"])
         scroll_len = max(text_size[0] - self.width, 0)
 
-        sleep(self.state["bounce_pause_time"])
+        yield self.state["bounce_pause_time"]
 
         for offset in carousel(scroll_len, step=self.state["step"]):
-            self.active_event.wait()
             self.state.update({"offset": -offset})
 
             sleep_time = self.state["step_time"]
             if offset in (0, scroll_len):
                 sleep_time = self.state["bounce_pause_time"]
 
-            sleep(sleep_time)
-
-            if stop_event.is_set():
-                return
+            yield sleep_time
 
     def on_state_change(self, prev_state):
         # restart scrolling to recreate carousel with new text size if needed
@@ -95,12 +86,14 @@ class MarqueeText(Text):
             self._start_scrolling()
 
         if self.scrolling and not self.needs_scrolling:
-            self._stop_scroll_event.set()
+            self._scroll_task.cancel()
 
-        text_size = self.get_text_size(self.state["text"], self.state["font"])
+        text_size = get_text_size(self.state["text"], self.state["font"])
         offset = self.state["offset"] if self.needs_scrolling else DEFAULT_OFFSET_VALUE
 
-        # crop a section of the provided image to write on top of
+        # crop a section of the provided image to write on top of. The full text
+        # strip is rasterized once by Text and cached so scrolling only pastes
+        # the cached strip at the new offset
         crop = image.crop((offset, 0, text_size[0], image.height))
 
         image.paste(
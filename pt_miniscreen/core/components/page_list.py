@@ -1,4 +1,7 @@
 import logging
+import threading
+
+from PIL import Image
 
 from .list import List
 
@@ -6,11 +9,27 @@ logger = logging.getLogger(__name__)
 
 
 class PageList(List):
+    def cleanup(self):
+        # prefetched pages are not children until they are used so they are
+        # cleaned up here, pages still being prefetched are dropped when done
+        if hasattr(self, "_prefetch_condition"):
+            with self._prefetch_condition:
+                self._prefetch_cleaned_up = True
+                prefetched_pages = list(self._prefetched_pages.values())
+                self._prefetched_pages = {}
+
+            for page in prefetched_pages:
+                page._cleanup()
+
+        super().cleanup()
+
     def __init__(
         self,
         Pages,
         num_visible_rows=None,  # take num_visible_rows out of kwargs
         row_gap=None,  # take row_gap out of kwargs
+        prefetch=False,
+        prefetch_delay=0.5,
         **kwargs,
     ):
         super().__init__(
@@ -20,6 +39,154 @@ class PageList(List):
             row_gap=0,
         )
 
+        # virtual page lists can create and render the pages next to the current
+        # page in the background so scrolling to them does not wait for them
+        self._prefetch = prefetch and self._virtual
+        self._prefetch_delay = prefetch_delay
+        self._prefetch_task = None
+        self._prefetch_condition = threading.Condition()
+        self._prefetched_pages = {}
+        self._prefetching = set()  # indexes of pages being prefetched
+        self._prefetch_cleaned_up = False
+        self._schedule_prefetch()
+
     @property
     def current_page(self):
         return self.visible_rows[0]
+
+    def _schedule_prefetch(self):
+        if not self._prefetch:
+            return
+
+        # wait for the user to stay on the page before prefetching
+        if self._prefetch_task:
+            self._prefetch_task.cancel()
+
+        self._prefetch_task = self.create_task(self._prefetch_after_delay())
+
+    def _prefetch_after_delay(self):
+        yield self._prefetch_delay
+        self._prefetch_adjacent_pages()
+
+    def _get_adjacent_indexes(self):
+        top_row_index = self.state["top_row_index"]
+        return [
+            index
+            for index in (top_row_index + 1, top_row_index - 1)
+            if 0 <= index < len(self.state["Rows"])
+        ]
+
+    def _prefetch_adjacent_pages(self):
+        if self.state["active_transition"] is not None:
+            return
+
+        for index in self._get_adjacent_indexes():
+            # pages being prefetched are marked so scrolling to them waits for
+            # them rather than creating them again
+            with self._prefetch_condition:
+                if (
+                    self._prefetch_cleaned_up
+                    or index in self._prefetched_pages
+                    or index in self._prefetching
+                ):
+                    continue
+
+                self._prefetching.add(index)
+
+            try:
+                page = self._create_prefetched_page(index)
+            except Exception:
+                with self._prefetch_condition:
+                    self._prefetching.discard(index)
+                    self._prefetch_condition.notify_all()
+                raise
+
+            self._add_prefetched_page(index, page)
+            logger.debug(f"{self} prefetched page {index}")
+
+        self._remove_stale_pages()
+
+    def _create_prefetched_page(self, index):
+        # pages are created without being added as children, since children
+        # are iterated while rendering on other threads. They are added when
+        # they are scrolled to.
+        page = self.state["Rows"][index](on_rerender=self._reconcile)
+
+        # render the page so its first frame is cached, pages are paused
+        # until they are scrolled to
+        if self.row_size:
+            page.render(Image.new("1", self.row_size))
+        page._set_active(False)
+
+        return page
+
+    def _add_prefetched_page(self, index, page):
+        with self._prefetch_condition:
+            self._prefetching.discard(index)
+            self._prefetch_condition.notify_all()
+
+            # pages prefetched after the list was cleaned up are dropped
+            if self._prefetch_cleaned_up:
+                replaced_page = page
+            else:
+                replaced_page = self._prefetched_pages.get(index)
+                self._prefetched_pages[index] = page
+
+        if replaced_page is not None:
+            replaced_page._cleanup()
+
+    def _remove_stale_pages(self):
+        adjacent_indexes = self._get_adjacent_indexes()
+        with self._prefetch_condition:
+            stale_indexes = [
+                index
+                for index in self._prefetched_pages
+                if index not in adjacent_indexes
+            ]
+            stale_pages = [self._prefetched_pages.pop(index) for index in stale_indexes]
+
+        for page in stale_pages:
+            page._cleanup()
+
+    def _remove_rows(self, rows, top_row_index):
+        if not self._prefetch:
+            return super()._remove_rows(rows, top_row_index)
+
+        # pages next to the new page are kept so scrolling back to them does
+        # not create them again
+        adjacent_indexes = (top_row_index - 1, top_row_index + 1)
+        removed_rows = []
+        for index, row in rows:
+            if index not in adjacent_indexes:
+                removed_rows.append((index, row))
+                continue
+
+            self._children.remove(row)
+            row._set_active(False)
+            self._add_prefetched_page(index, row)
+
+        super()._remove_rows(removed_rows, top_row_index)
+
+    def _create_row(self, index):
+        with self._prefetch_condition:
+            self._prefetch_condition.wait_for(lambda: index not in self._prefetching)
+            page = self._prefetched_pages.pop(index, None)
+
+        if page is None:
+            return super()._create_row(index)
+
+        logger.debug(f"{self} using prefetched page {index}")
+        self._children.append(page)
+        return page
+
+    def on_state_change(self, previous_state):
+        # prefetch pages next to the new page once scrolling has finished
+        if self._prefetch and self.state["active_transition"] is None:
+            if (
+                previous_state["active_transition"] is not None
+                or previous_state["top_row_index"] != self.state["top_row_index"]
+            ):
+                self._remove_stale_pages()
+                self._schedule_prefetch()
+
+        return super().on_state_change(previous_state)
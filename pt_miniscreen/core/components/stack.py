@@ -1,14 +1,23 @@
 import logging
-import threading
 
+from ..animation import Animation, animate, linear
 from ..component import Component
-from ..utils import transition
 
 logger = logging.getLogger(__name__)
 
 
 class Stack(Component):
     transition_duration = 0.25
+    transition_easing = staticmethod(linear)
+
+    # Components are snapshot when a transition starts and the snapshots are
+    # moved on each step rather than rendering the components again. Only the
+    # background is snapshot unless snapshot_foreground is True since pushed
+    # components often fill in their content as they slide in. Components keep
+    # updating during transitions when live_transitions is True.
+    live_transitions = False
+    snapshot_foreground = False
+
     width = 0
     default_state = {
         "x_position": 0,
@@ -17,13 +26,9 @@ class Stack(Component):
         "elements_to_pop": 0,
     }
 
-    def cleanup(self):
-        self._cleanup_transition.set()
-
     def __init__(self, initial_stack=[], **kwargs):
         super().__init__(**kwargs)
-
-        self._cleanup_transition = threading.Event()
+        self._snapshots = {}
 
         # setup initial stack
         self.state["stack"] = [
@@ -57,33 +62,32 @@ class Stack(Component):
     def stack(self):
         return self.state["stack"]
 
+    def _animate_x_position(self, start, end):
+        animation = Animation(
+            start=start,
+            end=end,
+            duration=self.transition_duration,
+            easing=self.transition_easing,
+        )
+
+        # x_position is rounded to whole pixels so frames are only rendered when
+        # the components move
+        return animate(
+            animation,
+            lambda x_position: self.state.update({"x_position": int(x_position)}),
+        )
+
     def _push_transition(self):
         # only animate transition if we know our width
         if self.width:
-            for step in transition(self.width, self.transition_duration):
-                if self._cleanup_transition.is_set():
-                    return
-
-                self.state.update(
-                    {"x_position": min(self.width, self.state["x_position"] - step)}
-                )
+            yield from self._animate_x_position(self.width, 0)
 
         self.state.update({"active_transition": None})
 
     def _pop_transition(self, elements=1):
         # only animate transition if we know our width
         if self.width:
-            for step in transition(self.width * elements, self.transition_duration):
-                if self._cleanup_transition.is_set():
-                    return
-
-                self.state.update(
-                    {
-                        "x_position": min(
-                            self.width * elements, self.state["x_position"] + step
-                        )
-                    }
-                )
+            yield from self._animate_x_position(0, self.width * elements)
 
         stack = self.state["stack"]
         for _ in range(elements):
@@ -118,7 +122,7 @@ class Stack(Component):
             }
         )
 
-        threading.Thread(target=self._push_transition, daemon=True).start()
+        self.create_transition(self._push_transition())
 
     def pop(self, animate=True, elements=1):
         if self.state["active_transition"] is not None:
@@ -152,9 +156,28 @@ class Stack(Component):
             }
         )
 
-        threading.Thread(
-            target=self._pop_transition, args=(elements,), daemon=True
-        ).start()
+        self.create_transition(self._pop_transition(elements))
+
+    def on_state_change(self, previous_state):
+        # take new snapshots for each transition
+        if self.state["active_transition"] != previous_state["active_transition"]:
+            self._snapshots = {}
+
+    def _render_layer(self, component, image, use_snapshot):
+        if not use_snapshot:
+            return component.render(image)
+
+        # snapshots are copied since render outputs can be the image passed to
+        # render, which is pasted onto. Components are still marked as rendered
+        # so they stay active during the transition.
+        snapshot = self._snapshots.get(component)
+        if snapshot is None or snapshot.size != image.size:
+            snapshot = component.render(image).copy()
+            self._snapshots[component] = snapshot
+        else:
+            component.rendered = True
+
+        return snapshot
 
     def render(self, image):
         if len(self.state["stack"]) == 0:
@@ -162,11 +185,15 @@ class Stack(Component):
 
         x_position = self.state["x_position"]
         foreground_component = self.state["stack"][-1]
-        foreground_layer = foreground_component.render(image)
 
         # if no active transition only the top component needs to be rendered
         if not self.state["active_transition"]:
-            return foreground_layer
+            return foreground_component.render(image)
+
+        use_snapshots = not self.live_transitions
+        foreground_layer = self._render_layer(
+            foreground_component, image, use_snapshots and self.snapshot_foreground
+        )
 
         # crop foreground so it can be offset to the right by x_position
         crop_boundaries = (0, 0, image.size[0] - x_position, image.size[1])
@@ -180,12 +207,14 @@ class Stack(Component):
             )
             return image
 
-        # render background layer and paste foreground offset to the right by x_position
+        # render background layer and paste foreground offset to the right by
+        # x_position, rendered layers are cached so paste them onto image rather
+        # than mutating them
         background_component = self.state["stack"][-2]
-        background_layer = background_component.render(image)
-        background_layer.paste(
+        image.paste(self._render_layer(background_component, image, use_snapshots))
+        image.paste(
             cropped_foreground_layer,
             (image.size[0] - cropped_foreground_layer.size[0], 0),
         )
 
-        return background_layer
+        return image
@@ -1,18 +1,36 @@
 import logging
-from functools import lru_cache
+from math import ceil, floor
 
 import PIL.Image
 import PIL.ImageDraw
 import PIL.ImageFont
 
-from pt_miniscreen.core.utils import get_font
+from pt_miniscreen.core.utils import get_font, get_font_key
 
 from .. import Component
+from ..cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
+# pixels of padding around rasterized text in case glyphs draw outside their box
+TEXT_MASK_PADDING = 2
 
-def get_text_size(text, font):
+# Rasterized text is shared by every Text component in the process. Text is
+# stored as a mask so it can be drawn with any fill, and the cache is bounded by
+# the memory used by the masks. PIL stores a byte per pixel for 1-bit images.
+text_raster_cache = LRUCache(
+    max_size=1024 * 1024,
+    get_size=lambda entry: entry[0].width * entry[0].height,
+)
+
+# Text measurements and wrapped text are also shared by every component, fonts
+# are keyed by get_font_key so separately loaded fonts share entries
+text_size_cache = LRUCache(max_size=4096)
+text_length_cache = LRUCache(max_size=4096)
+wrapped_text_cache = LRUCache(max_size=512)
+
+
+def _measure_text_size(text, font):
     draw = PIL.ImageDraw.Draw(PIL.Image.new("1", (0, 0), color="black"))
     bounding_box = draw.textbbox(
         (0, 0),
@@ -25,26 +43,127 @@ def get_text_size(text, font):
     )
 
 
-def create_wrapped_text(text, font, max_width):
-    words = text.split(" ")
-    words.reverse()  # reverse words to avoid costly list operations later
-    lines = [words.pop()]  # setup first line to equal first word
+def get_text_size(text, font):
+    return text_size_cache.get_or_create(
+        (text, get_font_key(font)), lambda: _measure_text_size(text, font)
+    )
+
+
+def _measure_text_length(text, font):
+    # bitmap fonts can't measure advances so use the width of the text instead
+    if not hasattr(font, "getlength"):
+        return get_text_size(text, font)[0]
+
+    return font.getlength(text)
+
 
-    while len(words) > 0:
-        word = words.pop()
+def get_text_length(text, font):
+    return text_length_cache.get_or_create(
+        (text, get_font_key(font)), lambda: _measure_text_length(text, font)
+    )
+
+
+def _fits(words, font, max_width):
+    return get_text_size(" ".join(words), font)[0] < max_width
 
-        # try adding word to the current line and move onto next word if it fits
-        line = f"{lines[-1]} {word}"
-        if get_text_size(line, font)[0] < max_width:
-            lines[-1] = line
-            continue
 
-        # word doesn't fit on current line so use it to create next line
-        lines.append(word)
+def _wrap_text(text, font, max_width):
+    words = text.split(" ")
+    space_length = get_text_length(" ", font)
+    lines = []
+    start = 0
+
+    while start < len(words):
+        # estimate the words that fit on the line by summing the advances of
+        # the words, which are only measured once
+        end = start + 1
+        length = get_text_length(words[start], font)
+        while end < len(words):
+            length += space_length + get_text_length(words[end], font)
+            if length >= max_width:
+                break
+            end += 1
+
+        # the size of a line is not the sum of its words so correct the
+        # estimate by measuring the line, the first word is always used even
+        # if it doesn't fit
+        while end > start + 1 and not _fits(words[start:end], font, max_width):
+            end -= 1
+
+        while end < len(words) and _fits(words[start : end + 1], font, max_width):
+            end += 1
+
+        lines.append(" ".join(words[start:end]))
+        start = end
 
     return "\n".join(lines)
 
 
+def create_wrapped_text(text, font, max_width):
+    return wrapped_text_cache.get_or_create(
+        (text, get_font_key(font), max_width),
+        lambda: _wrap_text(text, font, max_width),
+    )
+
+
+def get_text_mask(text, font, spacing=0, align="left", anchor=None):
+    return text_raster_cache.get_or_create(
+        (text, get_font_key(font), spacing, align, anchor),
+        lambda: _rasterize_text(text, font, spacing, align, anchor),
+    )
+
+
+def _rasterize_text(text, font, spacing, align, anchor):
+    draw = PIL.ImageDraw.Draw(PIL.Image.new("1", (0, 0), color="black"))
+    bounding_box = draw.textbbox(
+        (0, 0), text=text, font=font, spacing=spacing, align=align, anchor=anchor
+    )
+
+    # draw text at an integer offset so the mask matches text drawn elsewhere
+    left = floor(bounding_box[0])
+    top = floor(bounding_box[1])
+    origin = (TEXT_MASK_PADDING - left, TEXT_MASK_PADDING - top)
+    mask = PIL.Image.new(
+        "1",
+        (
+            ceil(bounding_box[2]) - left + 2 * TEXT_MASK_PADDING,
+            ceil(bounding_box[3]) - top + 2 * TEXT_MASK_PADDING,
+        ),
+    )
+    PIL.ImageDraw.Draw(mask).text(
+        origin,
+        text=text,
+        font=font,
+        fill=1,
+        spacing=spacing,
+        align=align,
+        anchor=anchor,
+    )
+
+    return (mask, origin)
+
+
+def draw_text(image, xy, text, font, fill=1, spacing=0, align="left", anchor=None):
+    # masks are not antialiased so only use them for 1-bit images. Centered
+    # multiline text can be drawn at fractional positions which round
+    # differently when negative, draw these directly so output is unchanged
+    if image.mode != "1" or ("\n" in text and align == "center" and xy[0] < 0):
+        PIL.ImageDraw.Draw(image).text(
+            xy,
+            text=text,
+            font=font,
+            fill=fill,
+            spacing=spacing,
+            align=align,
+            anchor=anchor,
+        )
+        return image
+
+    mask, origin = get_text_mask(text, font, spacing, align, anchor)
+    image.paste(fill, (xy[0] - origin[0], xy[1] - origin[1]), mask)
+    return image
+
+
 class Text(Component):
     size = (0, 0)
 
@@ -82,10 +201,6 @@ class Text(Component):
             },
         )
 
-        # Memoize expensive methods
-        self.get_text_size = lru_cache(get_text_size)
-        self.create_wrapped_text = lru_cache(create_wrapped_text)
-
         # start polling text if get_text is callable
         if callable(self._get_text):
             self.create_interval(self._update_text, get_text_interval)
@@ -94,7 +209,7 @@ class Text(Component):
         self.state.update({"text": self._get_text()})
 
     def _calculate_text_x(self, text, font, width):
-        text_size = self.get_text_size(text, font)
+        text_size = get_text_size(text, font)
 
         if self.state["align"] == "center":
             return int((width - text_size[0]) / 2)
@@ -105,7 +220,7 @@ class Text(Component):
         return 0
 
     def _calculate_text_y(self, text, font, height):
-        text_size = self.get_text_size(text, font)
+        text_size = get_text_size(text, font)
 
         if self.state["vertical_align"] == "center":
             return int((height - text_size[1]) / 2)
@@ -124,7 +239,7 @@ class Text(Component):
 
         text = self.state["text"]
         if self.state["wrap"]:
-            text = self.create_wrapped_text(text, font, image.width)
+            text = create_wrapped_text(text, font, image.width)
 
         xy = (
             self._calculate_text_x(text, font, image.width),
@@ -134,14 +249,13 @@ class Text(Component):
         # multiline doesn't support anchor so pass none if any newlines found
         anchor = "lt" if "\n" not in text else None
 
-        PIL.ImageDraw.Draw(image).text(
+        return draw_text(
+            image,
+            xy,
             text=text,
-            xy=xy,
             font=font,
             fill=self.state["fill"],
             spacing=self.state["spacing"],
             align=self.state["align"],
             anchor=anchor,
         )
-
-        return image
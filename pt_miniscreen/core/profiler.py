@@ -0,0 +1,250 @@
+import logging
+import signal
+from os import environ
+from threading import Event, Lock, Thread, current_thread, local, main_thread
+from time import perf_counter
+from weakref import WeakKeyDictionary
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE_FILE = "/tmp/pt-miniscreen-profile.txt"
+DEFAULT_PROFILE_INTERVAL = 10
+
+
+class RenderStats:
+    __slots__ = (
+        "name",
+        "renders",
+        "cache_hits",
+        "cache_misses",
+        "total_time",
+        "self_time",
+        "max_time",
+        "reconciles",
+        "lock_wait_time",
+    )
+
+    def __init__(self, name):
+        self.name = name
+        self.renders = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.total_time = 0
+        self.self_time = 0
+        self.max_time = 0
+        self.reconciles = 0
+        self.lock_wait_time = 0
+
+    @property
+    def cache_hit_rate(self):
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else None
+
+    def as_dict(self):
+        return {
+            "name": self.name,
+            "renders": self.renders,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_rate": self.cache_hit_rate,
+            "total_time": self.total_time,
+            "self_time": self.self_time,
+            "max_time": self.max_time,
+            "reconciles": self.reconciles,
+            "lock_wait_time": self.lock_wait_time,
+        }
+
+
+# Records render statistics for every component class and instance while
+# enabled. Render times include the time spent rendering children, the time
+# spent in the component's own render method is recorded separately as self
+# time. Recording is skipped entirely by components while disabled.
+class Profiler:
+    def __init__(self):
+        self.enabled = False
+        self._lock = Lock()
+        self._renders = local()
+        self._class_stats = {}
+        self._instance_stats = WeakKeyDictionary()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self._class_stats = {}
+            self._instance_stats = WeakKeyDictionary()
+
+    def _get_stats(self, component):
+        # must be called while holding the lock
+        cls = type(component)
+        class_stats = self._class_stats.get(cls)
+        if class_stats is None:
+            class_stats = self._class_stats[cls] = RenderStats(cls.__qualname__)
+
+        instance_stats = self._instance_stats.get(component)
+        if instance_stats is None:
+            instance_stats = self._instance_stats[component] = RenderStats(
+                f"{cls.__qualname__}@{id(component):x}"
+            )
+
+        return class_stats, instance_stats
+
+    def record_cache_lookup(self, component, hit):
+        with self._lock:
+            for stats in self._get_stats(component):
+                if hit:
+                    stats.cache_hits += 1
+                else:
+                    stats.cache_misses += 1
+
+    def start_render(self):
+        # renders are nested when parents render children, a stack of the time
+        # spent in children is kept per thread so self time can be calculated
+        stack = getattr(self._renders, "stack", None)
+        if stack is None:
+            stack = self._renders.stack = []
+
+        stack.append(0)
+        return perf_counter()
+
+    def end_render(self, component, start_time):
+        render_time = perf_counter() - start_time
+        stack = self._renders.stack
+        children_time = stack.pop()
+        if stack:
+            stack[-1] += render_time
+
+        with self._lock:
+            for stats in self._get_stats(component):
+                stats.renders += 1
+                stats.total_time += render_time
+                stats.self_time += render_time - children_time
+                stats.max_time = max(stats.max_time, render_time)
+
+    def record_reconcile(self, component, lock_wait_time):
+        with self._lock:
+            for stats in self._get_stats(component):
+                stats.reconciles += 1
+                stats.lock_wait_time += lock_wait_time
+
+    def class_stats(self):
+        with self._lock:
+            return [stats.as_dict() for stats in self._class_stats.values()]
+
+    def instance_stats(self):
+        with self._lock:
+            return [stats.as_dict() for stats in self._instance_stats.values()]
+
+    def format_table(self, limit=20):
+        def format_rows(title, rows):
+            rows = sorted(rows, key=lambda row: row["total_time"], reverse=True)
+            lines = [
+                title,
+                f"{'component':<40} {'renders':>8} {'hit rate':>8} "
+                f"{'total ms':>10} {'self ms':>10} {'max ms':>8} "
+                f"{'reconciles':>10} {'wait ms':>8}",
+            ]
+
+            for row in rows[:limit]:
+                hit_rate = row["cache_hit_rate"]
+                lines.append(
+                    f"{row['name'][:40]:<40} {row['renders']:>8} "
+                    f"{'-' if hit_rate is None else f'{hit_rate:.0%}':>8} "
+                    f"{row['total_time'] * 1000:>10.1f} "
+                    f"{row['self_time'] * 1000:>10.1f} "
+                    f"{row['max_time'] * 1000:>8.1f} "
+                    f"{row['reconciles']:>10} "
+                    f"{row['lock_wait_time'] * 1000:>8.1f}"
+                )
+
+            return lines
+
+        lines = format_rows("Components by class", self.class_stats())
+        lines.append("")
+        lines += format_rows("Components by instance", self.instance_stats())
+        return "\n".join(lines)
+
+    def dump(self, path=None):
+        table = self.format_table()
+        if path is None:
+            logger.info(f"Render profile:\n{table}")
+            return
+
+        with open(path, "w") as file:
+            file.write(table + "\n")
+
+
+profiler = Profiler()
+
+
+# set by the SIGUSR1 handler and handled by a separate thread
+_dump_signal_event = Event()
+_dump_signal_thread = None
+
+
+def _handle_dump_signal(signum, frame):
+    # the handler runs on the main thread between any two bytecodes, so logging
+    # or taking the profiler's lock here deadlocks if the main thread already
+    # holds that lock. The signal is handled by another thread instead.
+    _dump_signal_event.set()
+
+
+def _handle_dump_signals():
+    while True:
+        _dump_signal_event.wait()
+        _dump_signal_event.clear()
+
+        # the first signal starts profiling when it was not enabled on startup
+        if not profiler.enabled:
+            logger.info("Render profiling enabled, send signal again to dump stats")
+            profiler.enable()
+            continue
+
+        profiler.dump()
+
+
+def _dump_periodically(path, interval, stop_event):
+    while not stop_event.wait(interval):
+        try:
+            profiler.dump(path)
+        except OSError as e:
+            logger.warning(f"Unable to write render profile to {path}: {e}")
+
+
+def setup_profiler():
+    global _dump_signal_thread
+
+    # signals can only be handled by the main thread
+    if current_thread() is main_thread() and hasattr(signal, "SIGUSR1"):
+        if _dump_signal_thread is None:
+            _dump_signal_thread = Thread(
+                target=_handle_dump_signals,
+                name="pt-miniscreen-profiler-signal",
+                daemon=True,
+            )
+            _dump_signal_thread.start()
+
+        signal.signal(signal.SIGUSR1, _handle_dump_signal)
+
+    if environ.get("PT_MINISCREEN_PROFILE", "0") != "1":
+        return None
+
+    path = environ.get("PT_MINISCREEN_PROFILE_FILE", DEFAULT_PROFILE_FILE)
+    interval = float(
+        environ.get("PT_MINISCREEN_PROFILE_INTERVAL", DEFAULT_PROFILE_INTERVAL)
+    )
+    logger.info(f"Render profiling enabled, writing stats to {path}")
+
+    profiler.enable()
+    stop_event = Event()
+    Thread(
+        target=_dump_periodically,
+        args=[path, interval, stop_event],
+        name="pt-miniscreen-profiler",
+        daemon=True,
+    ).start()
+    return stop_event
@@ -0,0 +1,145 @@
+import logging
+import struct
+import zlib
+from collections import deque
+from pathlib import Path
+from threading import Event, Thread
+from time import monotonic, time
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"PTMSREC1"
+
+# magic, frame width, frame height and wall clock time the recording started
+HEADER = struct.Struct("<8sHHd")
+
+# seconds since the recording started and length of the compressed frame
+FRAME_HEADER = struct.Struct("<dI")
+
+
+# Records displayed frames without slowing down the display path. Frames are
+# stored as packed 1-bit data, 1 KB for a 128x64 frame, in a ring buffer and a
+# background thread compresses and appends them to a single file. When the
+# buffer fills up before it is flushed the oldest frames are dropped.
+class FrameRecorder:
+    def __init__(self, path, capacity=512, flush_interval=1):
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+        self.recorded_frames = 0
+        self.dropped_frames = 0
+        self.written_bytes = 0
+
+        self._frames = deque(maxlen=capacity)
+        self._size = None
+        self._start_time = monotonic()
+        self._start_wall_time = time()
+        self._stop_event = Event()
+        self._thread = Thread(
+            target=self._flush_periodically, name="pt-miniscreen-recorder", daemon=True
+        )
+        self._thread.start()
+
+    def record(self, image):
+        if image.mode != "1":
+            image = image.convert("1")
+
+        if len(self._frames) == self._frames.maxlen:
+            self.dropped_frames += 1
+
+        timestamp = monotonic() - self._start_time
+        self._frames.append((timestamp, image.size, image.tobytes()))
+        self.recorded_frames += 1
+
+    def _write_header(self, file, size):
+        if file.tell() == 0:
+            file.write(HEADER.pack(MAGIC, *size, self._start_wall_time))
+            self._size = size
+
+    def flush(self):
+        if not self._frames:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "ab") as file:
+            while self._frames:
+                timestamp, size, data = self._frames.popleft()
+                self._write_header(file, size)
+
+                # frames must all be the size written in the header
+                if size != self._size:
+                    logger.warning(f"Not recording frame of size {size}")
+                    continue
+
+                compressed = zlib.compress(data)
+                file.write(FRAME_HEADER.pack(timestamp, len(compressed)))
+                file.write(compressed)
+                self.written_bytes += FRAME_HEADER.size + len(compressed)
+
+    def _flush_periodically(self):
+        while not self._stop_event.wait(self.flush_interval):
+            try:
+                self.flush()
+            except OSError as e:
+                logger.error(f"Unable to write frames to {self.path}: {e}")
+                return
+
+    def close(self):
+        self._stop_event.set()
+        self._thread.join()
+        self.flush()
+
+
+class Recording:
+    def __init__(self, path):
+        self.path = Path(path)
+
+        with open(self.path, "rb") as file:
+            file_size = file.seek(0, 2)
+            file.seek(0)
+            magic, width, height, start_time = HEADER.unpack(file.read(HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"{self.path} is not a miniscreen recording")
+
+            self.size = (width, height)
+            self.start_time = start_time
+            self._frames = []
+
+            # store the position of each frame so frames are decoded on demand
+            while True:
+                frame_header = file.read(FRAME_HEADER.size)
+                if len(frame_header) < FRAME_HEADER.size:
+                    break
+
+                # ignore frames that were not fully written
+                timestamp, length = FRAME_HEADER.unpack(frame_header)
+                if file.tell() + length > file_size:
+                    break
+
+                self._frames.append((timestamp, file.tell(), length))
+                file.seek(length, 1)
+
+    def __len__(self):
+        return len(self._frames)
+
+    @property
+    def timestamps(self):
+        return [timestamp for timestamp, _, _ in self._frames]
+
+    @property
+    def intervals(self):
+        timestamps = self.timestamps
+        return [end - start for start, end in zip(timestamps, timestamps[1:])]
+
+    def get_frame(self, index):
+        _, offset, length = self._frames[index]
+        with open(self.path, "rb") as file:
+            file.seek(offset)
+            data = zlib.decompress(file.read(length))
+
+        return Image.frombytes("1", self.size, data)
+
+    def __iter__(self):
+        for index, (timestamp, _, _) in enumerate(self._frames):
+            yield timestamp, self.get_frame(index)
@@ -0,0 +1,282 @@
+import heapq
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from time import monotonic
+from weakref import WeakMethod, ref
+
+logger = logging.getLogger(__name__)
+
+
+# Times every interval and animation on a single thread so that the number of
+# threads and wakeups does not grow with the number of components. Jobs are
+# objects with a `run` method that returns the delay in seconds until they
+# should run again, or None when they should not be run again. Due jobs are run
+# by a small pool of workers so a job that blocks, such as one polling a slow
+# command, does not delay other jobs. A job is only scheduled again once it has
+# finished running so it never runs concurrently with itself.
+class Scheduler:
+    # number of threads used to run due jobs
+    max_workers = 4
+
+    def __init__(self, name="pt-miniscreen", max_workers=None):
+        self.name = name
+        self._queue = []
+        self._counter = count()  # breaks ties between jobs due at the same time
+        self._condition = threading.Condition()
+        self._thread = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers if max_workers is None else max_workers,
+            thread_name_prefix=f"{name}-job",
+        )
+        self.wakeups = 0
+
+    def _ensure_thread(self):
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name=f"{self.name}-scheduler", daemon=True
+            )
+            self._thread.start()
+
+    def schedule(self, job, delay=0, start_time=None):
+        start_time = monotonic() if start_time is None else start_time
+        with self._condition:
+            heapq.heappush(
+                self._queue, (start_time + max(delay, 0), next(self._counter), job)
+            )
+            self._ensure_thread()
+            self._condition.notify()
+
+    @property
+    def num_jobs(self):
+        return len(self._queue)
+
+    def _pop_due_job(self):
+        with self._condition:
+            while True:
+                timeout = self._queue[0][0] - monotonic() if self._queue else None
+                if timeout is not None and timeout <= 0:
+                    return heapq.heappop(self._queue)
+
+                self._condition.wait(timeout)
+                self.wakeups += 1
+
+    def _run_next(self):
+        due_time, _, job = self._pop_due_job()
+
+        if job.finished.is_set():
+            return
+
+        lag = monotonic() - due_time
+        if lag > 0.1:
+            logger.debug(f"{job} lagging by {lag}s")
+
+        self._executor.submit(self._run_job, job)
+
+    def _run_job(self, job):
+        start_time = monotonic()
+        try:
+            delay = job.run()
+        except Exception:
+            logger.exception(f"Error running {job}")
+            job.cancel()
+            return
+
+        if delay is not None:
+            # take execution time into account to produce more accurate delays
+            self.schedule(job, delay, start_time)
+
+    def _run(self):
+        while True:
+            # jobs are only referenced inside _run_next so that cancelled jobs
+            # can be garbage collected while the scheduler is waiting
+            self._run_next()
+
+
+_scheduler = None
+_animation_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler():
+    global _scheduler
+
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = Scheduler()
+
+        return _scheduler
+
+
+# Transitions are timed by their own scheduler and stepped by a single worker so
+# that intervals, however long they block, never delay their frames.
+def get_animation_scheduler():
+    global _animation_scheduler
+
+    with _scheduler_lock:
+        if _animation_scheduler is None:
+            _animation_scheduler = Scheduler(
+                name="pt-miniscreen-animation", max_workers=1
+            )
+
+        return _animation_scheduler
+
+
+# Base class for jobs that only run while the component that created them is
+# active. When a job is due but its component is paused it is parked rather
+# than scheduled and `resume` must be called to schedule it again. Jobs that
+# are paused and resumed while waiting to run also wait the resume delay. Jobs
+# without an active_event are never paused. Jobs are run by the shared scheduler
+# unless another scheduler is passed.
+class PausableJob:
+    # seconds to wait before running a job that has been resumed
+    resume_delay = 0
+
+    def __init__(self, active_event=None, scheduler=None):
+        self._scheduler = scheduler
+        if active_event is None:
+            self.get_active_event = lambda: None
+        else:
+            self.get_active_event = ref(active_event)
+
+        self.finished = threading.Event()
+        self._lock = threading.Lock()
+        self._parked = False
+        self._paused = False
+        self._resume_time = None
+
+    @property
+    def scheduler(self):
+        return get_scheduler() if self._scheduler is None else self._scheduler
+
+    @property
+    def active(self):
+        active_event = self.get_active_event()
+        return not isinstance(active_event, threading.Event) or active_event.is_set()
+
+    def _park(self):
+        with self._lock:
+            # check again while locked in case component was resumed meanwhile
+            if self.active:
+                return False
+
+            self._parked = True
+            return True
+
+    def pause(self):
+        with self._lock:
+            self._paused = True
+
+    def resume(self):
+        with self._lock:
+            paused = self._paused
+            self._paused = False
+
+            if self.finished.is_set():
+                return
+
+            if not self._parked:
+                if paused:
+                    self._resume_time = monotonic()
+                return
+
+            self._parked = False
+
+        self.scheduler.schedule(self, self.resume_delay)
+
+    # returns the seconds left to wait when resumed while waiting to run
+    def _get_resume_wait(self):
+        with self._lock:
+            resume_time = self._resume_time
+            self._resume_time = None
+
+        if resume_time is None:
+            return 0
+
+        return resume_time + self.resume_delay - monotonic()
+
+    def cancel(self):
+        self.finished.set()
+
+
+# Interval shares the threading.Timer API for backwards compatibility
+class Interval(PausableJob):
+    def __init__(self, interval, function, args=None, kwargs=None, active_event=None):
+        super().__init__(active_event=active_event)
+        self.interval = interval
+        self.function = function
+        self.args = args if args is not None else []
+        self.kwargs = kwargs if kwargs is not None else {}
+
+    @property
+    def function(self):
+        return self._get_function()
+
+    @function.setter
+    def function(self, next_value):
+        # Use a WeakMethod to store the function so that the Interval does not
+        # produce a circular reference with the Component that created it which
+        # would result in memory leaks.
+        self._get_function = WeakMethod(next_value)
+
+    @property
+    def resume_delay(self):
+        # wait a full interval after being resumed
+        return self.interval
+
+    def start(self):
+        if self._park():
+            return
+
+        self.scheduler.schedule(self, self.interval)
+
+    def run(self):
+        # stop interval if parent has been cleaned up
+        function = self.function
+        if function is None:
+            self.cancel()
+            return None
+
+        # components that were paused and resumed while the interval was waiting,
+        # such as prefetched pages, wait a full interval after being resumed
+        resume_wait = self._get_resume_wait()
+        if resume_wait > 0:
+            return resume_wait
+
+        function(*self.args, **self.kwargs)
+        del function
+
+        # wait for component to be active before starting next interval
+        if self.finished.is_set() or self._park():
+            return None
+
+        return self.interval
+
+
+# Task runs a generator on the scheduler, the generator yields the number of
+# seconds to wait before it should be resumed. When a task is due while its
+# component is paused it is resumed as soon as the component is active again.
+class Task(PausableJob):
+    def __init__(self, generator, active_event=None, scheduler=None):
+        super().__init__(active_event=active_event, scheduler=scheduler)
+        self._generator = generator
+
+    def start(self):
+        self.scheduler.schedule(self)
+
+    def run(self):
+        if self._park():
+            return None
+
+        try:
+            return next(self._generator)
+        except StopIteration:
+            self.cancel()
+            return None
+
+    def cancel(self):
+        super().cancel()
+
+        # release references held by the generator
+        self._generator = iter(())
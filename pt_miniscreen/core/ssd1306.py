@@ -0,0 +1,50 @@
+import numpy as np
+
+# command bytes needed to set the column and page address of a write
+ADDRESS_COMMAND_BYTES = 6
+
+# SSD1306 commands used to set the region written to by data
+COLUMNADDR = 0x21
+PAGEADDR = 0x22
+
+
+# The SSD1306 stores pixels in pages of 8 rows, each byte is a column of 8
+# pixels in a page with the top pixel in the least significant bit. Returns an
+# array with a row of column bytes for each page.
+def encode_pages(image):
+    width, height = image.size
+    pixels = np.asarray(image.convert("1"), dtype=bool)
+    pages = pixels.reshape(height // 8, 8, width)
+    return np.packbits(pages, axis=1, bitorder="little").reshape(height // 8, width)
+
+
+# Returns (page, start column, end column) for each run of columns that changed
+# between two page buffers, with the end column excluded. Runs separated by
+# fewer unchanged columns than it costs to address a new run are merged. When
+# the (left, top, right, bottom) pixel region that changed is known only the
+# pages and columns within it are compared.
+def get_changed_runs(previous_pages, pages, max_gap=ADDRESS_COMMAND_BYTES, region=None):
+    if previous_pages is None or previous_pages.shape != pages.shape:
+        return [(page, 0, pages.shape[1]) for page in range(pages.shape[0])]
+
+    left, top, right, bottom = region or (0, 0, pages.shape[1], pages.shape[0] * 8)
+    first_page = top // 8
+    last_page = min(-(-bottom // 8), pages.shape[0])
+    changed_pages = (
+        previous_pages[first_page:last_page, left:right]
+        != pages[first_page:last_page, left:right]
+    )
+
+    runs = []
+    for page, changed in enumerate(changed_pages, start=first_page):
+        columns = np.flatnonzero(changed) + left
+        if len(columns) == 0:
+            continue
+
+        # split columns where the gap between changes is too large to merge
+        splits = np.flatnonzero(np.diff(columns) > max_gap + 1)
+        starts = np.concatenate(([columns[0]], columns[splits + 1]))
+        ends = np.concatenate((columns[splits], [columns[-1]])) + 1
+        runs += [(page, int(start), int(end)) for start, end in zip(starts, ends)]
+
+    return runs
@@ -1,9 +1,11 @@
-from itertools import cycle
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import cycle, product
 from logging import getLogger
-from math import ceil, floor
-from time import sleep, time
+from threading import Lock, Thread, local
+from weakref import ref
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageChops, ImageDraw, ImageFont
 
 logger = getLogger(__name__)
 
@@ -11,20 +13,171 @@ logger = getLogger(__name__)
 
 
 def apply_layers(image, layers):
+    layer_cache = get_layer_cache()
+    if layer_cache is not None:
+        return layer_cache.apply(image, layers)
+
     for layer in layers:
         layer(image)
 
     return image
 
 
+class Layer:
+    def __init__(self, render, size, pos=(0, 0), transparent=True):
+        self.render = render
+        self.size = size
+        self.pos = pos
+        self.transparent = transparent
+        self.bounding_box = (pos[0], pos[1], pos[0] + size[0], pos[1] + size[1])
+
+    @property
+    def component(self):
+        # component whose render method is used by this layer, if any
+        if getattr(self.render, "__name__", None) != "_render":
+            return None
+
+        return getattr(self.render, "__self__", None)
+
+    def __call__(self, image):
+        image.paste(
+            self.render(
+                image.crop(self.bounding_box)
+                if self.transparent
+                else Image.new("1", self.size)
+            ),
+            self.pos,
+        )
+
+
 def layer(render, size, pos=(0, 0), transparent=True):
-    bounding_box = (pos[0], pos[1], pos[0] + size[0], pos[1] + size[1])
-    return lambda image: image.paste(
-        render(image.crop(bounding_box) if transparent else Image.new("1", size)),
-        pos,
+    return Layer(render, size, pos, transparent)
+
+
+def _intersects(box, boxes):
+    return any(
+        box[0] < other[2]
+        and other[0] < box[2]
+        and box[1] < other[3]
+        and other[1] < box[3]
+        for other in boxes
     )
 
 
+_render_context = local()
+
+
+def get_layer_cache():
+    renders = getattr(_render_context, "renders", None)
+    return renders[-1] if renders else None
+
+
+# Remembers the layers applied by a component's render so that when the
+# component rerenders because one of its children changed, the cached output of
+# children that have not changed can be pasted without cropping the image and
+# comparing the crop to the child's cached input. A child has changed (is
+# dirty) when the version of its cached output differs from the version used
+# last time. Cached outputs are only reused when the image passed to
+# apply_layers and the component's own state are unchanged, and the layer's
+# region has not been changed by a layer applied before it.
+class LayerCache:
+    def __init__(self):
+        self._records = {}
+        self._lock = Lock()
+        self.reused_layers = 0
+        self.applied_layers = 0
+
+    @contextmanager
+    def rendering(self, reuse=True):
+        renders = getattr(_render_context, "renders", None)
+        if renders is None:
+            renders = _render_context.renders = []
+
+        # apply_layers can be called more than once per render so calls are
+        # told apart by the order they happen in
+        render = _LayerCacheRender(self, reuse)
+        renders.append(render)
+        try:
+            yield render
+        finally:
+            renders.pop()
+
+    def apply(self, image, layers, call_index=0, reuse=True):
+        input_key = get_image_key(image)
+        with self._lock:
+            previous_input_key, previous_records = self._records.get(
+                call_index, (None, [])
+            )
+
+        reuse = reuse and input_key == previous_input_key
+
+        # regions of the image that may differ from last time
+        damage = []
+        records = []
+        for position, layer in enumerate(layers):
+            component = layer.component if isinstance(layer, Layer) else None
+            if component is None:
+                # other layers are always applied and can change their region
+                layer(image)
+                damage.append(
+                    layer.bounding_box
+                    if isinstance(layer, Layer)
+                    else (0, 0, image.width, image.height)
+                )
+                records.append(None)
+                continue
+
+            record = (ref(component), layer.bounding_box, layer.transparent)
+            last = (
+                previous_records[position] if position < len(previous_records) else None
+            )
+            same_layer = reuse and last is not None and last[:3] == record
+            region_changed = layer.transparent and _intersects(
+                layer.bounding_box, damage
+            )
+
+            if (
+                same_layer
+                and not region_changed
+                and component._render_cache.version == last[3]
+            ):
+                # paste the clean child's cached output
+                component.rendered = True
+                image.paste(component._render_cache.output, layer.pos)
+                records.append(last)
+                self.reused_layers += 1
+                continue
+
+            layer(image)
+            self.applied_layers += 1
+
+            version = component._render_cache.version
+            records.append(record + (version,))
+            if not same_layer or region_changed or version != last[3]:
+                damage.append(layer.bounding_box)
+
+        with self._lock:
+            self._records[call_index] = (input_key, records)
+
+        return image
+
+    def clear(self):
+        with self._lock:
+            self._records = {}
+
+
+class _LayerCacheRender:
+    def __init__(self, layer_cache, reuse):
+        self.layer_cache = layer_cache
+        self.reuse = reuse
+        self.calls = 0
+
+    def apply(self, image, layers):
+        call_index = self.calls
+        self.calls += 1
+        return self.layer_cache.apply(image, layers, call_index, self.reuse)
+
+
 # render methods
 
 
@@ -88,77 +241,104 @@ def offset_to_center(container, element, rounding_function=int):
 # text
 
 
+# font sizes used by the app which are loaded in the background at startup
+PRELOAD_FONT_SIZES = (8, 10, 12, 13, 14, 16, 20)
+
+
+# Loading a font opens and parses the font file so each font is loaded once and
+# shared. Fonts must not be modified, use font_variant to create a new font.
+@lru_cache(maxsize=None)
+def load_font(font, size):
+    return ImageFont.truetype(font, size=size)
+
+
 def get_mono_font(size, bold=False, italics=False):
     if bold and not italics:
-        return ImageFont.truetype("VeraMoBd.ttf", size=size)
+        return load_font("VeraMoBd.ttf", size)
 
     if not bold and italics:
-        return ImageFont.truetype("VeraMoIt.ttf", size=size)
+        return load_font("VeraMoIt.ttf", size)
 
     if bold and italics:
-        return ImageFont.truetype("VeraMoBI.ttf", size=size)
+        return load_font("VeraMoBI.ttf", size)
 
-    return ImageFont.truetype("VeraMono.ttf", size=size)
+    return load_font("VeraMono.ttf", size)
 
 
 def get_font(size, bold=False, italics=False):
     if size >= 12:
         if bold and not italics:
-            return ImageFont.truetype("Roboto-Bold.ttf", size=size)
+            return load_font("Roboto-Bold.ttf", size)
 
         if not bold and italics:
-            return ImageFont.truetype("Roboto-Italic.ttf", size=size)
+            return load_font("Roboto-Italic.ttf", size)
 
         if bold and italics:
-            return ImageFont.truetype("Roboto-BoldItalic.ttf", size=size)
+            return load_font("Roboto-BoldItalic.ttf", size)
 
-        return ImageFont.truetype("Roboto-Regular.ttf", size=size)
+        return load_font("Roboto-Regular.ttf", size)
 
     return get_mono_font(size, bold, italics)
 
 
-# image
+def _preload_fonts(sizes, on_finish):
+    for size, bold, italics in product(sizes, (False, True), (False, True)):
+        try:
+            get_font(size, bold, italics)
+        except OSError as e:
+            logger.debug(f"Unable to preload font of size {size}: {e}")
 
+    if callable(on_finish):
+        on_finish()
 
-def is_same_image(image_one, image_two) -> bool:
-    try:
-        return list(image_one.getdata()) == list(image_two.getdata())
-    except Exception:
-        return False
 
+# on_finish is called from the preloading thread once every font is loaded
+def preload_fonts(sizes=PRELOAD_FONT_SIZES, on_finish=None):
+    thread = Thread(target=_preload_fonts, args=[sizes, on_finish], daemon=True)
+    thread.start()
+    return thread
 
-# generators
 
+def get_font_key(font):
+    # truetype fonts loaded from the same file with the same options render
+    # identically so they share a key, other fonts are compared by identity
+    path = getattr(font, "path", None)
+    if not isinstance(path, (str, bytes)):
+        return font
+
+    return (path, font.size, font.index, font.encoding, font.layout_engine)
+
+
+# image
 
-def transition(distance, duration, base_step=1):
-    steps = ceil(distance / base_step)
-    step_duration = duration / steps
-    start_time = time()
-    travelled = 0
 
-    while travelled < distance:
-        current_time = time()
-        elapsed_time = current_time - start_time
-        expected_time = duration * travelled / distance
-        lag_time = max(elapsed_time - expected_time, 0)
+def get_image_key(image):
+    # mode and size are included so images with matching buffers but different
+    # shapes are not considered the same
+    return (image.mode, image.size, image.tobytes())
 
-        # correct for lag time by increasing the size of the step
-        corrected_step = base_step + floor(lag_time / step_duration)
 
-        # clamp step so it does not cause us to travel more than distance
-        clamped_step = min(corrected_step, distance - travelled)
+def is_same_image(image_one, image_two) -> bool:
+    try:
+        return get_image_key(image_one) == get_image_key(image_two)
+    except Exception:
+        return False
 
-        # calculate lag that has not been accounted for in the corrected step
-        remaining_lag = lag_time % step_duration
 
-        # correct for remaining lag in wait time
-        sleep(max(step_duration - remaining_lag, 0))
+def get_damage(previous_image, image):
+    # the whole image is damaged if there is nothing to compare it to
+    if (
+        previous_image is None
+        or previous_image.mode != image.mode
+        or previous_image.size != image.size
+    ):
+        return (0, 0, image.width, image.height)
 
-        yield clamped_step
+    # bounding box of the changed pixels or None if nothing has changed
+    return ImageChops.difference(previous_image, image).getbbox()
 
-        travelled = travelled + clamped_step
 
-    logger.debug(f"transition took {time() - start_time} seconds")
+# generators
 
 
 def carousel(end, start=0, step=1):
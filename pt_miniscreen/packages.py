@@ -0,0 +1,92 @@
+import logging
+from os import stat
+from threading import Lock
+
+logger = logging.getLogger(__name__)
+
+DPKG_STATUS_PATH = "/var/lib/dpkg/status"
+
+
+# Answers package queries from dpkg's status file instead of building an apt
+# cache or running apt-cache, which take seconds on a Pi. The file is parsed
+# the first time it is needed and again only when its modification time changes.
+class PackageIndex:
+    def __init__(self, path=DPKG_STATUS_PATH):
+        self.path = path
+        self._lock = Lock()
+        self._mtime = None
+        self._packages = {}
+
+    # returns a dictionary of package name to (installed, version)
+    def _parse(self, file):
+        packages = {}
+        fields = {}
+
+        # paragraphs are separated by blank lines, lines starting with
+        # whitespace continue the previous field and are not needed
+        for line in file:
+            if line.strip() == "":
+                self._add_package(packages, fields)
+                fields = {}
+            elif not line[0].isspace() and ":" in line:
+                name, value = line.split(":", 1)
+                if name in ("Package", "Status", "Version"):
+                    fields[name] = value.strip()
+
+        self._add_package(packages, fields)
+        return packages
+
+    def _add_package(self, packages, fields):
+        name = fields.get("Package")
+        if not name:
+            return
+
+        installed = fields.get("Status", "").endswith(" installed")
+
+        # packages can be listed once per architecture, prefer installed ones
+        if name in packages and packages[name][0] and not installed:
+            return
+
+        packages[name] = (installed, fields.get("Version", ""))
+
+    def _get_packages(self):
+        try:
+            status = stat(self.path)
+            mtime = (status.st_mtime_ns, status.st_size)
+        except OSError:
+            mtime = None
+
+        with self._lock:
+            if mtime != self._mtime:
+                self._packages = self._read(mtime)
+                self._mtime = mtime
+
+            return self._packages
+
+    def _read(self, mtime):
+        if mtime is None:
+            return {}
+
+        try:
+            with open(self.path, encoding="utf-8", errors="replace") as file:
+                return self._parse(file)
+        except OSError as e:
+            logger.warning(f"Unable to read package status from {self.path}: {e}")
+            return {}
+
+    def is_installed(self, package_name):
+        installed, _ = self._get_packages().get(package_name, (False, ""))
+        return installed
+
+    # returns the installed version of a package, "(none)" if it is known but
+    # not installed and an empty string if it is unknown, like apt-cache policy
+    def get_version(self, package_name):
+        package = self._get_packages().get(package_name)
+        if package is None:
+            return ""
+
+        installed, version = package
+        return version if installed else "(none)"
+
+
+package_index = PackageIndex()
@@ -1,21 +1,26 @@
 import logging
 
 from pt_miniscreen.components.menu_page import MenuPage
-from pt_miniscreen.pages.network.ap import APPage
-from pt_miniscreen.pages.network.ethernet import EthernetPage
-from pt_miniscreen.pages.network.mac_addresses import MacAddressesPage
-from pt_miniscreen.pages.network.usb import USBPage
-from pt_miniscreen.pages.network.wifi import WifiPage
-from pt_miniscreen.utils import get_image_file_path
+from pt_miniscreen.utils import get_image_file_path, lazy_component
 
 logger = logging.getLogger(__name__)
 
 
+def page(module_name, page_name):
+    return lazy_component(f"pt_miniscreen.pages.network.{module_name}", page_name)
+
+
 class NetworkMenuPage(MenuPage):
     def __init__(self, **kwargs):
         super().__init__(
             **kwargs,
             text="Network",
             image_path=get_image_file_path("menu/network.gif"),
-            Pages=[WifiPage, EthernetPage, APPage, USBPage, MacAddressesPage]
+            Pages=[
+                page("wifi", "WifiPage"),
+                page("ethernet", "EthernetPage"),
+                page("ap", "APPage"),
+                page("usb", "USBPage"),
+                page("mac_addresses", "MacAddressesPage"),
+            ],
         )
@@ -9,6 +9,7 @@ from pt_miniscreen.core import Component
 from pt_miniscreen.core.components.image import Image
 from pt_miniscreen.core.components.text import Text
 from pt_miniscreen.core.utils import apply_layers, layer, rectangle
+from pt_miniscreen.packages import package_index
 from pt_miniscreen.utils import get_image_file_path
 from pt_miniscreen.components.mixins import Enterable, HasGutterIcons
 from pt_miniscreen.core.components.marquee_text import MarqueeText
@@ -73,14 +74,7 @@ def offset_pos_for_vertical_center(page_height, height: int) -> int:
 
 
 def package_is_installed(package_name: str) -> bool:
-    try:
-        import apt
-
-        cache = apt.Cache()
-        package = cache.get(package_name)
-        return package.is_installed
-    except Exception:
-        return False
+    return package_index.is_installed(package_name)
 
 
 class OverviewPageBase(Component):
@@ -129,9 +123,11 @@ class OverviewPageBase(Component):
         battery.when_discharging = None
 
     def update_battery_properties(self):
-        self.capacity_text.state.update({"text": get_capacity_text()})
-        self.battery_image.state.update({"image_path": get_battery_image_path()})
-        self.state.update({"capacity_size": get_capacity_size()})
+        # batch updates so the page only rerenders once
+        with self.state.batch():
+            self.capacity_text.state.update({"text": get_capacity_text()})
+            self.battery_image.state.update({"image_path": get_battery_image_path()})
+            self.state.update({"capacity_size": get_capacity_size()})
 
     def render(self, image):
         BATTERY_OFFSET = -10  # offset from the vertical center of the page
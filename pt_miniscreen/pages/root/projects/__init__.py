@@ -1,2 +1,15 @@
-from .project_page import ProjectPage
-from .menu_page import ProjectsMenuPage
+from importlib import import_module
+
+# modules are imported when their classes are first used since importing
+# projects modules looks up the home directory of the user
+_exports = {
+    "ProjectPage": ".project_page",
+    "ProjectsMenuPage": ".menu_page",
+}
+
+
+def __getattr__(name):
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(import_module(_exports[name], __name__), name)
@@ -3,14 +3,6 @@ from functools import partial
 from pathlib import Path
 
 from pt_miniscreen.components.menu_page import MenuPage
-from pt_miniscreen.pages.root.projects.overview import FolderOverviewList
-from pt_miniscreen.pages.root.projects.utils import (
-    MyProjectsDirectory,
-    FurtherDirectory,
-    PiTop4DemosDirectory,
-    ElectronicsKitDirectory,
-    RoboticsKitDirectory,
-)
 from pt_miniscreen.utils import get_image_file_path
 
 logger = logging.getLogger(__name__)
@@ -27,6 +19,16 @@ class ProjectsMenuPage(MenuPage):
 
     @property
     def enterable_component(self):
+        # projects modules are slow to import so they are imported when entered
+        from pt_miniscreen.pages.root.projects.overview import FolderOverviewList
+        from pt_miniscreen.pages.root.projects.utils import (
+            MyProjectsDirectory,
+            FurtherDirectory,
+            PiTop4DemosDirectory,
+            ElectronicsKitDirectory,
+            RoboticsKitDirectory,
+        )
+
         return partial(
             FolderOverviewList,
             folder_info=[
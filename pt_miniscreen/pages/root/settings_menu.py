@@ -1,21 +1,15 @@
 import logging
 
 from pt_miniscreen.components.menu_page import MenuPage
-from pt_miniscreen.pages.settings.ap_toggle import APTogglePage
-from pt_miniscreen.pages.settings.cloudflare_dns import CloudflareDnsPage
-from pt_miniscreen.pages.settings.display_reset import DisplayResetPage
-from pt_miniscreen.pages.settings.further_link_toggle import FurtherLinkTogglePage
-from pt_miniscreen.pages.settings.ssh_toggle import SSHTogglePage
-from pt_miniscreen.pages.settings.vnc_toggle import VNCTogglePage
-from pt_miniscreen.pages.settings.bluetooth_encrypted_gatt_toggle_page import (
-    BluetoothEncryptedGattTogglePage,
-)
-
-from pt_miniscreen.utils import get_image_file_path
+from pt_miniscreen.utils import get_image_file_path, lazy_component
 
 logger = logging.getLogger(__name__)
 
 
+def page(module_name, page_name):
+    return lazy_component(f"pt_miniscreen.pages.settings.{module_name}", page_name)
+
+
 class SettingsMenuPage(MenuPage):
     def __init__(self, **kwargs):
         super().__init__(
@@ -23,13 +17,17 @@ class SettingsMenuPage(MenuPage):
             text="Settings",
             image_path=get_image_file_path("menu/settings.gif"),
             virtual_page_list=False,  # pages should keep state when not visible
+            lazy_page_list_window=1,  # only create pages next to the visible page
             Pages=[
-                SSHTogglePage,
-                VNCTogglePage,
-                FurtherLinkTogglePage,
-                APTogglePage,
-                BluetoothEncryptedGattTogglePage,
-                DisplayResetPage,
-                CloudflareDnsPage,
+                page("ssh_toggle", "SSHTogglePage"),
+                page("vnc_toggle", "VNCTogglePage"),
+                page("further_link_toggle", "FurtherLinkTogglePage"),
+                page("ap_toggle", "APTogglePage"),
+                page(
+                    "bluetooth_encrypted_gatt_toggle_page",
+                    "BluetoothEncryptedGattTogglePage",
+                ),
+                page("display_reset", "DisplayResetPage"),
+                page("cloudflare_dns", "CloudflareDnsPage"),
             ],
         )
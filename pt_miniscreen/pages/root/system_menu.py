@@ -1,19 +1,15 @@
 import logging
 
 from pt_miniscreen.components.menu_page import MenuPage
-from pt_miniscreen.pages.system.battery import BatteryPage
-from pt_miniscreen.pages.system.cpu import CPUPage
-from pt_miniscreen.pages.system.login import LoginDetailsPage
-from pt_miniscreen.pages.system.memory import MemoryPage
-from pt_miniscreen.pages.system.pt_hardware import PitopHardwarePage
-from pt_miniscreen.pages.system.rpi_hardware import RPiHardwarePage
-from pt_miniscreen.pages.system.software import SoftwarePage
-from pt_miniscreen.pages.system.last_update import LastUpdatePage
-from pt_miniscreen.utils import get_image_file_path
+from pt_miniscreen.utils import get_image_file_path, lazy_component
 
 logger = logging.getLogger(__name__)
 
 
+def page(module_name, page_name):
+    return lazy_component(f"pt_miniscreen.pages.system.{module_name}", page_name)
+
+
 class SystemMenuPage(MenuPage):
     def __init__(self, **kwargs):
         super().__init__(
@@ -22,13 +18,13 @@ class SystemMenuPage(MenuPage):
             image_path=get_image_file_path("menu/system.gif"),
             image_size=(29, 29),
             Pages=[
-                LoginDetailsPage,
-                BatteryPage,
-                CPUPage,
-                MemoryPage,
-                LastUpdatePage,
-                SoftwarePage,
-                PitopHardwarePage,
-                RPiHardwarePage,
-            ]
+                page("login", "LoginDetailsPage"),
+                page("battery", "BatteryPage"),
+                page("cpu", "CPUPage"),
+                page("memory", "MemoryPage"),
+                page("last_update", "LastUpdatePage"),
+                page("software", "SoftwarePage"),
+                page("pt_hardware", "PitopHardwarePage"),
+                page("rpi_hardware", "RPiHardwarePage"),
+            ],
         )
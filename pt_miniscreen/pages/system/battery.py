@@ -81,9 +81,11 @@ class BatteryPage(Component):
         battery.when_discharging = None
 
     def update_battery_properties(self):
-        self.capacity_text.state.update({"text": get_capacity_text()})
-        self.battery_image.state.update({"image_path": get_battery_image_path()})
-        self.state.update({"capacity_size": get_capacity_size()})
+        # batch updates so the page only rerenders once
+        with self.state.batch():
+            self.capacity_text.state.update({"text": get_capacity_text()})
+            self.battery_image.state.update({"image_path": get_battery_image_path()})
+            self.state.update({"capacity_size": get_capacity_size()})
 
     def render(self, image):
         BATTERY_TOP = offset_to_center(image.height, BATTERY_SIZE[1])
@@ -1,42 +1,20 @@
 import logging
 from functools import partial
-from os import environ
 from pathlib import Path
-from re import match, search
-from shlex import split
-from subprocess import run
+from re import match
 from threading import Thread
 
 from pitop.common.pt_os import get_pitopOS_info
 
 from pt_miniscreen.components.info_page import InfoPage
+from pt_miniscreen.packages import package_index
 from pt_miniscreen.core.components.marquee_text import MarqueeText
 
 logger = logging.getLogger(__name__)
 
 
 def get_package_version(pkg_name):
-    def __get_env():
-        env = environ.copy()
-        # Print output of commands in english
-        env["LANG"] = "en_US.UTF-8"
-        return env
-
-    try:
-        resp = run(
-            split(f"apt-cache policy {pkg_name}"),
-            check=False,
-            capture_output=True,
-            timeout=5,
-            env=__get_env(),
-        )
-        output = str(resp.stdout, "utf8")
-        match = search("Installed: (.*)", output)
-        return match.group(1) if match else ""
-
-    except Exception as e:
-        logger.warning(f"get_package_version {pkg_name} failed: {e}")
-        return ""
+    return package_index.get_version(pkg_name)
 
 
 def get_apt_repositories():
@@ -1,9 +1,11 @@
 import logging
-from configparser import ConfigParser
-from os import path
-from pathlib import Path
 from threading import Thread
 
+from pt_miniscreen.bootsplash import (
+    load_bootsplash,
+    should_show_bootsplash,
+    write_breadcrumb,
+)
 from pt_miniscreen.components.enterable_page_list import (
     EnterablePageList,
 )
@@ -23,10 +25,7 @@ from pt_miniscreen.components.mixins import (
 from pt_miniscreen.core.utils import apply_layers, layer
 from pt_miniscreen.pages.root.network_menu import NetworkMenuPage
 from pt_miniscreen.pages.root.overview import getOverviewPage
-from pt_miniscreen.pages.root.projects import (
-    ProjectsMenuPage,
-    ProjectPage,
-)
+from pt_miniscreen.pages.root.projects.menu_page import ProjectsMenuPage
 from pt_miniscreen.pages.root.screensaver import StarfieldScreensaver
 from pt_miniscreen.pages.root.settings_menu import SettingsMenuPage
 from pt_miniscreen.pages.root.system_menu import SystemMenuPage
@@ -35,17 +34,6 @@ from pt_miniscreen.utils import ButtonEvents, get_image_file_path
 logger = logging.getLogger(__name__)
 
 
-def get_bootsplash_image_path():
-    try:
-        config = ConfigParser()
-        config.read("/etc/pt-miniscreen/settings.ini")
-        return config.get("Bootsplash", "Path")
-    except Exception:
-        pass
-
-    return get_image_file_path("startup/pi-top_startup.gif")
-
-
 class RootPageList(EnterablePageList):
     def __init__(self, **kwargs):
         super().__init__(
@@ -56,13 +44,11 @@ class RootPageList(EnterablePageList):
                 ProjectsMenuPage,
                 SettingsMenuPage,
             ],
-            use_snapshot_when_scrolling=False,
             **kwargs,
         )
 
 
 class RootComponent(Component):
-    bootsplash_breadcrumb = "/tmp/.com.pi-top.pt_miniscreen.boot-played"
     right_gutter_width = 10
     gutter_icon_padding = (3, 7)
 
@@ -70,7 +56,7 @@ class RootComponent(Component):
         super().__init__(
             **kwargs,
             initial_state={
-                "show_bootsplash": not path.exists(self.bootsplash_breadcrumb),
+                "show_bootsplash": should_show_bootsplash(),
                 "show_screensaver": False,
             },
         )
@@ -82,11 +68,14 @@ class RootComponent(Component):
             lower_icon_padding=self.gutter_icon_padding,
         )
         self.screensaver = self.create_child(StarfieldScreensaver)
-        self.bootsplash = self.create_child(
-            Image, loop=False, image_path=get_bootsplash_image_path()
-        )
 
+        # bootsplash frames are loaded from the bootsplash cache, which the app
+        # has usually loaded already to display the first frame
+        self.bootsplash = None
         if self.state["show_bootsplash"]:
+            self.bootsplash = self.create_child(
+                Image, loop=False, image_path=load_bootsplash().path
+            )
             Thread(target=self._wait_for_bootsplash_finish, daemon=True).start()
 
         self._set_gutter_icons()
@@ -103,6 +92,8 @@ class RootComponent(Component):
 
     @property
     def is_project_page(self):
+        from pt_miniscreen.pages.root.projects.project_page import ProjectPage
+
         return isinstance(self.active_component, ProjectPage)
 
     def project_uses_miniscreen(self, user_using_miniscreen):
@@ -125,7 +116,7 @@ class RootComponent(Component):
 
         # try to create breadcrumb so the bootsplash is not shown next start
         try:
-            Path(self.bootsplash_breadcrumb).touch()
+            write_breadcrumb()
         except Exception:
             pass
 
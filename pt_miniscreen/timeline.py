@@ -0,0 +1,78 @@
+import logging
+import time
+from os import sysconf
+from threading import Lock
+
+logger = logging.getLogger(__name__)
+
+# /proc reports when the process started on the boot time clock
+if hasattr(time, "CLOCK_BOOTTIME"):
+
+    def clock():
+        return time.clock_gettime(time.CLOCK_BOOTTIME)
+
+else:
+    clock = None
+
+
+# Returns the boot time clock time the process started or None when it is not
+# available, in which case times are measured from when this was imported
+def get_process_start_time():
+    if clock is None:
+        return None
+
+    try:
+        with open("/proc/self/stat") as file:
+            stat = file.read()
+
+        # the process name can contain spaces, so fields are counted from the
+        # bracket after it. The start time is the 22nd field in clock ticks.
+        fields = stat[stat.rindex(")") + 2 :].split()
+        return int(fields[19]) / sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+# Records when startup milestones are reached, in seconds since the process
+# started, so the time from boot to the first interactive frame can be logged.
+class Timeline:
+    def __init__(self, start_time=None):
+        self._clock = clock or time.monotonic
+        if start_time is None:
+            start_time = get_process_start_time()
+
+        self.start_time = self._clock() if start_time is None else start_time
+        self.marks = []
+        self._lock = Lock()
+
+    # milestones are only recorded the first time they are reached
+    def mark(self, name):
+        elapsed = self._clock() - self.start_time
+
+        with self._lock:
+            if any(mark_name == name for mark_name, _ in self.marks):
+                return
+
+            self.marks.append((name, elapsed))
+
+    def get(self, name):
+        with self._lock:
+            return next((elapsed for mark, elapsed in self.marks if mark == name), None)
+
+    def format(self):
+        with self._lock:
+            marks = list(self.marks)
+
+        lines = ["Startup timeline:"]
+        previous = 0
+        for name, elapsed in marks:
+            lines.append(f"{elapsed:8.3f}s (+{elapsed - previous:.3f}s)  {name}")
+            previous = elapsed
+
+        return "\n".join(lines)
+
+    def log(self):
+        logger.info(self.format())
+
+
+timeline = Timeline()
@@ -5,14 +5,21 @@ from enum import Enum, auto
 from os import path
 from pathlib import Path
 from functools import partial
+from importlib import import_module
+from pt_miniscreen.core.cache import LRUCache
 from pt_miniscreen.core.components.text import create_wrapped_text
 
-from pt_miniscreen.core.utils import get_font
+from pt_miniscreen.core.utils import get_font, get_font_key
 
 VIEWPORT_HEIGHT = 64
 VIEWPORT_WIDTH = 128
 VIEWPORT_SIZE = (VIEWPORT_WIDTH, VIEWPORT_HEIGHT)
 
+# images created by text_to_image are shared so they must not be modified
+text_image_cache = LRUCache(
+    max_size=1024 * 1024, get_size=lambda image: image.width * image.height
+)
+
 
 def get_project_root() -> Path:
     return Path(__file__).parent
@@ -30,6 +37,18 @@ def isclass(obj, cls) -> bool:
     )
 
 
+# Returns a function that creates a component which is imported from its module
+# when it is first created, so modules of pages that are never opened are not
+# imported at startup.
+def lazy_component(module_name: str, component_name: str):
+    def create_component(**kwargs):
+        module = import_module(module_name)
+        return getattr(module, component_name)(**kwargs)
+
+    create_component.__name__ = component_name
+    return create_component
+
+
 class ButtonEvents(Enum):
     UP_PRESS = auto()
     UP_RELEASE = auto()
@@ -77,8 +96,17 @@ def text_to_image(
     wrap=True,
     wrap_margin=0,
 ) -> PIL.Image.Image:
-    image = PIL.Image.new("1", (width, 10))
     font = get_font(font_size, bold, italics) if font is None else font
+    return text_image_cache.get_or_create(
+        (text, width, get_font_key(font), fill, align, spacing, wrap, wrap_margin),
+        lambda: _create_text_image(
+            text, width, font, fill, align, spacing, wrap, wrap_margin
+        ),
+    )
+
+
+def _create_text_image(text, width, font, fill, align, spacing, wrap, wrap_margin):
+    image = PIL.Image.new("1", (width, 10))
     if wrap:
         text = create_wrapped_text(text, font, image.width - wrap_margin)
 
@@ -18,9 +18,61 @@ def test_broken_pipe_error(mocker):
 
     # raise BrokenPipeError
     mocker.patch.object(app, "_display", side_effect=BrokenPipeError())
-    app.display()
+    app.display(force=True)
 
     # app root and timers are None because app has been stopped so process can end
     assert app.root is None
     assert app.dimming_timer is None
     assert app.screensaver_timer is None
+
+
+def test_startup_timeline(mocker):
+    setup_app(mocker)
+
+    from pt_miniscreen.app import App
+    from pt_miniscreen.timeline import timeline
+
+    log = mocker.patch.object(timeline, "log")
+    app = App()
+    app.start()
+
+    # bootsplash is off so the first frame is interactive
+    assert app.interactive
+    log.assert_called_once()
+    assert timeline.get("app created") <= timeline.get("first frame")
+    assert timeline.get("first frame") <= timeline.get("first interactive frame")
+
+    app.stop()
+
+
+def test_startup_timeline_only_marks_pushed_frames(mocker):
+    setup_app(mocker)
+
+    from pt_miniscreen.app import App
+    from pt_miniscreen.timeline import Timeline
+
+    timeline = mocker.patch("pt_miniscreen.app.timeline", Timeline())
+    app = App()
+    app.start()
+    timeline.marks.clear()
+    app.interactive = False
+
+    # frames dropped as unchanged are not marked
+    app._update_display()
+    assert timeline.get("first frame") is None
+
+    # displaying after the app has stopped does nothing
+    app.stop()
+    app._update_display()
+    assert timeline.get("first frame") is None
+
+
+def test_lazy_component(parent):
+    from pt_miniscreen.utils import lazy_component
+
+    create_page = lazy_component("pt_miniscreen.core.components.text", "Text")
+    assert create_page.__name__ == "Text"
+
+    from pt_miniscreen.core.components.text import Text
+
+    assert isinstance(parent.create_child(create_page, text="Page"), Text)
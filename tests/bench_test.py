@@ -0,0 +1,189 @@
+def test_compare_benchmark():
+    from pt_miniscreen.bench import compare
+    from pt_miniscreen.root import RootComponent
+
+    results = compare.run(RootComponent, frames=5)
+
+    assert set(results.keys()) == {"bytes", "legacy"}
+    for result in results.values():
+        assert result["frames"] == 5
+        assert result["mean_ms"] >= 0
+
+
+def test_compare_benchmark_arms_render_the_same(mocker):
+    from pt_miniscreen.bench import compare
+    from pt_miniscreen.bench.utils import time_frames
+    from pt_miniscreen.core import Component
+    from pt_miniscreen.core.utils import apply_layers, layer
+
+    renders = []
+    lookups = []
+
+    class Leaf(Component):
+        def _render(self, image):
+            lookups.append(self)
+            return super()._render(image)
+
+        def render(self, image):
+            renders.append(self)
+            return image
+
+    class Root(Component):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.leaf = self.create_child(Leaf)
+            self.layered_leaf = self.create_child(Leaf)
+
+        def render(self, image):
+            image = self.leaf.render(image)
+            return apply_layers(image, [layer(self.layered_leaf.render, (64, 64))])
+
+    # count the renders and cache lookups of each arm of the comparison
+    arm_renders = []
+    arm_lookups = []
+
+    def count_renders(render_frame, frames):
+        renders.clear()
+        lookups.clear()
+        frame_times = time_frames(render_frame, frames)
+        arm_renders.append(len(renders))
+        arm_lookups.append(len(lookups))
+        return frame_times
+
+    mocker.patch.object(compare, "time_frames", count_renders)
+    compare.run(Root, frames=3)
+
+    # both arms only compare images so the leaves are rendered as often in each
+    assert len(arm_renders) == 2
+    assert arm_renders[0] == arm_renders[1]
+
+    # layered children are compared rather than reused from the layer cache
+    assert arm_lookups == [6, 6]
+
+
+def test_allocations_benchmark():
+    from pt_miniscreen.bench import allocations
+    from pt_miniscreen.root import RootComponent
+
+    results = allocations.run(RootComponent, frames=4)
+
+    immutable = results["immutable"]
+    copy = results["copy"]
+    assert immutable["unchanged_frame_allocations"] == 0
+    assert copy["unchanged_frame_allocations"] > 0
+    assert immutable["changed_frame_allocations"] < copy["changed_frame_allocations"]
+
+
+def test_fonts_benchmark():
+    from pt_miniscreen.bench import fonts
+    from pt_miniscreen.pages.system.cpu import CPUPage
+    from pt_miniscreen.root import RootComponent
+
+    results = fonts.run(RootComponent, CPUPage, runs=2)
+
+    assert set(results.keys()) == {
+        "startup_uncached",
+        "startup_cached",
+        "page_open_uncached",
+        "page_open_cached",
+    }
+    for result in results.values():
+        assert result["frames"] == 2
+
+
+def test_fonts_benchmark_uncached_text(mocker):
+    from pt_miniscreen.bench import fonts
+    from pt_miniscreen.core.components.text import text_raster_cache
+    from pt_miniscreen.pages.system.cpu import CPUPage
+    from pt_miniscreen.root import RootComponent
+
+    # record how much text is cached each time a component is opened
+    cached_text = []
+    create_root = fonts.create_root
+
+    def record_cached_text(Component):
+        cached_text.append(len(text_raster_cache))
+        return create_root(Component)
+
+    mocker.patch.object(fonts, "create_root", record_cached_text)
+    fonts.run(RootComponent, CPUPage, runs=2)
+
+    # uncached opens start without any rasterized text
+    startup_uncached, page_open_uncached = cached_text[0:2], cached_text[4:6]
+    assert startup_uncached == [0, 0]
+    assert page_open_uncached == [0, 0]
+
+
+def test_animations_benchmark():
+    from pt_miniscreen.bench import animations
+    from pt_miniscreen.utils import get_project_root
+
+    path = get_project_root() / "images" / "startup" / "pi-top_startup.gif"
+    results = animations.run([path])
+
+    assert results["pi-top_startup.gif"]["frames"] == 39
+    assert results["pi-top_startup.gif"]["memory_bytes"] == 39 * 16 * 64
+
+
+def test_transitions_benchmark():
+    from pt_miniscreen.bench import transitions
+    from pt_miniscreen.pages.system.cpu import CPUPage
+    from pt_miniscreen.root import RootPageList
+
+    results = transitions.run(RootPageList, CPUPage, steps=4)
+
+    assert set(results.keys()) == {
+        f"{transition}_{mode}"
+        for transition in ("push", "pop")
+        for mode in ("live", "snapshot", "snapshot_foreground")
+    }
+    for result in results.values():
+        assert result["frames"] == 4
+        assert result["mean_ms"] >= 0
+
+
+def test_app_benchmark():
+    from pt_miniscreen.bench import app
+
+    results = app.run(["screensaver", "logs"], step_time=0.05)
+
+    assert set(results.keys()) == {"screensaver", "logs"}
+    for result in results.values():
+        assert result["frames_rendered"] > 0
+        assert 0 < result["frames_pushed"] <= result["frames_rendered"]
+        assert result["p99_ms"] >= result["mean_ms"] > 0
+        assert result["max_threads"] > 1
+        assert result["peak_rss_kb"] > 0
+
+
+def test_replay(tmp_path):
+    from PIL import Image
+
+    from pt_miniscreen.bench import replay
+    from pt_miniscreen.core.recorder import FrameRecorder, Recording
+
+    path = tmp_path / "frames.rec"
+    recorder = FrameRecorder(path)
+    frames = [Image.new("1", (128, 64)) for _ in range(3)]
+    for index, frame in enumerate(frames):
+        frame.putpixel((index, index), 1)
+        recorder.record(frame)
+    recorder.close()
+
+    recording = Recording(path)
+    summary = replay.summarise(recording)
+    assert summary["frames"] == 3
+    assert summary["max_interval_ms"] >= summary["mean_interval_ms"]
+
+    replay.export_pngs(recording, tmp_path / "pngs")
+    assert Image.open(tmp_path / "pngs" / "0002.png").convert("1") == frames[2]
+
+    replay.export_gif(recording, tmp_path / "frames.gif")
+    assert Image.open(tmp_path / "frames.gif").n_frames == 3
+
+    # first row of text shows the first two rows of pixels
+    assert replay.format_frame(frames[1]).split("\n")[0].startswith(" ▄ ")
+
+    waits = []
+    replay.step_through(recording, wait=lambda prompt: waits.append(prompt) or "q")
+    assert len(waits) == 1
@@ -0,0 +1,79 @@
+import os
+import shutil
+
+from conftest import setup_app
+
+
+def test_bootsplash_cache(tmp_path):
+    from pt_miniscreen.bootsplash import (
+        get_bootsplash_image_path,
+        read_cache,
+        write_cache,
+    )
+    from pt_miniscreen.core.components.image import ImageFile
+
+    image_path = tmp_path / "bootsplash.gif"
+    cache_path = tmp_path / "bootsplash.cache"
+    shutil.copy(get_bootsplash_image_path(), image_path)
+
+    # cache does not exist yet
+    assert read_cache(image_path, cache_path) is None
+
+    image_file = ImageFile(image_path)
+    write_cache(image_file, cache_path)
+
+    # frames are read from the cache without decoding the image
+    cached_image_file = read_cache(image_path, cache_path)
+    assert cached_image_file.size == image_file.size
+    assert cached_image_file.is_animated
+    assert cached_image_file.frames == image_file.frames
+    assert cached_image_file.durations == image_file.durations
+    assert cached_image_file.get_frame(0) == image_file.get_frame(0)
+
+    # cache is out of date when the image changes
+    os.utime(image_path, ns=(0, 0))
+    assert read_cache(image_path, cache_path) is None
+
+
+def test_first_bootsplash_frame_displayed_before_root(mocker, tmp_path):
+    setup_app(mocker)
+    mocker.patch("pt_miniscreen.bootsplash.BREADCRUMB_PATH", str(tmp_path / "played"))
+    mocker.patch("pt_miniscreen.bootsplash.CACHE_PATH", str(tmp_path / "cache"))
+
+    from pt_miniscreen.app import App
+    from pt_miniscreen.bootsplash import get_first_frame
+    from pt_miniscreen.core.backends import MemoryBackend
+    from pt_miniscreen.timeline import Timeline
+
+    timeline = mocker.patch("pt_miniscreen.app.timeline", Timeline())
+    display_backend = MemoryBackend()
+    app = App(display_backend=display_backend)
+
+    # first frame is displayed before the root component is created
+    assert display_backend.pushes == 1
+    assert timeline.get("first frame") <= timeline.get("app created")
+    assert display_backend.frame == get_first_frame(app.miniscreen.size)
+    assert (tmp_path / "cache").exists()
+
+    # root shows the same bootsplash frame once started, which is not pushed
+    # again since the display already shows it
+    app.start()
+    assert app.root.state["show_bootsplash"]
+    assert display_backend.frame == get_first_frame(app.miniscreen.size)
+    assert display_backend.pushes == 1
+
+    app.stop()
+
+
+def test_breadcrumb_uses_bootsplash_path(mocker, tmp_path):
+    breadcrumb_path = tmp_path / "played"
+    mocker.patch("pt_miniscreen.bootsplash.BREADCRUMB_PATH", str(breadcrumb_path))
+
+    from pt_miniscreen.bootsplash import should_show_bootsplash, write_breadcrumb
+
+    assert should_show_bootsplash()
+
+    # breadcrumb is written to the same path that is checked
+    write_breadcrumb()
+    assert breadcrumb_path.exists()
+    assert not should_show_bootsplash()
@@ -0,0 +1,120 @@
+from time import sleep
+
+
+def test_animation_sample():
+    from pt_miniscreen.core.animation import Animation, steps
+
+    animation = Animation(start=10, end=20, duration=1, start_time=100)
+
+    # value moves from start to end over duration
+    assert animation.sample(time=100) == 10
+    assert animation.sample(time=100.5) == 15
+    assert animation.sample(time=101) == 20
+    assert not animation.is_finished(time=100.5)
+    assert animation.is_finished(time=101)
+
+    # value is clamped before and after the animation
+    assert animation.sample(time=99) == 10
+    assert animation.sample(time=102) == 20
+
+    # easing is applied to progress
+    animation = Animation(0, 30, 3, easing=steps(3), start_time=0)
+    assert animation.sample(time=0.5) == 0
+    assert animation.sample(time=1.5) == 10
+    assert animation.sample(time=2.5) == 20
+    assert animation.sample(time=3) == 30
+
+    # animations without a duration finish straight away
+    assert Animation(0, 10, 0).sample() == 10
+
+
+def test_animate(parent):
+    from pt_miniscreen.core.animation import Animation, animate
+
+    values = []
+    animation = Animation(start=0, end=100, duration=0.2)
+    task = parent.create_task(animate(animation, values.append, frame_time=0.02))
+
+    # animation is sampled once per frame until it finishes on its end value
+    sleep(0.3)
+    assert task.finished.is_set()
+    assert values == sorted(values)
+    assert values[-1] == 100
+    assert 5 <= len(values) <= 12
+
+
+def test_animate_frames_adapt_to_render_time(parent):
+    from pt_miniscreen.core.animation import Animation, animate
+
+    values = []
+
+    # frames that take longer than frame_time to render are shown less often
+    # but the animation still finishes on time
+    def slow_frame(value):
+        values.append(value)
+        sleep(0.05)
+
+    animation = Animation(start=0, end=100, duration=0.2)
+    task = parent.create_task(animate(animation, slow_frame, frame_time=0.01))
+
+    sleep(0.35)
+    assert task.finished.is_set()
+    assert values[-1] == 100
+    assert len(values) <= 6
+
+
+def test_transitions_are_not_delayed_by_intervals(parent):
+    from pt_miniscreen.core import Component
+    from pt_miniscreen.core.animation import Animation, animate
+    from pt_miniscreen.core.scheduler import Scheduler
+
+    class Blocking(Component):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.create_interval(self.block, 0.01)
+
+        def block(self):
+            sleep(1)
+
+        def render(self, image):
+            return image
+
+    # occupy every worker of the shared scheduler
+    parent._set_active(True)
+    blocking = [parent.create_child(Blocking) for _ in range(Scheduler.max_workers)]
+    for component in blocking:
+        component._set_active(True)
+    sleep(0.05)
+
+    values = []
+    animation = Animation(start=0, end=100, duration=0.2)
+    transition = parent.create_transition(
+        animate(animation, values.append, frame_time=0.02)
+    )
+
+    sleep(0.3)
+    assert transition.finished.is_set()
+    assert values[-1] == 100
+    assert len(values) >= 5
+
+    for component in blocking:
+        parent.remove_child(component)
+
+
+def test_transitions_finish_while_paused(parent):
+    from pt_miniscreen.core.animation import Animation, animate
+
+    parent._set_active(False)
+
+    values = []
+    animation = Animation(start=0, end=100, duration=0.1)
+    task = parent.create_task(animate(animation, values.append, frame_time=0.02))
+    transition = parent.create_transition(
+        animate(animation, values.append, frame_time=0.02)
+    )
+
+    # tasks wait for the component to be active but transitions finish
+    sleep(0.2)
+    assert not task.finished.is_set()
+    assert transition.finished.is_set()
+    assert values[-1] == 100
@@ -97,6 +97,11 @@ def test_rerender(miniscreen, app):
     app.root.render.reset_mock()
     miniscreen.device.display.reset_mock()
 
+    # render a changed frame
+    changed_frame = Image.new("1", app.size)
+    changed_frame.putpixel((1, 2), 1)
+    app.root.render.return_value = changed_frame
+
     app.root.on_rerender()
 
     # calls render on root
@@ -106,6 +111,41 @@ def test_rerender(miniscreen, app):
     miniscreen.device.display.assert_called_once_with(app.root.render())
 
 
+def test_rerender_unchanged(miniscreen, app):
+    app.start()
+    app.root.render.return_value = Image.new("1", app.size)
+    app.root.on_rerender()
+    miniscreen.device.display.reset_mock()
+
+    # does not update display when frame is unchanged
+    app.root.on_rerender()
+    miniscreen.device.display.assert_not_called()
+
+    # updates display when forced
+    app.display(force=True)
+    miniscreen.device.display.assert_called_once_with(app.root.render())
+
+
+def test_partial_display(miniscreen, Root):
+    from pt_miniscreen.core import App
+
+    app = App(display=miniscreen.device.display, Root=Root, partial_display=True)
+    app.start()
+    app.root.render.return_value = Image.new("1", app.size)
+
+    # passes the whole frame as the damaged region when forced
+    app.display(force=True)
+    miniscreen.device.display.assert_called_with(app.root.render(), (0, 0, 128, 64))
+
+    # passes the region that changed since the last frame
+    changed_frame = Image.new("1", app.size)
+    changed_frame.putpixel((1, 2), 1)
+    app.root.render.return_value = changed_frame
+    app.root.on_rerender()
+    miniscreen.device.display.assert_called_with(changed_frame, (1, 2, 2, 3))
+    assert app.damage == (1, 2, 2, 3)
+
+
 def test_stop(app):
     from pt_miniscreen.core import Component
 
@@ -126,3 +166,100 @@ def test_stop(app):
     sleep(1.1)
     assert root_interval() is None
     assert child_interval() is None
+
+
+def test_max_fps(miniscreen, Root):
+    from pt_miniscreen.core import App
+
+    app = App(display=miniscreen.device.display, Root=Root, max_fps=10)
+    app.start()
+
+    frames = [Image.new("1", app.size) for _ in range(3)]
+    for index, frame in enumerate(frames):
+        frame.putpixel((index, 0), 1)
+
+    # rerenders are handled by the display worker rather than immediately
+    app.root.render.reset_mock()
+    miniscreen.device.display.reset_mock()
+    app.root.render.return_value = frames[0]
+    app.root.on_rerender()
+    app.root.render.assert_not_called()
+
+    sleep(0.15)
+    miniscreen.device.display.assert_called_once_with(frames[0])
+
+    # rerenders during a frame are coalesced into a single frame
+    miniscreen.device.display.reset_mock()
+    app.root.render.return_value = frames[1]
+    app.root.on_rerender()
+    app.root.on_rerender()
+    app.root.render.return_value = frames[2]
+    app.root.on_rerender()
+    assert app.coalesced_frames == 2
+
+    sleep(0.15)
+    miniscreen.device.display.assert_called_once_with(frames[2])
+
+    # unchanged frames are dropped
+    app.root.on_rerender()
+    sleep(0.15)
+    miniscreen.device.display.assert_called_once_with(frames[2])
+    assert app.dropped_frames == 1
+
+    app.stop()
+
+
+def test_max_fps_display_error(miniscreen, Root):
+    from pt_miniscreen.core import App
+
+    app = App(display=miniscreen.device.display, Root=Root, max_fps=10)
+    app.start()
+
+    frame = Image.new("1", app.size)
+    frame.putpixel((0, 0), 1)
+
+    # display worker keeps displaying frames after a frame fails to render
+    app.root.render.side_effect = Exception("render failed")
+    app.root.on_rerender()
+    sleep(0.15)
+
+    miniscreen.device.display.reset_mock()
+    app.root.render.side_effect = None
+    app.root.render.return_value = frame
+    app.root.on_rerender()
+    sleep(0.15)
+    miniscreen.device.display.assert_called_once_with(frame)
+
+    app.stop()
+
+
+def test_save_cache_recording(mocker, miniscreen, Root, tmp_path):
+    from pt_miniscreen.core import App
+    from pt_miniscreen.core.recorder import FrameRecorder, Recording
+
+    mocker.patch.dict("os.environ", {"SAVE_CACHE": "1"})
+    path = tmp_path / "frames.rec"
+    mocker.patch(
+        "pt_miniscreen.core.app.FrameRecorder",
+        lambda _: FrameRecorder(path, flush_interval=0.05),
+    )
+
+    class ImageRoot(Root):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.render.return_value = Image.new("1", (128, 64))
+
+    app = App(display=miniscreen.device.display, Root=ImageRoot)
+    app.start()
+
+    frame = Image.new("1", app.size)
+    frame.putpixel((1, 1), 1)
+    app.root.render.return_value = frame
+    app.display()
+
+    # frames are written when the app stops
+    app.stop()
+    assert [image for _, image in Recording(path)] == [
+        Image.new("1", app.size),
+        frame,
+    ]
@@ -0,0 +1,90 @@
+from unittest.mock import Mock
+
+import pytest
+from PIL import Image
+
+from pt_miniscreen.core.backends import (
+    MemoryBackend,
+    PNGBackend,
+    RecordingBackend,
+    SSD1306Backend,
+    create_backend,
+)
+from pt_miniscreen.core.recorder import Recording
+
+
+def create_frame(pos=(0, 0)):
+    image = Image.new("1", (128, 64))
+    image.putpixel(pos, 1)
+    return image
+
+
+def test_backend_stats():
+    backend = MemoryBackend()
+    assert backend.stats["pushes"] == 0
+
+    for x in range(3):
+        backend(create_frame((x, 0)), (x, 0, x + 1, 1))
+
+    assert backend.frame == create_frame((2, 0))
+    stats = backend.stats
+    assert stats["pushes"] == 3
+    assert 0 < stats["mean_ms"] <= stats["max_ms"]
+    assert stats["p99_ms"] <= stats["max_ms"]
+    assert stats["fps"] > 0
+
+
+def test_ssd1306_backend():
+    # devices that can't be written to directly are passed images
+    device = Mock(spec=["display"])
+    backend = SSD1306Backend(device)
+    backend(create_frame())
+    device.display.assert_called_once_with(create_frame())
+    assert backend.stats["bytes_per_push"] == 1024
+
+
+def test_png_backend(tmp_path):
+    backend = PNGBackend(tmp_path)
+    backend(create_frame((0, 0)))
+    backend(create_frame((1, 0)))
+
+    assert Image.open(tmp_path / "0001.png").convert("1") == create_frame((1, 0))
+
+
+def test_recording_backend(tmp_path):
+    backend = RecordingBackend(tmp_path / "frames.rec")
+    backend(create_frame((0, 0)))
+    backend(create_frame((1, 0)))
+    backend.close()
+
+    assert [image for _, image in Recording(tmp_path / "frames.rec")] == [
+        create_frame((0, 0)),
+        create_frame((1, 0)),
+    ]
+
+
+def test_create_backend():
+    device = Mock()
+    assert create_backend("device", device).device == device
+    assert isinstance(create_backend("memory"), MemoryBackend)
+
+    with pytest.raises(ValueError):
+        create_backend("unknown")
+
+
+def test_app_closes_backend(mocker):
+    from pt_miniscreen.core import App, Component
+
+    class Root(Component):
+        def render(self, image):
+            return image
+
+    backend = MemoryBackend()
+    close = mocker.spy(backend, "close")
+
+    app = App(display=backend, Root=Root, partial_display=True)
+    app.start()
+    assert backend.frame == Image.new("1", (128, 64))
+
+    app.stop()
+    close.assert_called_once()
@@ -0,0 +1,62 @@
+from pt_miniscreen.core.cache import LRUCache
+
+
+def test_lru_cache():
+    cache = LRUCache(max_size=2)
+
+    # misses are counted
+    assert cache.get("a") is None
+    assert cache.stats["misses"] == 1
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    assert cache.stats["hits"] == 1
+
+    # least recently used entry is evicted when full
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats["evictions"] == 1
+
+
+def test_lru_cache_size():
+    cache = LRUCache(max_size=10, get_size=len)
+
+    cache.set("a", "12345")
+    cache.set("b", "1234")
+    assert cache.size == 9
+
+    # replacing an entry updates the size
+    cache.set("b", "1")
+    assert cache.size == 6
+
+    # entries are evicted until values fit
+    cache.set("c", "123456")
+    assert "a" not in cache
+    assert cache.size == 7
+
+    # values larger than the cache are not stored
+    cache.set("d", "12345678901")
+    assert "d" not in cache
+    assert cache.size == 7
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_lru_cache_get_or_create():
+    cache = LRUCache(max_size=2)
+    created = []
+
+    def create():
+        created.append(True)
+        return len(created)
+
+    assert cache.get_or_create("a", create) == 1
+    assert cache.get_or_create("a", create) == 1
+    assert len(created) == 1
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 1
@@ -574,3 +574,173 @@ def test_no_references_paused_component_cleanup():
     # after about a second the interval stops and is collected
     sleep(1.1)
     assert interval() is None
+
+
+def test_render_cache_comparison():
+    from pt_miniscreen.core.component import RenderCache
+
+    cache = RenderCache()
+    image = create_spot_image((0, 0))
+
+    # empty cache never matches
+    assert not cache.is_same_input(image)
+    assert not cache.is_same_output(image)
+
+    cache.input = image
+    cache.output = create_spot_image((1, 1))
+    assert cache.is_same_input(create_spot_image((0, 0)))
+    assert not cache.is_same_input(create_spot_image((1, 1)))
+    assert cache.is_same_output(create_spot_image((1, 1)))
+
+    # key is recalculated when the cached image changes
+    cache.input = create_spot_image((2, 2))
+    assert not cache.is_same_input(image)
+    assert cache.is_same_input(create_spot_image((2, 2)))
+
+
+def test_render_cache_allocations(mocker):
+    from pt_miniscreen.core.component import RenderCache
+
+    def count_allocations(immutable_frames):
+        mocker.patch.object(RenderCache, "immutable_frames", immutable_frames)
+        mocker.patch.object(RenderCache, "allocations", 0)
+
+        cache = RenderCache()
+        cache.input = create_spot_image((0, 0))
+        cache.output = create_spot_image((1, 1))
+        for _ in range(10):
+            cache.output
+
+        # the cached input is recreated when requested
+        assert cache.input == create_spot_image((0, 0))
+        assert cache.output == create_spot_image((1, 1))
+
+        return RenderCache.allocations
+
+    # immutable frames only allocate when the input is recreated
+    assert count_allocations(immutable_frames=True) == 1
+
+    # copies are created on every access otherwise
+    assert count_allocations(immutable_frames=False) == 14
+
+
+def test_state_changed_keys(parent):
+    from pt_miniscreen.core import Component
+
+    class Tracker(Component):
+        default_state = {"a": 1, "b": [1, 2]}
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.previous_states = []
+
+        def on_state_change(self, previous_state):
+            self.previous_states.append(
+                (previous_state.changed_keys, dict(previous_state))
+            )
+
+        def render(self, image):
+            return image
+
+    component = parent.create_child(Tracker)
+
+    # updating with equal values does not change state
+    component.state.update({"a": 1, "b": [1, 2]})
+    assert component.previous_states == []
+
+    # only changed keys are recorded
+    component.state.update({"a": 2, "b": [1, 2], "c": 3})
+    assert component.previous_states == [({"a", "c"}, {"a": 1, "b": [1, 2]})]
+
+
+def test_state_batch(parent, SpotComponent):
+    from pt_miniscreen.core import Component
+
+    class Spots(Component):
+        default_state = {"count": 0}
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.spot = self.create_child(SpotComponent)
+            self.state_changes = []
+
+        def on_state_change(self, previous_state):
+            self.state_changes.append(previous_state.changed_keys)
+
+        def render(self, image):
+            return self.spot.render(image)
+
+    component = parent.create_child(Spots)
+    component.render(Image.new("1", (128, 64)))
+
+    # updates to state and children in a batch reconcile once
+    with component.state.batch():
+        component.spot.move_spot_right()
+        component.state.update({"count": 1})
+        component.state.update({"count": 2})
+        component.spot.move_spot_down()
+        assert parent.on_rerender_spy.call_count == 0
+
+    assert parent.on_rerender_spy.call_count == 1
+    assert component.state_changes == [{"count"}]
+    assert component.render(Image.new("1", (128, 64))) == create_spot_image((1, 1))
+
+    # batches that change state back to its original value do not rerender
+    with component.state.batch():
+        component.state.update({"count": 3})
+        component.state.update({"count": 2})
+
+    assert parent.on_rerender_spy.call_count == 1
+    assert component.state_changes == [{"count"}]
+
+
+def test_clean_children_reuse_cached_layers(mocker, parent, SpotComponent):
+    from pt_miniscreen.core import Component
+    from pt_miniscreen.core.utils import apply_layers, layer
+
+    class Spots(Component):
+        default_state = {"offset": 0}
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.left = self.create_child(SpotComponent)
+            self.right = self.create_child(SpotComponent)
+
+        def render(self, image):
+            offset = self.state["offset"]
+            return apply_layers(
+                image,
+                [
+                    layer(self.left.render, size=(64, 64)),
+                    layer(self.right.render, size=(64, 64), pos=(64 + offset, 0)),
+                ],
+            )
+
+    component = parent.create_child(Spots)
+    component.render(Image.new("1", (128, 64)))
+    assert component._layer_cache.applied_layers == 2
+
+    # only the dirty child is applied when a child rerenders
+    is_same_input = mocker.spy(component.left._render_cache, "is_same_input")
+    component.right.move_spot_right()
+    assert is_same_input.call_count == 0
+    assert component._layer_cache.reused_layers == 1
+    assert component._layer_cache.applied_layers == 3
+    assert component.left.rendered
+
+    expected_image = create_spot_image((0, 0))
+    expected_image.putpixel((65, 0), 1)
+    assert component.render(Image.new("1", (128, 64))) == expected_image
+
+    # all layers are applied when the component's state changes
+    component.state.update({"offset": 1})
+    assert is_same_input.call_count == 1
+    assert component._layer_cache.applied_layers == 5
+
+    expected_image = create_spot_image((0, 0))
+    expected_image.putpixel((66, 0), 1)
+    assert component.render(Image.new("1", (128, 64))) == expected_image
+
+    # layers are applied when the image passed to apply_layers changes
+    component.render(create_spot_image((127, 63)))
+    assert component._layer_cache.applied_layers == 7
@@ -167,3 +167,58 @@ def test_updating_alignment(create_image, render, get_test_image_path, snapshot)
 
     component.state.update({"align": "right", "vertical_align": "bottom"})
     snapshot.assert_match(render(component), "updated_alignment.png")
+
+
+def test_shared_image_files(create_image, render, get_test_image_path, mocker):
+    from pt_miniscreen.core.components import image
+
+    image.image_file_cache.clear()
+    image.frame_cache.clear()
+    open_image = mocker.spy(image, "open_image")
+
+    # image files are only decoded once
+    first = create_image(image_path=get_test_image_path("test-1.png"))
+    second = create_image(image_path=get_test_image_path("test-1.png"))
+    assert open_image.call_count == 1
+
+    # frames are converted to 1-bit and shared
+    render(first)
+    render(second)
+    assert first.frame.mode == "1"
+    assert first.frame is second.frame
+
+    # resized frames are cached per size
+    resized = create_image(image_path=get_test_image_path("test-1.png"), resize=True)
+    render(resized)
+    assert resized.frame is not first.frame
+    assert resized.image_size == resized.size
+
+
+def test_decoded_animation(get_test_image_path):
+    from pt_miniscreen.core.components.image import (
+        get_animation_memory,
+        get_image_file,
+    )
+
+    path = get_test_image_path("test.gif")
+    image_file = get_image_file(path)
+
+    # every frame is decoded with its duration in seconds
+    assert image_file.n_frames == 2
+    assert image_file.durations == [0.5, 0.5]
+    assert image_file.duration == 1
+
+    # frames are stored as packed 1-bit data
+    frame_bytes = (image_file.size[0] + 7) // 8 * image_file.size[1]
+    assert image_file.memory == frame_bytes * 2
+    assert get_animation_memory()[path] == image_file.memory
+
+    # decoded frames match frames read from the file
+    with Image.open(path) as image:
+        for index in range(image.n_frames):
+            image.seek(index)
+            expected = image.convert("1")
+            assert image_file.get_frame(index).tobytes() == expected.tobytes()
+
+    with pytest.raises(EOFError):
+        image_file.get_frame(2)
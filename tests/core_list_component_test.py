@@ -1,6 +1,6 @@
 import gc
 from functools import partial
-from math import ceil
+from math import ceil, floor
 from time import sleep
 from weakref import ref
 
@@ -509,19 +509,19 @@ def test_scrolling_during_transition(create_list, create_rows, render, snapshot)
 
 
 def test_scrolling_animation(mocker, create_list, create_rows, render, snapshot):
-    def slow_transition(distance, duration):
-        sleep(duration / 3)
-        yield ceil(distance / 3)
-        sleep(duration / 3)
-        yield ceil(distance / 3)
-        sleep(duration / 3)
-        yield ceil(distance / 3)
-
-    mocker.patch(
-        "pt_miniscreen.core.components.list.transition", side_effect=slow_transition
-    )
+    def slow_easing(distance):
+        # move ceil(distance / 3) pixels at the end of each third of the duration
+        def easing(progress):
+            return min(floor(progress * 3) * ceil(distance / 3) / distance, 1)
+
+        return easing
+
+    # render frames often enough to show each step when it is sampled
+    mocker.patch("pt_miniscreen.core.animation.FRAME_TIME", 0.005)
 
-    component = create_list(Rows=create_rows(3), num_visible_rows=2)
+    component = create_list(
+        Rows=create_rows(3), num_visible_rows=2, transition_easing=slow_easing(32)
+    )
 
     # render component so scrolling is animated
     render(component)
@@ -545,22 +545,61 @@ def test_scrolling_animation(mocker, create_list, create_rows, render, snapshot)
     snapshot.assert_match(render(component), "scroll-up-3.png")
 
 
+def test_rows_not_rerendered_while_scrolling(create_list, render):
+    from pt_miniscreen.core import Component
+    from pt_miniscreen.core.animation import steps
+
+    class FillableRow(Component):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs, initial_state={"filled": False})
+            self.render_count = 0
+
+        def render(self, image):
+            self.render_count += 1
+            return Image.new("1", image.size, 1 if self.state["filled"] else 0)
+
+    component = create_list(
+        Rows=[FillableRow] * 3, num_visible_rows=2, transition_easing=steps(3)
+    )
+    render(component)
+    top_row = component.rows[0]
+    assert top_row.render_count == 1
+
+    # rows are composited from their cached output on each step of the scroll
+    component.scroll_down()
+    sleep(0.1)
+    render(component)
+    sleep(0.1)
+    before_update = render(component)
+    assert top_row.render_count == 1
+    assert component.cached_row_renders > 0
+
+    # rows that change during the scroll are shown with their new output
+    top_row.state.update({"filled": True})
+    assert top_row.render_count == 2
+    assert render(component) != before_update
+    sleep(0.2)
+
+
 def test_virtual_list_scrolling_animation(
     mocker, create_list, create_rows, render, snapshot
 ):
-    def slow_transition(distance, duration):
-        sleep(duration / 3)
-        yield ceil(distance / 3)
-        sleep(duration / 3)
-        yield ceil(distance / 3)
-        sleep(duration / 3)
-        yield ceil(distance / 3)
-
-    mocker.patch(
-        "pt_miniscreen.core.components.list.transition", side_effect=slow_transition
-    )
+    def slow_easing(distance):
+        # move ceil(distance / 3) pixels at the end of each third of the duration
+        def easing(progress):
+            return min(floor(progress * 3) * ceil(distance / 3) / distance, 1)
 
-    component = create_list(Rows=create_rows(3), num_visible_rows=2, virtual=True)
+        return easing
+
+    # render frames often enough to show each step when it is sampled
+    mocker.patch("pt_miniscreen.core.animation.FRAME_TIME", 0.005)
+
+    component = create_list(
+        Rows=create_rows(3),
+        num_visible_rows=2,
+        virtual=True,
+        transition_easing=slow_easing(32),
+    )
 
     # render component so scrolling is animated
     render(component)
@@ -997,3 +1036,39 @@ def test_row_cleanup_after_scrolling(create_list, create_rows, get_test_image_pa
     # rows that are scrolled out of view are cleaned up at the next garbage collection
     gc.collect()
     assert row() is None
+
+
+def test_lazy_list(create_list, create_numbered_rows, render):
+    eager = create_list(Rows=create_numbered_rows(10), num_visible_rows=2)
+    component = create_list(
+        Rows=create_numbered_rows(10), num_visible_rows=2, lazy_window=1
+    )
+
+    # only rows within the window around the visible rows are created
+    assert len(component.rows) == 10
+    assert len(component._children) == 3
+    assert set(component.row_construction_times.keys()) == {0, 1, 2}
+    assert render(component) == render(eager)
+
+    # finding invisible rows does not create rows
+    assert component.invisible_rows == [component._children[2]]
+    assert len(component._children) == 3
+
+    # rows are created when scrolled to and kept when scrolled out of view
+    row = component.visible_rows[0]
+    row.state.update({"text": "updated"})
+    for _ in range(3):
+        component.scroll_down()
+        eager.scroll_down()
+        sleep(0.3)
+        assert render(component) == render(eager)
+
+    assert len(component._children) == 6
+    component.scroll_to_top(animate=False)
+    assert component.visible_rows[0] is row
+    assert row.state["text"] == "updated"
+
+    # rows outside the window are created when accessed
+    assert component.rows[9].state["text"] == "10"
+    assert 9 in component.row_construction_times
+    assert len(component._children) == 7
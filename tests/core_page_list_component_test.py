@@ -1,5 +1,5 @@
 from functools import partial
-from math import ceil
+from math import ceil, floor
 from time import sleep
 
 import pytest
@@ -86,19 +86,19 @@ def test_row_gap(create_page_list, create_pages, CheckeredPage, render, snapshot
 
 
 def test_scrolling_animation(mocker, create_page_list, create_pages, render, snapshot):
-    def slow_transition(distance, duration):
-        sleep(duration / 3)
-        yield ceil(distance / 3)
-        sleep(duration / 3)
-        yield ceil(distance / 3)
-        sleep(duration / 3)
-        yield ceil(distance / 3)
-
-    mocker.patch(
-        "pt_miniscreen.core.components.list.transition", side_effect=slow_transition
-    )
+    def slow_easing(distance):
+        # move ceil(distance / 3) pixels at the end of each third of the duration
+        def easing(progress):
+            return min(floor(progress * 3) * ceil(distance / 3) / distance, 1)
+
+        return easing
 
-    component = create_page_list(Pages=create_pages(3))
+    # render frames often enough to show each step when it is sampled
+    mocker.patch("pt_miniscreen.core.animation.FRAME_TIME", 0.005)
+
+    component = create_page_list(
+        Pages=create_pages(3), transition_easing=slow_easing(64)
+    )
 
     # render component so scrolling is animated
     render(component)
@@ -153,3 +153,105 @@ def test_current_page_attribute(
     # returns the correct rows when scroll is finished
     sleep(0.25)
     assert isinstance(component.current_page, ImagePage)
+
+
+def test_prefetch(create_page_list, create_pages, render):
+    from pt_miniscreen.core.components import Text
+
+    created = []
+
+    class NumberedPage(Text):
+        def __init__(self, number, **kwargs):
+            super().__init__(**kwargs, text=str(number))
+            created.append(number)
+
+    component = create_page_list(
+        Pages=[partial(NumberedPage, number=i) for i in range(4)],
+        virtual=True,
+        prefetch=True,
+        prefetch_delay=0.05,
+    )
+    render(component)
+
+    # next page is created and rendered in the background
+    sleep(0.2)
+    assert created == [0, 1]
+    next_page = component._prefetched_pages[1]
+    assert next_page.mounted
+    assert not next_page.active_event.is_set()
+
+    # prefetched pages are not children until they are used
+    assert next_page not in component._children
+
+    # scrolling uses the prefetched page
+    component.scroll_down()
+    assert component.rows[-1] is next_page
+    sleep(0.5)
+    assert component.current_page is next_page
+    assert next_page in component._children
+
+    # the page scrolled away from is kept and the page after the new page is
+    # prefetched
+    assert created == [0, 1, 2]
+    assert set(component._prefetched_pages.keys()) == {0, 2}
+
+    # pages that are no longer next to the current page are cleaned up
+    first_page = component._prefetched_pages[0]
+    component.scroll_down(animate=False)
+    sleep(0.2)
+    assert first_page._get_on_rerender() is None
+    assert set(component._prefetched_pages.keys()) == {1, 3}
+    assert created == [0, 1, 2, 3]
+    assert component._children == [component.current_page]
+
+
+@pytest.fixture
+def SlowPage():
+    from pt_miniscreen.core.components import Text
+
+    # pages record every instance created and take a while to create
+    class SlowPage(Text):
+        instances = []
+
+        def __init__(self, number, **kwargs):
+            super().__init__(**kwargs, text=str(number))
+            sleep(0.2)
+            self.number = number
+            SlowPage.instances.append(self)
+
+    return SlowPage
+
+
+def test_scroll_during_prefetch(create_page_list, render, SlowPage):
+    component = create_page_list(
+        Pages=[partial(SlowPage, number=i) for i in range(3)],
+        virtual=True,
+        prefetch=True,
+        prefetch_delay=0.05,
+    )
+    render(component)
+
+    # scrolling to a page that is being prefetched waits for it rather than
+    # creating it again
+    sleep(0.1)
+    component.scroll_down()
+    assert [page.number for page in SlowPage.instances] == [0, 1]
+    assert component.rows[-1] is SlowPage.instances[1]
+
+
+def test_cleanup_during_prefetch(create_page_list, render, SlowPage):
+    component = create_page_list(
+        Pages=[partial(SlowPage, number=i) for i in range(3)],
+        virtual=True,
+        prefetch=True,
+        prefetch_delay=0.05,
+    )
+    render(component)
+
+    # pages prefetched after the list is cleaned up are cleaned up
+    sleep(0.1)
+    component._cleanup()
+    sleep(0.3)
+    assert [page.number for page in SlowPage.instances] == [0, 1]
+    assert SlowPage.instances[1]._get_on_rerender() is None
+    assert component._prefetched_pages == {}
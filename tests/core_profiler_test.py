@@ -0,0 +1,146 @@
+import signal
+from time import monotonic, sleep
+
+import pytest
+from PIL import Image
+
+from pt_miniscreen.core.profiler import profiler, setup_profiler
+
+
+def wait_until(condition, timeout=1):
+    end_time = monotonic() + timeout
+    while not condition() and monotonic() < end_time:
+        sleep(0.01)
+
+    return condition()
+
+
+@pytest.fixture
+def enabled_profiler():
+    profiler.reset()
+    profiler.enable()
+    yield profiler
+    profiler.disable()
+    profiler.reset()
+
+
+@pytest.fixture
+def Parent():
+    from pt_miniscreen.core import Component
+
+    class Spot(Component):
+        default_state = {"x": 0}
+
+        def render(self, image):
+            image.putpixel((self.state["x"], 0), 1)
+            return image
+
+    class Parent(Component):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.spot = self.create_child(Spot)
+
+        def render(self, image):
+            return self.spot.render(image)
+
+    return Parent
+
+
+def get_stats(rows, name):
+    return next(row for row in rows if row["name"] == name)
+
+
+def test_profiler_disabled(create_component, Parent):
+    profiler.reset()
+    component = create_component(Parent)
+    component.render(Image.new("1", (128, 64)))
+
+    assert profiler.class_stats() == []
+
+
+def test_profiler(create_component, Parent, enabled_profiler):
+    component = create_component(Parent)
+    component.render(Image.new("1", (128, 64)))
+    component.render(Image.new("1", (128, 64)))
+    component.spot.state.update({"x": 1})
+
+    parent_stats = get_stats(enabled_profiler.class_stats(), "Parent.<locals>.Parent")
+    assert parent_stats["renders"] == 2
+    assert parent_stats["cache_hits"] == 1
+    assert parent_stats["cache_misses"] == 1
+    assert parent_stats["cache_hit_rate"] == 0.5
+    assert parent_stats["reconciles"] == 1
+    assert parent_stats["max_time"] <= parent_stats["total_time"]
+
+    spot_stats = get_stats(enabled_profiler.class_stats(), "Parent.<locals>.Spot")
+    assert spot_stats["renders"] == 2
+    assert spot_stats["cache_misses"] == 1
+    assert spot_stats["reconciles"] == 1
+
+    # time spent rendering children is not included in self time
+    assert 0 <= parent_stats["self_time"] < parent_stats["total_time"]
+
+    instance_stats = enabled_profiler.instance_stats()
+    assert len(instance_stats) == 2
+    assert get_stats(instance_stats, f"Parent.<locals>.Parent@{id(component):x}")
+
+    table = enabled_profiler.format_table()
+    assert "Components by class" in table
+    assert "Parent.<locals>.Spot" in table
+
+
+def test_profiler_dump_file(create_component, Parent, enabled_profiler, tmp_path):
+    component = create_component(Parent)
+    component.render(Image.new("1", (128, 64)))
+
+    path = tmp_path / "profile.txt"
+    enabled_profiler.dump(path)
+    assert "Parent.<locals>.Parent" in path.read_text()
+
+
+def test_profiler_signal(mocker):
+    mocker.patch.dict("os.environ", {"PT_MINISCREEN_PROFILE": "0"})
+    dump = mocker.patch.object(profiler, "dump")
+    previous_handler = signal.getsignal(signal.SIGUSR1)
+
+    try:
+        assert setup_profiler() is None
+        assert not profiler.enabled
+
+        # first signal enables profiling, later signals dump the stats. Signals
+        # are handled by another thread so the handler never takes a lock.
+        signal.raise_signal(signal.SIGUSR1)
+        assert wait_until(lambda: profiler.enabled)
+        assert dump.call_count == 0
+
+        signal.raise_signal(signal.SIGUSR1)
+        assert wait_until(lambda: dump.call_count == 1)
+    finally:
+        signal.signal(signal.SIGUSR1, previous_handler)
+        profiler.disable()
+        profiler.reset()
+
+
+def test_profiler_env(mocker, tmp_path):
+    path = tmp_path / "profile.txt"
+    mocker.patch.dict(
+        "os.environ",
+        {
+            "PT_MINISCREEN_PROFILE": "1",
+            "PT_MINISCREEN_PROFILE_FILE": str(path),
+            "PT_MINISCREEN_PROFILE_INTERVAL": "0.05",
+        },
+    )
+    previous_handler = signal.getsignal(signal.SIGUSR1)
+
+    try:
+        stop_event = setup_profiler()
+        assert profiler.enabled
+
+        stop_event.wait(0.5)
+        assert "Components by class" in path.read_text()
+        stop_event.set()
+    finally:
+        signal.signal(signal.SIGUSR1, previous_handler)
+        profiler.disable()
+        profiler.reset()
@@ -0,0 +1,78 @@
+from PIL import Image
+
+from pt_miniscreen.core.recorder import FrameRecorder, Recording
+
+
+def create_frames(count, size=(128, 64)):
+    frames = [Image.new("1", size) for _ in range(count)]
+    for index, frame in enumerate(frames):
+        frame.putpixel((index, 0), 1)
+
+    return frames
+
+
+def test_frame_recorder(tmp_path):
+    path = tmp_path / "frames.rec"
+    recorder = FrameRecorder(path, flush_interval=0.05)
+
+    frames = create_frames(5)
+    for frame in frames:
+        recorder.record(frame)
+
+    recorder.close()
+    assert recorder.recorded_frames == 5
+    assert recorder.dropped_frames == 0
+
+    # frames are compressed below their packed size of 1 KB
+    assert recorder.written_bytes < 5 * 1024
+
+    recording = Recording(path)
+    assert len(recording) == 5
+    assert recording.size == (128, 64)
+    assert [image for _, image in recording] == frames
+    assert len(recording.intervals) == 4
+    assert all(interval >= 0 for interval in recording.intervals)
+
+
+def test_frame_recorder_appends(tmp_path):
+    path = tmp_path / "frames.rec"
+    frames = create_frames(4)
+
+    # frames are appended by the background thread as they are flushed
+    recorder = FrameRecorder(path, flush_interval=0.05)
+    recorder.record(frames[0])
+    recorder.record(frames[1])
+    recorder.flush()
+    assert len(Recording(path)) == 2
+
+    recorder.record(frames[2])
+    recorder.record(frames[3])
+    recorder.close()
+    assert [image for _, image in Recording(path)] == frames
+
+
+def test_frame_recorder_ring_buffer(tmp_path):
+    path = tmp_path / "frames.rec"
+    recorder = FrameRecorder(path, capacity=2, flush_interval=60)
+
+    # oldest frames are dropped when the buffer is full
+    frames = create_frames(3)
+    for frame in frames:
+        recorder.record(frame)
+
+    recorder.close()
+    assert recorder.dropped_frames == 1
+    assert [image for _, image in Recording(path)] == frames[1:]
+
+
+def test_recording_ignores_partial_frames(tmp_path):
+    path = tmp_path / "frames.rec"
+    recorder = FrameRecorder(path)
+    for frame in create_frames(2):
+        recorder.record(frame)
+    recorder.close()
+
+    # truncate the last frame as if writing it was interrupted
+    data = path.read_bytes()
+    path.write_bytes(data[:-3])
+    assert len(Recording(path)) == 1
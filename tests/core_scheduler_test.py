@@ -0,0 +1,172 @@
+import threading
+from time import sleep
+from unittest.mock import Mock
+
+
+def test_intervals_share_thread(parent):
+    from pt_miniscreen.core import Component
+    from pt_miniscreen.core.scheduler import Scheduler
+
+    parent._set_active(True)
+    thread_count = threading.active_count()
+
+    class Counter(Component):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs, initial_state={"count": 0})
+            self.create_interval(self.increment, 0.1)
+
+        def increment(self):
+            self.state.update({"count": self.state["count"] + 1})
+
+        def render(self, image):
+            return image
+
+    counters = [parent.create_child(Counter) for _ in range(20)]
+    for counter in counters:
+        counter._set_active(True)
+
+    sleep(0.35)
+
+    # all intervals have run
+    assert all(counter.state["count"] > 0 for counter in counters)
+
+    # at most the scheduler thread and its workers have been created to run
+    # all of them
+    assert threading.active_count() <= thread_count + 1 + Scheduler.max_workers
+
+
+def test_blocking_interval_does_not_delay_others(parent):
+    from pt_miniscreen.core import Component
+
+    class Blocking(Component):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.create_interval(self.block, 0.05)
+
+        def block(self):
+            sleep(1)
+
+        def render(self, image):
+            return image
+
+    class Counter(Component):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs, initial_state={"count": 0})
+            self.create_interval(self.increment, 0.05)
+
+        def increment(self):
+            self.state.update({"count": self.state["count"] + 1})
+
+        def render(self, image):
+            return image
+
+    blocking = parent.create_child(Blocking)
+    blocking._set_active(True)
+    sleep(0.1)
+
+    # intervals keep running while another interval is blocked
+    counter = parent.create_child(Counter)
+    counter._set_active(True)
+    sleep(0.3)
+    assert counter.state["count"] >= 3
+
+
+def test_interval_resumed_before_due(parent):
+    from pt_miniscreen.core import Component
+
+    class Polling(Component):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.on_poll = Mock()
+            self.create_interval(self.poll, 0.2)
+
+        def poll(self):
+            self.on_poll()
+
+        def render(self, image):
+            return image
+
+    component = parent.create_child(Polling)
+    component._set_active(True)
+
+    # interval waits a full interval after being paused and resumed before it
+    # is due instead of running when it was originally due
+    sleep(0.1)
+    component._set_active(False)
+    component._set_active(True)
+    sleep(0.15)
+    component.on_poll.assert_not_called()
+    sleep(0.1)
+    component.on_poll.assert_called_once()
+
+
+def test_task(parent):
+    from pt_miniscreen.core import Component
+
+    class Stepper(Component):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs, initial_state={"step": 0})
+            self.on_step = Mock()
+
+        def steps(self):
+            for step in range(1, 4):
+                yield 0.1
+                self.on_step(step)
+
+        def render(self, image):
+            return image
+
+    component = parent.create_child(Stepper)
+    component._set_active(True)
+    task = component.create_task(component.steps())
+
+    # generator is resumed after yielded time
+    sleep(0.05)
+    component.on_step.assert_not_called()
+    sleep(0.1)
+    component.on_step.assert_called_once_with(1)
+
+    # task is not resumed while component is paused
+    component._set_active(False)
+    sleep(0.2)
+    component.on_step.assert_called_once_with(1)
+
+    # task resumes as soon as the component is active
+    component._set_active(True)
+    sleep(0.02)
+    component.on_step.assert_called_with(2)
+
+    # task finishes when generator is exhausted
+    sleep(0.15)
+    component.on_step.assert_called_with(3)
+    sleep(0.15)
+    assert task.finished.is_set()
+
+
+def test_cancel_task(parent):
+    from pt_miniscreen.core import Component
+
+    class Stepper(Component):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.on_step = Mock()
+
+        def steps(self):
+            while True:
+                yield 0.05
+                self.on_step()
+
+        def render(self, image):
+            return image
+
+    component = parent.create_child(Stepper)
+    component._set_active(True)
+    task = component.create_task(component.steps())
+    sleep(0.12)
+    task.cancel()
+    call_count = component.on_step.call_count
+    assert call_count > 0
+
+    # cancelled tasks are not run again
+    sleep(0.15)
+    assert component.on_step.call_count == call_count
@@ -0,0 +1,153 @@
+import numpy as np
+from PIL import Image, ImageDraw
+
+from pt_miniscreen.core.backends import SSD1306Backend
+from pt_miniscreen.core.ssd1306 import (
+    COLUMNADDR,
+    PAGEADDR,
+    encode_pages,
+    get_changed_runs,
+)
+
+
+def encode_pages_reference(image):
+    # page layout used by luma's ssd1306 device
+    width, height = image.size
+    buffer = [0] * (width * height // 8)
+    for y in range(height):
+        for x in range(width):
+            if image.getpixel((x, y)):
+                buffer[width * (y // 8) + x] |= 1 << (y % 8)
+
+    return buffer
+
+
+class Device:
+    # emulates the SSD1306's memory in horizontal addressing mode
+    def __init__(self, size=(128, 64)):
+        self.memory = np.zeros((size[1] // 8, size[0]), dtype=np.uint8)
+        self.data_bytes = 0
+
+    def command(self, *command):
+        assert command[0] == COLUMNADDR and command[3] == PAGEADDR
+        _, self.column_start, self.column_end, _, self.page, self.page_end = command
+
+    def data(self, data):
+        self.data_bytes += len(data)
+        width = self.column_end - self.column_start + 1
+        for index, value in enumerate(data):
+            page = self.page + index // width
+            assert page <= self.page_end
+            self.memory[page, self.column_start + index % width] = value
+
+
+def create_text_frame(text, offset=0):
+    image = Image.new("1", (128, 64))
+    ImageDraw.Draw(image).text((offset, 20), text, fill=1)
+    return image
+
+
+def test_encode_pages():
+    image = create_text_frame("Hello World!")
+    image.putpixel((127, 63), 1)
+
+    pages = encode_pages(image)
+    assert pages.shape == (8, 128)
+    assert pages.ravel().tolist() == encode_pages_reference(image)
+
+
+def test_get_changed_runs():
+    previous = np.zeros((8, 128), dtype=np.uint8)
+    pages = previous.copy()
+    assert get_changed_runs(previous, pages) == []
+
+    # everything changes when there is no previous buffer
+    assert get_changed_runs(None, pages) == [(page, 0, 128) for page in range(8)]
+
+    pages[1, 10] = 1
+    pages[1, 12] = 1
+    pages[1, 100] = 1
+    pages[7, 127] = 1
+
+    # nearby changes are merged into one run
+    assert get_changed_runs(previous, pages) == [
+        (1, 10, 13),
+        (1, 100, 101),
+        (7, 127, 128),
+    ]
+
+    # every change is its own run when gaps are not merged
+    assert get_changed_runs(previous, pages, max_gap=0) == [
+        (1, 10, 11),
+        (1, 12, 13),
+        (1, 100, 101),
+        (7, 127, 128),
+    ]
+
+    # only pages and columns within the changed region are compared
+    assert get_changed_runs(previous, pages, region=(0, 8, 64, 16)) == [
+        (1, 10, 13),
+    ]
+    assert get_changed_runs(previous, pages, region=(120, 50, 128, 64)) == [
+        (7, 127, 128),
+    ]
+
+
+def test_ssd1306_backend_writes_changes():
+    device = Device()
+    backend = SSD1306Backend(device)
+
+    frames = [create_text_frame("Marquee text", -offset) for offset in range(5)]
+    for frame in frames:
+        frame.paste(1, (0, 60, 64, 62))
+    backend(frames[0])
+    assert device.data_bytes == 1024
+
+    # later frames only write the changed columns
+    for frame in frames[1:]:
+        backend(frame)
+        assert device.memory.ravel().tolist() == encode_pages_reference(frame)
+
+    assert device.data_bytes - 1024 < 4 * 1024 / 5
+
+    # a progress bar update only writes the columns that changed
+    data_bytes = device.data_bytes
+    progress = frames[-1].copy()
+    progress.paste(1, (64, 60, 66, 62))
+    backend(progress, damage=(64, 60, 66, 62))
+    assert device.data_bytes - data_bytes == 2
+    assert device.memory.ravel().tolist() == encode_pages_reference(progress)
+
+    # whole frame is written after being invalidated
+    backend.invalidate()
+    backend(progress)
+    assert device.data_bytes - data_bytes == 2 + 1024
+    assert device.memory.ravel().tolist() == encode_pages_reference(progress)
+
+
+def test_ssd1306_backend_app_displayed_frame():
+    from pt_miniscreen.core import App, Component
+
+    splash = create_text_frame("Splash")
+
+    class Root(Component):
+        def render(self, image):
+            image.paste(splash)
+            image.paste(1, (0, 60, 2, 62))
+            return image
+
+    device = Device()
+    backend = SSD1306Backend(device)
+    backend(splash)
+    assert device.data_bytes == 1024
+
+    # the first frame only writes what changed from the frame already displayed
+    app = App(display=backend, Root=Root, partial_display=True)
+    app.set_displayed_frame(splash)
+    app.start()
+    assert device.data_bytes - 1024 == 2
+    assert device.memory.ravel().tolist() == encode_pages_reference(
+        app.root.render(Image.new("1", (128, 64)))
+    )
+
+    app.stop()
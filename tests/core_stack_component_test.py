@@ -2,7 +2,7 @@ import gc
 import logging
 import sys
 from functools import partial
-from math import ceil
+from math import ceil, floor
 from time import sleep
 from weakref import ref
 
@@ -194,16 +194,19 @@ def test_transitions_during_transition(
 def test_transition_animations(
     mocker, create_stack, render, ImagePage, CheckeredPage, snapshot
 ):
-    def slow_transition(distance, duration):
-        sleep(duration / 3)
-        yield ceil(distance / 3)
-        sleep(duration / 3)
-        yield ceil(distance / 3)
-        sleep(duration / 3)
-        yield ceil(distance / 3)
+    def slow_easing(distance):
+        # move ceil(distance / 3) pixels at the end of each third of the duration
+        def easing(progress):
+            return min(floor(progress * 3) * ceil(distance / 3) / distance, 1)
+
+        return easing
+
+    # render frames often enough to show each step when it is sampled
+    mocker.patch("pt_miniscreen.core.animation.FRAME_TIME", 0.005)
 
     mocker.patch(
-        "pt_miniscreen.core.components.stack.transition", side_effect=slow_transition
+        "pt_miniscreen.core.components.stack.Stack.transition_easing",
+        staticmethod(slow_easing(128)),
     )
 
     component = create_stack()
@@ -248,6 +251,87 @@ def test_transition_animations(
     snapshot.assert_match(render(component), "pop-last-3.png")
 
 
+@pytest.fixture
+def FillablePage():
+    from pt_miniscreen.core import Component
+
+    class FillablePage(Component):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs, initial_state={"filled": False})
+
+        def render(self, image):
+            return Image.new("1", image.size, 1 if self.state["filled"] else 0)
+
+    return FillablePage
+
+
+def get_pixel(component, xy):
+    return component.render(Image.new("1", (128, 64))).getpixel(xy)
+
+
+def test_transition_snapshots(mocker, create_stack, FillablePage):
+    mocker.patch("pt_miniscreen.core.components.stack.Stack.transition_duration", 1)
+
+    component = create_stack(initial_stack=[FillablePage])
+    get_pixel(component, (0, 0))
+    background = component.stack[0]
+
+    component.push(FillablePage)
+    sleep(0.1)
+    get_pixel(component, (0, 0))
+    foreground = component.stack[-1]
+
+    # background updates are not shown during transitions
+    background.state.update({"filled": True})
+    assert not get_pixel(component, (0, 0))
+
+    # foreground updates are shown during transitions
+    foreground.state.update({"filled": True})
+    assert get_pixel(component, (127, 0))
+
+    # background is snapshot again when the next transition starts
+    sleep(1)
+    foreground.state.update({"filled": False})
+    component.pop()
+    sleep(0.1)
+    assert get_pixel(component, (0, 0))
+
+
+def test_transition_snapshots_of_foreground(mocker, create_stack, FillablePage):
+    mocker.patch("pt_miniscreen.core.components.stack.Stack.transition_duration", 1)
+    mocker.patch("pt_miniscreen.core.components.stack.Stack.snapshot_foreground", True)
+
+    component = create_stack(initial_stack=[FillablePage])
+    get_pixel(component, (0, 0))
+
+    component.push(FillablePage)
+    sleep(0.1)
+    get_pixel(component, (0, 0))
+
+    # foreground updates are not shown during transitions
+    component.stack[-1].state.update({"filled": True})
+    assert not get_pixel(component, (127, 0))
+
+
+def test_live_transitions(mocker, create_stack, FillablePage):
+    mocker.patch("pt_miniscreen.core.components.stack.Stack.transition_duration", 1)
+    mocker.patch("pt_miniscreen.core.components.stack.Stack.live_transitions", True)
+
+    component = create_stack(initial_stack=[FillablePage])
+    get_pixel(component, (0, 0))
+    background = component.stack[0]
+
+    component.push(FillablePage)
+    sleep(0.1)
+    get_pixel(component, (0, 0))
+
+    # background and foreground updates are shown during transitions
+    background.state.update({"filled": True})
+    assert get_pixel(component, (0, 0))
+    component.stack[-1].state.update({"filled": True})
+    assert get_pixel(component, (127, 0))
+
+
 def test_active_attributes(create_stack, ImagePage, CheckeredPage):
     # returns None when stack is empty
     component = create_stack()
@@ -199,3 +199,71 @@ def test_updating_alignment(create_text, render, snapshot):
 
     component.state.update({"align": "right", "vertical_align": "bottom"})
     snapshot.assert_match(render(component), "updated_alignment.png")
+
+
+def test_text_raster_cache(create_text, render):
+    from PIL import Image, ImageDraw
+
+    from pt_miniscreen.core.components.text import draw_text, text_raster_cache
+
+    text_raster_cache.clear()
+    font = ImageFont.truetype(f"{roboto_dir}/Roboto-Regular.ttf", size=14)
+    misses = text_raster_cache.misses
+
+    # text drawn from the cache matches text drawn directly
+    for text, fill, align, xy in product(
+        ["Cached text", "Cached\nmulti-line text"],
+        [1, 0],
+        ["left", "center", "right"],
+        [(0, 0), (5, 3), (-4, -2)],
+    ):
+        background = Image.new("1", (64, 32))
+        ImageDraw.Draw(background).rectangle((0, 0, 31, 31), fill=1)
+        anchor = "lt" if "\n" not in text else None
+
+        expected = background.copy()
+        ImageDraw.Draw(expected).text(
+            xy, text=text, font=font, fill=fill, spacing=0, align=align, anchor=anchor
+        )
+        image = draw_text(background.copy(), xy, text, font, fill, 0, align, anchor)
+        assert image.tobytes() == expected.tobytes()
+
+    # text is only rasterized once per alignment regardless of fill or position
+    assert text_raster_cache.misses - misses == 6
+
+    # components with the same text and font share rasterized text
+    hits = text_raster_cache.hits
+    render(create_text(text="Cached text", font=font))
+    render(create_text(text="Cached text", font=font))
+    assert text_raster_cache.hits - hits == 2
+
+
+def test_create_wrapped_text():
+    from pt_miniscreen.core.components.text import (
+        create_wrapped_text,
+        get_text_size,
+        wrapped_text_cache,
+    )
+
+    def wrap_text_word_by_word(text, font, max_width):
+        lines = []
+        for word in text.split(" "):
+            if lines and get_text_size(f"{lines[-1]} {word}", font)[0] < max_width:
+                lines[-1] = f"{lines[-1]} {word}"
+            else:
+                lines.append(word)
+
+        return "\n".join(lines)
+
+    text = "Wrapping  text measures each word once, Wrapping longer text too!"
+    for font_size, max_width in product([8, 12, 20], [1, 30, 64, 128, 500]):
+        font = ImageFont.truetype(f"{roboto_dir}/Roboto-Regular.ttf", font_size)
+        assert create_wrapped_text(text, font, max_width) == wrap_text_word_by_word(
+            text, font, max_width
+        )
+
+    # wrapped text is shared by fonts loaded from the same file
+    hits = wrapped_text_cache.hits
+    font = ImageFont.truetype(f"{roboto_dir}/Roboto-Regular.ttf", 12)
+    create_wrapped_text(text, font, 64)
+    assert wrapped_text_cache.hits == hits + 1
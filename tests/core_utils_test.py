@@ -1,7 +1,11 @@
+from os import path
+
 import pytest
 
 from pt_miniscreen.core.utils import carousel
 
+font_dir = f"{path.dirname(path.realpath(__file__))}/fonts"
+
 
 @pytest.mark.parametrize(
     "expected_iter,carousel_iter",
@@ -16,3 +20,61 @@ from pt_miniscreen.core.utils import carousel
 def test_carousel_step(expected_iter, carousel_iter):
     for expected_value, output_value in zip(expected_iter, carousel_iter):
         assert expected_value == output_value
+
+
+def test_is_same_image():
+    from PIL import Image
+
+    from pt_miniscreen.core.utils import is_same_image
+
+    image = Image.new("1", (10, 10))
+    assert is_same_image(image, image.copy())
+
+    changed = image.copy()
+    changed.putpixel((5, 5), 1)
+    assert not is_same_image(image, changed)
+
+    # images with the same data but different sizes are not the same
+    assert not is_same_image(Image.new("1", (10, 20)), Image.new("1", (20, 10)))
+
+    # comparing with something that is not an image is never the same
+    assert not is_same_image(image, None)
+
+
+def test_get_damage():
+    from PIL import Image
+
+    from pt_miniscreen.core.utils import get_damage
+
+    image = Image.new("1", (10, 10))
+
+    # whole image is damaged when there is no previous image
+    assert get_damage(None, image) == (0, 0, 10, 10)
+    assert get_damage(Image.new("1", (5, 5)), image) == (0, 0, 10, 10)
+
+    # nothing is damaged when images are the same
+    assert get_damage(image, image.copy()) is None
+
+    # damage is bounding box of changed pixels
+    changed = image.copy()
+    changed.putpixel((2, 3), 1)
+    changed.putpixel((5, 4), 1)
+    assert get_damage(image, changed) == (2, 3, 6, 5)
+
+
+def test_load_font():
+    from pt_miniscreen.core.utils import load_font, preload_fonts
+
+    font_path = f"{font_dir}/roboto/Roboto-Regular.ttf"
+
+    # fonts are only loaded once
+    assert load_font(font_path, 12) is load_font(font_path, 12)
+    assert load_font(font_path, 12) is not load_font(font_path, 14)
+
+    # fonts that cannot be found do not stop preloading
+    preload_fonts(sizes=[12]).join()
+
+    # on_finish is called once preloading has finished
+    finished = []
+    preload_fonts(sizes=[12], on_finish=lambda: finished.append(True)).join()
+    assert finished == [True]
@@ -0,0 +1,65 @@
+import os
+
+from pt_miniscreen.packages import PackageIndex
+
+STATUS = """Package: further-link
+Status: install ok installed
+Priority: optional
+Version: 1.2.3
+Description: Further link
+ continuation line with Version: 9.9.9
+
+Package: pi-topd
+Status: deinstall ok config-files
+Version: 4.0.0
+
+Package: libc6
+Status: install ok installed
+Architecture: arm64
+Version: 2.31-13
+
+Package: libc6
+Status: install ok not-installed
+Architecture: armhf
+"""
+
+
+def write_status(path, status, mtime):
+    path.write_text(status)
+    os.utime(path, ns=(mtime, mtime))
+
+
+def test_package_index(tmp_path):
+    status_path = tmp_path / "status"
+    write_status(status_path, STATUS, 1_000_000_000)
+    index = PackageIndex(status_path)
+
+    assert index.is_installed("further-link")
+    assert index.get_version("further-link") == "1.2.3"
+
+    assert not index.is_installed("pi-topd")
+    assert index.get_version("pi-topd") == "(none)"
+
+    assert index.is_installed("libc6")
+    assert index.get_version("libc6") == "2.31-13"
+
+    assert not index.is_installed("unknown")
+    assert index.get_version("unknown") == ""
+
+
+def test_package_index_reparses_changed_file(tmp_path):
+    status_path = tmp_path / "status"
+    write_status(status_path, STATUS, 1_000_000_000)
+    index = PackageIndex(status_path)
+    assert index.get_version("further-link") == "1.2.3"
+
+    # file is only parsed again when it changes
+    packages = index._get_packages()
+    assert index._get_packages() is packages
+
+    write_status(status_path, STATUS.replace("1.2.3", "1.2.4"), 2_000_000_000)
+    assert index.get_version("further-link") == "1.2.4"
+
+    status_path.unlink()
+    assert not index.is_installed("further-link")
+    assert index.get_version("further-link") == ""
@@ -0,0 +1,31 @@
+def test_timeline_marks():
+    from pt_miniscreen.timeline import Timeline
+
+    timeline = Timeline(start_time=0)
+    timeline.mark("started")
+    timeline.mark("first frame")
+
+    # marks are only recorded the first time
+    first_frame = timeline.get("first frame")
+    timeline.mark("first frame")
+    assert timeline.get("first frame") == first_frame
+    assert [name for name, _ in timeline.marks] == ["started", "first frame"]
+    assert timeline.get("unknown") is None
+
+    lines = timeline.format().splitlines()
+    assert lines[0] == "Startup timeline:"
+    assert lines[1].endswith("  started")
+    assert lines[2].endswith("  first frame")
+
+
+def test_timeline_starts_when_process_started():
+    from pt_miniscreen.timeline import Timeline, get_process_start_time
+
+    start_time = get_process_start_time()
+    timeline = Timeline()
+    timeline.mark("now")
+
+    if start_time is not None:
+        assert timeline.start_time == start_time
+
+    assert timeline.get("now") >= 0